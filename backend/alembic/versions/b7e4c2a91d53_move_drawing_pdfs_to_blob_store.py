@@ -0,0 +1,69 @@
+"""Move drawing PDFs to the blob store
+
+Revision ID: b7e4c2a91d53
+Revises: 1ae58f6fda3b
+Create Date: 2026-10-17 09:12:44.318206
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.services.blob_store import get_blob_store
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7e4c2a91d53'
+down_revision: Union[str, Sequence[str], None] = '1ae58f6fda3b'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Rows moved per round trip (each carries a whole PDF)
+BATCH_SIZE = 50
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('drawings', sa.Column('pdf_sha256', sa.String(length=64), nullable=True))
+    op.add_column('drawings', sa.Column('pdf_size', sa.Integer(), nullable=True))
+    op.add_column('drawings', sa.Column('pdf_content_type', sa.String(length=100), nullable=True))
+    op.create_index('ix_drawings_pdf_sha256', 'drawings', ['pdf_sha256'], unique=False)
+
+    # Copy inline PDFs into the blob store, then drop the bytes from the table
+    bind = op.get_bind()
+    store = get_blob_store()
+    while True:
+        rows = bind.execute(sa.text(
+            "SELECT id, pdf_blob FROM drawings "
+            "WHERE pdf_blob IS NOT NULL AND pdf_sha256 IS NULL "
+            "ORDER BY id LIMIT :limit"
+        ), {"limit": BATCH_SIZE}).fetchall()
+        if not rows:
+            break
+        for drawing_id, pdf_blob in rows:
+            pdf_bytes = bytes(pdf_blob)
+            sha256, _ = store.put(pdf_bytes)
+            bind.execute(sa.text(
+                "UPDATE drawings SET pdf_sha256 = :sha, pdf_size = :size, "
+                "pdf_content_type = 'application/pdf', pdf_blob = NULL WHERE id = :id"
+            ), {"sha": sha256, "size": len(pdf_bytes), "id": drawing_id})
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # Put the PDFs back inline (blobs stay in the store; they may be shared)
+    bind = op.get_bind()
+    store = get_blob_store()
+    rows = bind.execute(sa.text(
+        "SELECT id, pdf_sha256 FROM drawings WHERE pdf_sha256 IS NOT NULL AND pdf_blob IS NULL"
+    )).fetchall()
+    for drawing_id, sha256 in rows:
+        bind.execute(
+            sa.text("UPDATE drawings SET pdf_blob = :blob WHERE id = :id"),
+            {"blob": store.read(sha256), "id": drawing_id}
+        )
+
+    op.drop_index('ix_drawings_pdf_sha256', table_name='drawings')
+    op.drop_column('drawings', 'pdf_content_type')
+    op.drop_column('drawings', 'pdf_size')
+    op.drop_column('drawings', 'pdf_sha256')
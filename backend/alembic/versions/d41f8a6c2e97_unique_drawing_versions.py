@@ -0,0 +1,46 @@
+"""Unique drawing versions per unit
+
+Revision ID: d41f8a6c2e97
+Revises: b7e4c2a91d53
+Create Date: 2026-10-17 11:03:27.541870
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'd41f8a6c2e97'
+down_revision: Union[str, Sequence[str], None] = 'b7e4c2a91d53'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Concurrent saves could have written the same version twice: renumber
+    # those units 1..n in (version, id) order and keep only the newest current
+    bind = op.get_bind()
+    unit_ids = [row[0] for row in bind.execute(sa.text(
+        "SELECT unit_id FROM drawings GROUP BY unit_id, version HAVING COUNT(*) > 1"
+    )).fetchall()]
+    for unit_id in sorted(set(unit_ids)):
+        ids = [row[0] for row in bind.execute(sa.text(
+            "SELECT id FROM drawings WHERE unit_id = :uid ORDER BY version, id"
+        ), {"uid": unit_id}).fetchall()]
+        for version, drawing_id in enumerate(ids, start=1):
+            bind.execute(sa.text(
+                "UPDATE drawings SET version = :version, is_current = :current WHERE id = :id"
+            ), {"version": version, "current": int(version == len(ids)), "id": drawing_id})
+
+    with op.batch_alter_table('drawings') as batch_op:
+        batch_op.create_unique_constraint('uq_drawings_unit_version', ['unit_id', 'version'])
+        batch_op.create_index('ix_drawings_unit_current_version', ['unit_id', 'is_current', 'version'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('drawings') as batch_op:
+        batch_op.drop_index('ix_drawings_unit_current_version')
+        batch_op.drop_constraint('uq_drawings_unit_version', type_='unique')
@@ -150,9 +150,70 @@ class Settings:
     # ========================================================================
     
     MAX_UPLOAD_SIZE_MB = int(os.getenv("MAX_UPLOAD_SIZE_MB", "50"))
+    # Canvas snapshot uploads for /api/drawings/generate-pdf/upload
+    SNAPSHOT_MAX_UPLOAD_MB = int(os.getenv("SNAPSHOT_MAX_UPLOAD_MB", "20"))
+    # Default snapshot output profile: draft (100 dpi), standard (150 dpi) or print (300 dpi)
+    SNAPSHOT_OUTPUT_PROFILE = os.getenv("SNAPSHOT_OUTPUT_PROFILE", "standard")
     STATIC_FILES_DIR = os.getenv("STATIC_FILES_DIR", "./static")
     PDF_OUTPUT_DIR = os.getenv("PDF_OUTPUT_DIR", "./outputs")
-    
+    # Saved drawing PDFs (content-addressed by SHA-256); only "local" for now
+    BLOB_STORE_BACKEND = os.getenv("BLOB_STORE_BACKEND", "local")
+    BLOB_STORE_DIR = os.getenv("BLOB_STORE_DIR", "./data/blobs")
+
+    # ========================================================================
+    # DRAWING RENDER POOL
+    # ========================================================================
+
+    # Number of long-lived render worker processes (0 = render in-process)
+    RENDER_POOL_WORKERS = int(os.getenv(
+        "RENDER_POOL_WORKERS", str(min(4, os.cpu_count() or 1))
+    ))
+    # Seconds a single drawing may take before its worker is killed
+    RENDER_TIMEOUT_SECONDS = float(os.getenv("RENDER_TIMEOUT_SECONDS", "120"))
+    # Drawing backend: "matplotlib" or "reportlab" (direct PDF vectors, much faster)
+    DRAWING_BACKEND = os.getenv("DRAWING_BACKEND", "matplotlib")
+
+    # ========================================================================
+    # DRAWING RENDER CACHE
+    # ========================================================================
+
+    # Content-addressed PDF cache shared by all workers on this host
+    RENDER_CACHE_ENABLED = os.getenv("RENDER_CACHE_ENABLED", "true").lower() == "true"
+    RENDER_CACHE_DIR = os.getenv("RENDER_CACHE_DIR", "./cache/renders")
+    RENDER_CACHE_MAX_MB = int(os.getenv("RENDER_CACHE_MAX_MB", "500"))
+
+    # ========================================================================
+    # DECODED IMAGE CACHE
+    # ========================================================================
+
+    # In-memory cap for decoded plan-view / frame library images (per process)
+    IMAGE_CACHE_MAX_MB = int(os.getenv("IMAGE_CACHE_MAX_MB", "64"))
+    # Decode static/plan_views and frame_library at startup
+    IMAGE_CACHE_WARMUP = os.getenv("IMAGE_CACHE_WARMUP", "false").lower() == "true"
+
+    # ========================================================================
+    # HTTP CACHING
+    # ========================================================================
+
+    # Seconds browsers/CDNs may reuse frame catalog responses before revalidating (ETag)
+    CATALOG_CACHE_MAX_AGE = int(os.getenv("CATALOG_CACHE_MAX_AGE", "300"))
+    # Resized/re-encoded image variants (keyed by source content hash)
+    IMAGE_VARIANT_CACHE_DIR = os.getenv("IMAGE_VARIANT_CACHE_DIR", "./cache/images")
+    # Seconds clients may reuse an image variant requested without a matching ?v= hash
+    IMAGE_VARIANT_MAX_AGE = int(os.getenv("IMAGE_VARIANT_MAX_AGE", "3600"))
+
+    # ========================================================================
+    # BACKGROUND RENDER JOBS (CELERY)
+    # ========================================================================
+
+    # Leave CELERY_BROKER_URL empty to run jobs in-process (dev/tests, no Redis)
+    CELERY_BROKER_URL = os.getenv("CELERY_BROKER_URL", "")
+    CELERY_RESULT_BACKEND = os.getenv("CELERY_RESULT_BACKEND", CELERY_BROKER_URL)
+    # Threads for the in-process job executor
+    RENDER_JOB_WORKERS = int(os.getenv("RENDER_JOB_WORKERS", "2"))
+    # Finished in-process jobs are forgotten after this many seconds
+    RENDER_JOB_TTL_SECONDS = int(os.getenv("RENDER_JOB_TTL_SECONDS", "3600"))
+
     # ========================================================================
     # LOGGING
     # ========================================================================
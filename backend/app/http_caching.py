@@ -0,0 +1,137 @@
+"""
+HTTP Caching Helpers
+Strong ETags, conditional GET (304 Not Modified) and Cache-Control headers
+for endpoints whose data rarely changes
+
+ETags are derived from a version of the underlying data (not from the
+rendered body), so a matching If-None-Match is answered without building
+the response at all.
+"""
+import hashlib
+import json
+from typing import Any, Callable, Optional, Tuple
+
+from fastapi import Request
+from fastapi.responses import JSONResponse, Response
+
+from app.config import settings
+
+# For URLs that change whenever their content does (content-hash versioned)
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+# Same, for per-user content that shared caches must not store
+PRIVATE_IMMUTABLE_CACHE_CONTROL = "private, max-age=31536000, immutable"
+
+
+class RangeNotSatisfiable(ValueError):
+    """Range header with no satisfiable byte range (answer 416)"""
+
+
+def make_etag(*parts: Any) -> str:
+    """
+    Build a strong ETag from JSON-serializable version parts
+
+    Returns:
+        Quoted entity tag, e.g. '"3f2a9c..."'
+    """
+    payload = json.dumps(parts, sort_keys=True, separators=(',', ':'), default=str)
+    return '"' + hashlib.sha256(payload.encode('utf-8')).hexdigest()[:32] + '"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    Whether an If-None-Match header matches etag (weak comparison, RFC 9110)
+
+    Args:
+        if_none_match: Raw header value ('*' or comma-separated entity tags)
+        etag: Current quoted entity tag
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == '*':
+        return True
+
+    opaque = etag[2:] if etag.startswith('W/') else etag
+    for candidate in if_none_match.split(','):
+        candidate = candidate.strip()
+        if candidate.startswith('W/'):
+            candidate = candidate[2:]
+        if candidate == opaque:
+            return True
+    return False
+
+
+def parse_range(range_header: Optional[str], size: int) -> Optional[Tuple[int, int]]:
+    """
+    Parse a single-range Range header (RFC 9110 byte ranges)
+    
+    Args:
+        range_header: Raw header value, e.g. 'bytes=0-1023', 'bytes=500-', 'bytes=-500'
+        size: Full representation size in bytes
+    
+    Returns:
+        Inclusive (start, end) byte offsets, or None to send the full content
+        (no header, other units, malformed or multiple ranges)
+    
+    Raises:
+        RangeNotSatisfiable: The range starts beyond the end of the content
+    """
+    if not range_header:
+        return None
+    unit, _, ranges = range_header.partition('=')
+    if unit.strip().lower() != 'bytes' or ',' in ranges:
+        return None
+    
+    first, sep, last = ranges.strip().partition('-')
+    if not sep:
+        return None
+    try:
+        first = int(first) if first else None
+        last = int(last) if last else None
+    except ValueError:
+        return None
+    
+    if first is None:
+        # Suffix range: the last N bytes
+        if not last or not size:
+            raise RangeNotSatisfiable(range_header)
+        return max(0, size - last), size - 1
+    if last is not None and last < first:
+        return None
+    if first >= size:
+        raise RangeNotSatisfiable(range_header)
+    return first, size - 1 if last is None else min(last, size - 1)
+
+
+def cache_control(max_age: int, public: bool = True) -> str:
+    """Cache-Control value allowing reuse for max_age, then revalidation"""
+    scope = 'public' if public else 'private'
+    return f"{scope}, max-age={max_age}, stale-while-revalidate={max_age * 10}"
+
+
+def cached_json_response(
+    request: Request,
+    etag: str,
+    build: Callable[[], Any],
+    max_age: Optional[int] = None,
+    public: bool = True
+) -> Response:
+    """
+    JSON response with ETag/Cache-Control, or 304 if the client copy is current
+
+    Args:
+        request: Incoming request (If-None-Match is read from it)
+        etag: Current entity tag of the resource (see make_etag)
+        build: Callable returning the JSON payload (only called on a miss)
+        max_age: Seconds clients may reuse the response (default CATALOG_CACHE_MAX_AGE)
+        public: Allow shared caches (CDN/proxies) to store the response
+
+    Returns:
+        304 Response or JSONResponse
+    """
+    if max_age is None:
+        max_age = settings.CATALOG_CACHE_MAX_AGE
+    headers = {"ETag": etag, "Cache-Control": cache_control(max_age, public)}
+
+    if etag_matches(request.headers.get('if-none-match'), etag):
+        return Response(status_code=304, headers=headers)
+    return JSONResponse(content=build(), headers=headers)
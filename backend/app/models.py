@@ -1,6 +1,6 @@
-from sqlalchemy import Column, Integer, String, DECIMAL, DateTime, ForeignKey, Text, LargeBinary
+from sqlalchemy import Column, Integer, String, DECIMAL, DateTime, ForeignKey, Text, LargeBinary, Index, UniqueConstraint
 from sqlalchemy.sql import func
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import deferred, relationship
 from datetime import datetime
 from .database import Base
 
@@ -107,6 +107,12 @@ class Unit(Base):
 
 class Drawing(Base):
     __tablename__ = "drawings"
+    __table_args__ = (
+        # One row per version; concurrent saves that pick the same number conflict here
+        UniqueConstraint("unit_id", "version", name="uq_drawings_unit_version"),
+        # Current-drawing lookups and MAX(version) per unit
+        Index("ix_drawings_unit_current_version", "unit_id", "is_current", "version"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     unit_id = Column(Integer, ForeignKey("units.id"), nullable=False)
@@ -114,8 +120,13 @@ class Drawing(Base):
     
     # Drawing metadata
     pdf_filename = Column(String(255))
-    pdf_blob = Column(LargeBinary)  # Store PDF binary data
-    thumbnail_blob = Column(LargeBinary, nullable=True)  # Optional preview
+    # Binary columns are deferred: loaded only when the attribute is accessed,
+    # so listing drawings (or cascading through project/unit.drawings) never reads PDF bytes
+    pdf_blob = deferred(Column(LargeBinary), group="blobs")  # Legacy inline PDF (new saves go to the blob store)
+    pdf_sha256 = Column(String(64), index=True, nullable=True)  # Blob store key
+    pdf_size = Column(Integer, nullable=True)
+    pdf_content_type = Column(String(100), nullable=True)
+    thumbnail_blob = deferred(Column(LargeBinary, nullable=True), group="blobs")  # Optional preview
     
     # Drawing specifications (snapshot of parameters at generation time)
     series = Column(String(50))
@@ -0,0 +1,188 @@
+"""
+Blob Store
+Content-addressed storage for saved drawing PDFs, so the drawings table
+holds only a SHA-256, size and content type instead of the bytes
+
+Blobs are keyed by the SHA-256 of their content: storing the same PDF
+twice keeps one copy, and a client can ask whether the server already
+has a hash before uploading it. Stored blobs are immutable.
+
+Backends implement BlobStore; LocalBlobStore keeps blobs on the local
+filesystem sharded by hash prefix (ab/cd/abcd...), written atomically
+(temp file + rename) so concurrent writers of the same blob are safe.
+"""
+
+import hashlib
+import os
+import re
+import tempfile
+import threading
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import BinaryIO, Dict, Optional, Tuple
+
+from app.config import settings
+
+SHA256_PATTERN = re.compile(r'^[0-9a-f]{64}$')
+
+
+def blob_sha256(data: bytes) -> str:
+    """Hex SHA-256 of blob content (the blob's key)"""
+    return hashlib.sha256(data).hexdigest()
+
+
+def validate_sha256(sha256: str) -> str:
+    """
+    Normalize a blob key
+
+    Raises:
+        ValueError: Not a 64-character hex SHA-256
+    """
+    sha256 = (sha256 or '').strip().lower()
+    if not SHA256_PATTERN.match(sha256):
+        raise ValueError(f"Invalid SHA-256 '{sha256}'")
+    return sha256
+
+
+class BlobStore(ABC):
+    """
+    Content-addressed blob storage backend
+
+    Subclasses implement _write, exists, size and open; put() hashes and
+    deduplicates for all of them.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.stores = 0
+        self.dedup_hits = 0
+
+    def put(self, data: bytes) -> Tuple[str, bool]:
+        """
+        Store a blob unless one with the same content already exists
+
+        Returns:
+            Tuple of (sha256, stored) - stored is False for a deduplicated blob
+        """
+        sha256 = blob_sha256(data)
+        if self.exists(sha256):
+            with self._lock:
+                self.dedup_hits += 1
+            return sha256, False
+
+        self._write(sha256, data)
+        with self._lock:
+            self.stores += 1
+        return sha256, True
+
+    def read(self, sha256: str) -> bytes:
+        """Whole blob content (FileNotFoundError if missing)"""
+        with self.open(sha256) as f:
+            return f.read()
+
+    @abstractmethod
+    def _write(self, sha256: str, data: bytes) -> None:
+        """Persist a blob that is not stored yet"""
+
+    @abstractmethod
+    def exists(self, sha256: str) -> bool:
+        """Whether a blob with this hash is stored"""
+
+    @abstractmethod
+    def size(self, sha256: str) -> Optional[int]:
+        """Blob size in bytes, or None if missing"""
+
+    @abstractmethod
+    def open(self, sha256: str) -> BinaryIO:
+        """Open a blob for reading (FileNotFoundError if missing)"""
+
+    def stats(self) -> Dict:
+        """Per-process counters"""
+        with self._lock:
+            return {'stores': self.stores, 'dedup_hits': self.dedup_hits}
+
+
+class LocalBlobStore(BlobStore):
+    """
+    Blob store on the local filesystem
+
+    Usage:
+        store = LocalBlobStore('./data/blobs')
+        sha256, stored = store.put(pdf_bytes)
+        with store.open(sha256) as f:
+            ...
+    """
+
+    def __init__(self, root: str):
+        """
+        Initialize local blob store
+
+        Args:
+            root: Directory holding the sharded blobs
+        """
+        super().__init__()
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+
+    def path(self, sha256: str) -> Path:
+        """File path of a blob (ab/cd/abcd... under root)"""
+        sha256 = validate_sha256(sha256)
+        return self.root / sha256[:2] / sha256[2:4] / sha256
+
+    def _write(self, sha256: str, data: bytes) -> None:
+        path = self.path(sha256)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    def exists(self, sha256: str) -> bool:
+        return self.path(sha256).is_file()
+
+    def size(self, sha256: str) -> Optional[int]:
+        try:
+            return self.path(sha256).stat().st_size
+        except FileNotFoundError:
+            return None
+
+    def open(self, sha256: str) -> BinaryIO:
+        return open(self.path(sha256), 'rb')
+
+    def stats(self) -> Dict:
+        stats = super().stats()
+        stats.update({'backend': 'local', 'root': str(self.root)})
+        return stats
+
+
+# BLOB_STORE_BACKEND value -> factory taking BLOB_STORE_DIR
+BLOB_STORE_BACKENDS = {
+    'local': LocalBlobStore,
+}
+
+# Global store instance
+_blob_store: Optional[BlobStore] = None
+_blob_store_lock = threading.Lock()
+
+
+def get_blob_store() -> BlobStore:
+    """Get or create the process-wide blob store (BLOB_STORE_BACKEND)"""
+    global _blob_store
+
+    if _blob_store is None:
+        with _blob_store_lock:
+            if _blob_store is None:
+                backend = BLOB_STORE_BACKENDS.get(settings.BLOB_STORE_BACKEND)
+                if backend is None:
+                    raise ValueError(
+                        f"Unknown BLOB_STORE_BACKEND '{settings.BLOB_STORE_BACKEND}' "
+                        f"(expected one of {list(BLOB_STORE_BACKENDS)})"
+                    )
+                _blob_store = backend(settings.BLOB_STORE_DIR)
+
+    return _blob_store
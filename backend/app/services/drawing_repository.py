@@ -0,0 +1,141 @@
+"""
+Drawing Repository
+Metadata-only queries for saved drawing versions, and atomic creation
+of new versions
+
+Drawing.pdf_blob and thumbnail_blob are deferred on the model; these
+helpers additionally restrict the SELECT to the metadata columns, so
+version lists and current-drawing lookups never read PDF bytes however
+many versions a unit has. Blob bytes are read only by read_legacy_pdf
+(rows saved before the blob store).
+
+create_drawing_version locks the unit row (SELECT ... FOR UPDATE), so
+saves of the same unit run one after another, and numbers the version
+inside the INSERT itself (MAX(version) + 1). Without the lock a save
+waiting on another's is_current UPDATE would, under READ COMMITTED, not
+see the row that save inserted and leave two current rows. The unique
+(unit_id, version) constraint stays as a backstop; an IntegrityError
+is retried.
+"""
+
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import String, cast, func, insert, literal, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session, load_only
+
+from app.models import Drawing, Unit
+
+# Attempts for a save that keeps losing the version-number race to concurrent saves
+SAVE_VERSION_ATTEMPTS = 5
+
+# Columns returned by the listing helpers (everything except the binary columns)
+DRAWING_METADATA_COLUMNS = (
+    Drawing.id,
+    Drawing.unit_id,
+    Drawing.project_id,
+    Drawing.pdf_filename,
+    Drawing.pdf_sha256,
+    Drawing.pdf_size,
+    Drawing.pdf_content_type,
+    Drawing.version,
+    Drawing.is_current,
+    Drawing.created_at,
+)
+
+
+def _metadata_query(db: Session):
+    return db.query(Drawing).options(load_only(*DRAWING_METADATA_COLUMNS))
+
+
+def list_drawing_versions(db: Session, unit_id: int) -> List[Drawing]:
+    """All saved versions of a unit's drawing, newest first"""
+    return (
+        _metadata_query(db)
+        .filter(Drawing.unit_id == unit_id)
+        .order_by(Drawing.version.desc())
+        .all()
+    )
+
+
+def get_current_drawing(db: Session, unit_id: int) -> Optional[Drawing]:
+    """Latest current version of a unit's drawing, or None"""
+    return (
+        _metadata_query(db)
+        .filter(Drawing.unit_id == unit_id, Drawing.is_current == 1)
+        .order_by(Drawing.version.desc())
+        .first()
+    )
+
+
+def get_drawing_metadata(db: Session, drawing_id: int) -> Optional[Drawing]:
+    """A single drawing's metadata (blob hash, size, content type, filename), or None"""
+    return _metadata_query(db).filter(Drawing.id == drawing_id).first()
+
+
+def read_legacy_pdf(db: Session, drawing_id: int) -> Optional[bytes]:
+    """Inline pdf_blob of a row not yet moved to the blob store, or None"""
+    pdf_blob = db.query(Drawing.pdf_blob).filter(Drawing.id == drawing_id).scalar()
+    return bytes(pdf_blob) if pdf_blob is not None else None
+
+
+def create_drawing_version(
+    db: Session,
+    unit_id: int,
+    pdf_filename_template: str,
+    values: Dict
+) -> Tuple[int, int]:
+    """
+    Insert the next drawing version of a unit and make it the current one
+    
+    One transaction: lock the unit row, clear is_current on the unit's
+    current row, then INSERT ... RETURNING with the version computed as
+    MAX(version) + 1 in the same statement. (SQLite has no row locks and
+    ignores FOR UPDATE; it serializes writers on the database lock.)
+    
+    Args:
+        db: Session (committed on success, rolled back on failure)
+        unit_id: Unit the drawing belongs to
+        pdf_filename_template: File name with a '{version}' placeholder
+        values: Other Drawing column values (project_id, pdf_sha256, ...)
+    
+    Returns:
+        Tuple of (drawing_id, version)
+    
+    Raises:
+        IntegrityError: Still conflicting after SAVE_VERSION_ATTEMPTS tries
+    """
+    next_version = (
+        select(func.coalesce(func.max(Drawing.version), 0) + 1)
+        .where(Drawing.unit_id == unit_id)
+        .scalar_subquery()
+    )
+    prefix, _, suffix = pdf_filename_template.partition('{version}')
+    pdf_filename = literal(prefix) + cast(next_version, String) + literal(suffix)
+    
+    for attempt in range(1, SAVE_VERSION_ATTEMPTS + 1):
+        try:
+            # Concurrent saves of this unit wait here until this one commits
+            db.execute(select(Unit.id).where(Unit.id == unit_id).with_for_update())
+            db.execute(
+                update(Drawing)
+                .where(Drawing.unit_id == unit_id, Drawing.is_current == 1)
+                .values(is_current=0)
+            )
+            drawing_id, version = db.execute(
+                insert(Drawing)
+                .values(
+                    unit_id=unit_id,
+                    version=next_version,
+                    is_current=1,
+                    pdf_filename=pdf_filename,
+                    **values
+                )
+                .returning(Drawing.id, Drawing.version)
+            ).one()
+            db.commit()
+            return drawing_id, version
+        except IntegrityError:
+            db.rollback()
+            if attempt == SAVE_VERSION_ATTEMPTS:
+                raise
@@ -0,0 +1,258 @@
+"""
+Image Variants
+Resized, re-encoded copies of the static frame/icon images, generated on
+first request and kept in a disk cache
+
+Variants are keyed by the SHA-256 of the source file's content plus the
+output width and format, so the same picture stored under several
+directories (assets/frames, static/frames, frame_library) is encoded and
+stored once. Source hashes are memoized per (path, size, mtime), so a
+cached variant is served with a single stat of its source.
+"""
+
+import hashlib
+import io
+import os
+import tempfile
+import threading
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+from PIL import Image
+
+from app.config import settings
+
+# Backend directory (mount roots are relative to it)
+BACKEND_DIR = Path(__file__).resolve().parent.parent.parent
+
+# URL mount name -> directory served through the variant pipeline
+IMAGE_MOUNTS = {
+    'frame-library': BACKEND_DIR / 'frame_library',
+    'static': BACKEND_DIR / 'static',
+    'assets': BACKEND_DIR / 'assets',
+}
+
+SOURCE_EXTENSIONS = ('.png', '.jpg', '.jpeg', '.webp')
+
+# Requested widths are rounded up to one of these (bounds the cache size)
+VARIANT_WIDTHS = (64, 128, 256, 512, 1024, 2048)
+
+# Output format -> (media type, file extension)
+FORMATS = {
+    'webp': ('image/webp', 'webp'),
+    'png': ('image/png', 'png'),
+}
+
+WEBP_QUALITY = 85
+PNG_COLORS = 256
+
+# Bump when encoding settings change so cached variants are regenerated
+ENCODER_VERSION = 1
+
+# Length of the source hash used as the `v` version parameter
+VERSION_LENGTH = 16
+
+
+def snap_width(width: Optional[int]) -> Optional[int]:
+    """Round a requested width up to the nearest VARIANT_WIDTHS entry (None = original)"""
+    if not width or width <= 0:
+        return None
+    for allowed in VARIANT_WIDTHS:
+        if width <= allowed:
+            return allowed
+    return VARIANT_WIDTHS[-1]
+
+
+def negotiate_format(accept: Optional[str]) -> str:
+    """Pick WebP when the client accepts it, PNG otherwise"""
+    for part in (accept or '').split(','):
+        media_type, *params = [token.strip() for token in part.split(';')]
+        if media_type.lower() != 'image/webp':
+            continue
+        quality = 1.0
+        for param in params:
+            name, _, value = param.partition('=')
+            if name.strip().lower() == 'q':
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        return 'webp' if quality > 0 else 'png'
+    return 'png'
+
+
+def encode_variant(source: Path, width: Optional[int], fmt: str) -> bytes:
+    """
+    Decode, downscale (never upscale) and re-encode an image
+
+    Args:
+        source: Source image path
+        width: Target width in pixels (None keeps the original size)
+        fmt: 'webp' or 'png'
+
+    Returns:
+        Encoded image bytes
+    """
+    with Image.open(source) as image:
+        has_alpha = image.mode in ('RGBA', 'LA', 'PA') or 'transparency' in image.info
+        image = image.convert('RGBA' if has_alpha else 'RGB')
+        if width is not None and image.width > width:
+            height = max(1, round(image.height * width / image.width))
+            image = image.resize((width, height), Image.LANCZOS)
+
+        buffer = io.BytesIO()
+        if fmt == 'webp':
+            image.save(buffer, format='WEBP', quality=WEBP_QUALITY, method=6)
+        else:
+            # 256-colour palette: the line drawings have few colours, ~4-5x smaller than RGBA
+            image = image.quantize(PNG_COLORS, method=Image.Quantize.FASTOCTREE)
+            image.save(buffer, format='PNG', optimize=True)
+        data = buffer.getvalue()
+
+    # Never serve a full-size variant bigger than the file it came from
+    if width is None and source.suffix.lower() == f'.{FORMATS[fmt][1]}':
+        original_size = source.stat().st_size
+        if original_size <= len(data):
+            return source.read_bytes()
+    return data
+
+
+class ImageVariantService:
+    """
+    Disk-cached image variant generator
+
+    Usage:
+        service = ImageVariantService('./cache/images')
+        source = service.resolve('frame-library', 'Series_86_a.PNG')
+        path, media_type, version = service.get_variant(source, width=256, fmt='webp')
+    """
+
+    def __init__(self, cache_dir: str, mounts: Dict[str, Path] = None):
+        """
+        Initialize variant service
+
+        Args:
+            cache_dir: Directory for generated variants
+            mounts: URL mount name -> source directory (default IMAGE_MOUNTS)
+        """
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.mounts = {name: Path(path).resolve() for name, path in (mounts or IMAGE_MOUNTS).items()}
+
+        self._hashes: Dict[str, Tuple[int, int, str]] = {}
+        self._lock = threading.Lock()
+        self.generated = 0
+        self.hits = 0
+
+    def resolve(self, mount: str, relative_path: str) -> Path:
+        """
+        Map a mount + relative path to a source image
+
+        Raises:
+            ValueError: Unknown mount, path escaping the mount, or not an image
+            FileNotFoundError: Image doesn't exist
+        """
+        root = self.mounts.get(mount)
+        if root is None:
+            raise ValueError(f"Unknown image mount '{mount}'")
+
+        source = (root / relative_path).resolve()
+        if root not in source.parents:
+            raise ValueError(f"Invalid image path '{relative_path}'")
+        if source.suffix.lower() not in SOURCE_EXTENSIONS:
+            raise ValueError(f"Unsupported image type '{source.suffix}'")
+        if not source.is_file():
+            raise FileNotFoundError(f"Image not found: {mount}/{relative_path}")
+        return source
+
+    def source_hash(self, source: Path) -> str:
+        """SHA-256 of a source file's content (memoized per size + mtime)"""
+        stat = source.stat()
+        key = str(source)
+        with self._lock:
+            cached = self._hashes.get(key)
+        if cached is not None and cached[:2] == (stat.st_size, stat.st_mtime_ns):
+            return cached[2]
+
+        digest = hashlib.sha256()
+        with open(source, 'rb') as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b''):
+                digest.update(chunk)
+        content_hash = digest.hexdigest()
+
+        with self._lock:
+            self._hashes[key] = (stat.st_size, stat.st_mtime_ns, content_hash)
+        return content_hash
+
+    def version(self, source: Path) -> str:
+        """Short content version for `?v=` cache-busting URLs"""
+        return self.source_hash(source)[:VERSION_LENGTH]
+
+    def _variant_path(self, content_hash: str, width: Optional[int], fmt: str) -> Path:
+        size = f"w{width}" if width else "orig"
+        return self.cache_dir / content_hash[:2] / f"{content_hash}-{size}-e{ENCODER_VERSION}.{FORMATS[fmt][1]}"
+
+    def get_variant(self, source: Path, width: Optional[int] = None, fmt: str = 'png') -> Tuple[Path, str, str]:
+        """
+        Get (generating on first use) a variant of a source image
+
+        Args:
+            source: Resolved source path (see resolve)
+            width: Requested width in pixels (rounded up to VARIANT_WIDTHS)
+            fmt: 'webp' or 'png'
+
+        Returns:
+            Tuple of (variant_path, media_type, version)
+        """
+        if fmt not in FORMATS:
+            raise ValueError(f"Unsupported image format '{fmt}'")
+
+        content_hash = self.source_hash(source)
+        path = self._variant_path(content_hash, snap_width(width), fmt)
+
+        if path.exists():
+            with self._lock:
+                self.hits += 1
+        else:
+            data = encode_variant(source, snap_width(width), fmt)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # Atomic publish: concurrent requests for the same variant write identical bytes
+            fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    f.write(data)
+                os.replace(tmp_path, path)
+            except BaseException:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+                raise
+            with self._lock:
+                self.generated += 1
+
+        return path, FORMATS[fmt][0], content_hash[:VERSION_LENGTH]
+
+    def stats(self) -> Dict:
+        """Variant counters and disk usage"""
+        files = [p for p in self.cache_dir.rglob('*') if p.is_file() and p.suffix != '.tmp']
+        with self._lock:
+            return {
+                'variants': len(files),
+                'size_bytes': sum(p.stat().st_size for p in files),
+                'generated': self.generated,
+                'hits': self.hits,
+                'cache_dir': str(self.cache_dir),
+            }
+
+
+# Global service instance
+_variant_service: Optional[ImageVariantService] = None
+
+
+def get_image_variant_service() -> ImageVariantService:
+    """Get or create the global image variant service"""
+    global _variant_service
+
+    if _variant_service is None:
+        _variant_service = ImageVariantService(settings.IMAGE_VARIANT_CACHE_DIR)
+
+    return _variant_service
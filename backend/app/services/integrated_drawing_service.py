@@ -4,13 +4,17 @@ Wrapper around ProfessionalDrawingGenerator with database integration
 """
 
 import os
-from typing import Dict, Optional, List, Tuple
+import shutil
+import time
+from typing import Callable, Dict, Iterator, Optional, List, Tuple
 from pathlib import Path
 from datetime import datetime
 
-from services.drawing_engine import ProfessionalDrawingGenerator
+from services.drawing_engine import ProfessionalDrawingGenerator, RenderPool, RenderJob, RenderResult
 from app.services.data_transformer import DataTransformer
+from app.services.render_cache import RenderCache, get_render_cache
 from app.models import Window, Door, Project
+from app.config import settings
 
 
 class IntegratedDrawingService:
@@ -20,21 +24,158 @@ class IntegratedDrawingService:
     - Database models
     - Data transformation
     - File management
+    - Parallel project rendering (render worker pool)
+    - Content-addressed render cache (unchanged items are not re-rendered)
     """
     
-    def __init__(self, output_dir: str = "./drawings"):
+    def __init__(
+        self,
+        output_dir: str = "./drawings",
+        render_workers: int = None,
+        render_timeout: float = None,
+        backend: str = None,
+        use_render_cache: bool = True
+    ):
         """
         Initialize the drawing service
         
         Args:
             output_dir: Directory to save generated PDFs
+            render_workers: Worker processes for project rendering
+                (default: settings.RENDER_POOL_WORKERS, 0 = in-process)
+            render_timeout: Per-drawing timeout in seconds
+                (default: settings.RENDER_TIMEOUT_SECONDS)
+            backend: Drawing backend, 'matplotlib' or 'reportlab'
+                (default: settings.DRAWING_BACKEND)
+            use_render_cache: Serve unchanged drawings from the shared render
+                cache (also requires settings.RENDER_CACHE_ENABLED)
         """
         self.output_dir = output_dir
-        self.generator = ProfessionalDrawingGenerator(output_dir)
+        backend = backend or settings.DRAWING_BACKEND
+        self.generator = ProfessionalDrawingGenerator(output_dir, backend=backend)
+        self.render_pool = RenderPool(
+            output_dir,
+            workers=settings.RENDER_POOL_WORKERS if render_workers is None else render_workers,
+            timeout=settings.RENDER_TIMEOUT_SECONDS if render_timeout is None else render_timeout,
+            backend=backend
+        )
+        self.render_cache: Optional[RenderCache] = get_render_cache() if use_render_cache else None
         
         # Create output directory if it doesn't exist
         Path(output_dir).mkdir(parents=True, exist_ok=True)
     
+    @staticmethod
+    def _project_metadata(project: Optional[Project]) -> Dict:
+        """Project metadata for drawings, with placeholders when no project"""
+        return DataTransformer.project_to_metadata(project) if project else {
+            'po_number': 'UNKNOWN',
+            'project_name': 'Project',
+            'customer_name': 'Customer'
+        }
+    
+    def _window_job(self, window: Window, project: Project = None, filename: str = None) -> RenderJob:
+        """Build the render job for a Window model"""
+        window_data = DataTransformer.window_to_drawing_data(window, project)
+        project_data = self._project_metadata(project)
+        
+        # Generate filename if not provided
+        if filename is None:
+            po = project_data['po_number'].replace(' ', '-')[:15]
+            item = window_data['item_number']
+            filename = f"{po}_Window-{item}_ELEV.pdf"
+        
+        return RenderJob(window_data, project_data, filename, is_door=False)
+    
+    def _door_job(self, door: Door, project: Project = None, filename: str = None) -> RenderJob:
+        """Build the render job for a Door model"""
+        door_data = DataTransformer.door_to_drawing_data(door, project)
+        project_data = self._project_metadata(project)
+        
+        # Generate filename if not provided
+        if filename is None:
+            po = project_data['po_number'].replace(' ', '-')[:15]
+            item = door_data['item_number']
+            filename = f"{po}_Door-{item}_ELEV.pdf"
+        
+        return RenderJob(door_data, project_data, filename, is_door=True)
+    
+    def _cache_key(self, job: RenderJob) -> str:
+        return self.render_cache.make_key(
+            job.item_data, job.project_data, job.is_door, backend=self.generator.backend
+        )
+    
+    def _render_single(self, job: RenderJob) -> str:
+        """Render one job in-process, going through the render cache"""
+        output_path = os.path.join(self.output_dir, job.output_filename)
+        
+        key = None
+        if self.render_cache is not None:
+            key = self._cache_key(job)
+            if self.render_cache.get(key, output_path):
+                return output_path
+        
+        # Generate drawing
+        if job.is_door:
+            pdf_path = self.generator.generate_door_drawing(
+                job.item_data, job.project_data, job.output_filename
+            )
+        else:
+            pdf_path = self.generator.generate_window_drawing(
+                job.item_data, job.project_data, job.output_filename
+            )
+        
+        if key is not None:
+            self.render_cache.put(key, pdf_path)
+        
+        return pdf_path
+    
+    def _iter_render_jobs(self, jobs: List[RenderJob]) -> Iterator[RenderResult]:
+        """
+        Render jobs on the pool, serving cache hits and rendering each
+        distinct cache key only once per batch
+        
+        Yields:
+            RenderResult as each job is final (cache hits first), with
+            RenderResult.index the position in jobs
+        """
+        if self.render_cache is None:
+            yield from self.render_pool.imap_unordered(jobs)
+            return
+        
+        pending: Dict[str, List[int]] = {}
+        
+        for index, job in enumerate(jobs):
+            start = time.perf_counter()
+            key = self._cache_key(job)
+            output_path = os.path.join(self.output_dir, job.output_filename)
+            if key not in pending and self.render_cache.get(key, output_path):
+                yield RenderResult(
+                    index, job, output_path, duration=time.perf_counter() - start, cached=True
+                )
+            else:
+                pending.setdefault(key, []).append(index)
+        
+        keys = list(pending)
+        
+        for render in self.render_pool.imap_unordered([jobs[pending[key][0]] for key in keys]):
+            key = keys[render.index]
+            first, *duplicates = pending[key]
+            if render.ok:
+                self.render_cache.put(key, render.path)
+            yield RenderResult(first, render.job, render.path, render.error, render.duration)
+            
+            # Identical items in the same batch: copy the one render
+            for index in duplicates:
+                job = jobs[index]
+                if render.ok:
+                    output_path = os.path.join(self.output_dir, job.output_filename)
+                    # Same item listed twice renders to the same file name: nothing to copy
+                    if os.path.abspath(render.path) != os.path.abspath(output_path):
+                        shutil.copyfile(render.path, output_path)
+                    yield RenderResult(index, job, output_path, cached=True)
+                else:
+                    yield RenderResult(index, job, error=render.error)
+    
     def generate_window_from_model(
         self,
         window: Window,
@@ -52,28 +193,8 @@ class IntegratedDrawingService:
         Returns:
             Path to generated PDF file
         """
-        # Transform data
-        window_data = DataTransformer.window_to_drawing_data(window, project)
-        project_data = DataTransformer.project_to_metadata(project) if project else {
-            'po_number': 'UNKNOWN',
-            'project_name': 'Project',
-            'customer_name': 'Customer'
-        }
-        
-        # Generate filename if not provided
-        if filename is None:
-            po = project_data['po_number'].replace(' ', '-')[:15]
-            item = window_data['item_number']
-            filename = f"{po}_Window-{item}_ELEV.pdf"
-        
-        # Generate drawing
-        pdf_path = self.generator.generate_window_drawing(
-            window_data,
-            project_data,
-            filename
-        )
-        
-        return pdf_path
+        job = self._window_job(window, project, filename)
+        return self._render_single(job)
     
     def generate_door_from_model(
         self,
@@ -92,68 +213,216 @@ class IntegratedDrawingService:
         Returns:
             Path to generated PDF file
         """
-        # Transform data
-        door_data = DataTransformer.door_to_drawing_data(door, project)
-        project_data = DataTransformer.project_to_metadata(project) if project else {
-            'po_number': 'UNKNOWN',
-            'project_name': 'Project',
-            'customer_name': 'Customer'
+        job = self._door_job(door, project, filename)
+        return self._render_single(job)
+    
+    def iter_project_drawings(
+        self,
+        project: Project,
+        windows: List[Window] = None,
+        doors: List[Door] = None
+    ) -> Iterator[Dict]:
+        """
+        Generate all drawings for a project, yielding an event per item
+        
+        Items are rendered in parallel on the render worker pool; unchanged
+        items are copied from the render cache instead. A failing item only
+        produces an error event and does not stop the rest of the batch.
+        
+        Args:
+            project: Project model instance
+            windows: List of Window models (if None, uses project.windows)
+            doors: List of Door models (if None, uses project.doors)
+            
+        Yields:
+            {'event': 'start', 'po_number', 'total'}, then one
+            {'event': 'item', 'index', 'item_number', 'type', 'file', 'path',
+            'duration', 'cached', 'error', 'done', 'total'} per item in
+            completion order, then {'event': 'summary', ...} with counts
+        """
+        batch_start = time.perf_counter()
+        
+        # Use provided lists or get from project
+        windows = windows or (project.windows if hasattr(project, 'windows') else [])
+        doors = doors or (project.doors if hasattr(project, 'doors') else [])
+        
+        # Transform models into render jobs (ORM objects stay in this process)
+        jobs = []
+        job_indexes = []
+        failed = []
+        index = 0
+        for item_type, items, build_job in (
+            ('window', windows, self._window_job),
+            ('door', doors, self._door_job),
+        ):
+            for item in items:
+                try:
+                    jobs.append(build_job(item, project))
+                    job_indexes.append(index)
+                except Exception as e:
+                    print(f"Error generating {item_type} {item.item_number}: {e}")
+                    failed.append((index, item.item_number, item_type, str(e)))
+                index += 1
+        
+        total = index
+        done = 0
+        summary = {'windows': 0, 'doors': 0, 'cached': 0, 'errors': []}
+        
+        def item_event(index, item_number, item_type, path=None, error=None, duration=0.0, cached=False):
+            nonlocal done
+            done += 1
+            if error is None:
+                summary[item_type + 's'] += 1
+                summary['cached'] += int(cached)
+            else:
+                summary['errors'].append({
+                    'item_number': item_number,
+                    'type': item_type,
+                    'error': error
+                })
+            return {
+                'event': 'item',
+                'index': index,
+                'item_number': item_number,
+                'type': item_type,
+                'file': os.path.basename(path) if path else None,
+                'path': path,
+                'duration': round(duration, 3),
+                'cached': cached,
+                'error': error,
+                'done': done,
+                'total': total
+            }
+        
+        yield {
+            'event': 'start',
+            'po_number': self._project_metadata(project)['po_number'],
+            'total': total
         }
         
-        # Generate filename if not provided
-        if filename is None:
-            po = project_data['po_number'].replace(' ', '-')[:15]
-            item = door_data['item_number']
-            filename = f"{po}_Door-{item}_ELEV.pdf"
+        for index, item_number, item_type, error in failed:
+            yield item_event(index, item_number, item_type, error=error)
         
-        # Generate drawing
-        pdf_path = self.generator.generate_door_drawing(
-            door_data,
-            project_data,
-            filename
-        )
+        # Render in parallel; results come back as they finish
+        for render in self._iter_render_jobs(jobs):
+            item_type = 'door' if render.job.is_door else 'window'
+            item_number = render.job.item_data.get('item_number')
+            if not render.ok:
+                print(f"Error generating {item_type} {item_number}: {render.error}")
+            yield item_event(
+                job_indexes[render.index], item_number, item_type,
+                render.path, render.error, render.duration, render.cached
+            )
         
-        return pdf_path
+        yield {
+            'event': 'summary',
+            'total': total,
+            'generated': summary['windows'] + summary['doors'],
+            'windows': summary['windows'],
+            'doors': summary['doors'],
+            'cached': summary['cached'],
+            'failed': len(summary['errors']),
+            'errors': summary['errors'],
+            'duration': round(time.perf_counter() - batch_start, 3)
+        }
     
     def generate_project_drawings(
         self,
         project: Project,
         windows: List[Window] = None,
-        doors: List[Door] = None
+        doors: List[Door] = None,
+        progress_callback: Optional[Callable[[int, int], None]] = None
     ) -> Dict[str, List[str]]:
         """
-        Generate all drawings for a project
+        Generate all drawings for a project (see iter_project_drawings)
+        
+        Args:
+            project: Project model instance
+            windows: List of Window models (if None, uses project.windows)
+            doors: List of Door models (if None, uses project.doors)
+            progress_callback: Called as (done, total) whenever an item finishes
+            
+        Returns:
+            Dictionary with 'windows' and 'doors' lists of PDF paths,
+            'errors' list of {'item_number', 'type', 'error'} dicts, and
+            'cached' count of drawings served without rendering
+        """
+        result = {'windows': [], 'doors': [], 'errors': [], 'cached': 0}
+        paths = {'window': [], 'door': []}
+        
+        for event in self.iter_project_drawings(project, windows, doors):
+            if event['event'] == 'start':
+                if progress_callback is not None:
+                    progress_callback(0, event['total'])
+            elif event['event'] == 'item':
+                if event['path'] is not None:
+                    paths[event['type']].append((event['index'], event['path']))
+                if progress_callback is not None:
+                    progress_callback(event['done'], event['total'])
+            elif event['event'] == 'summary':
+                result['errors'] = event['errors']
+                result['cached'] = event['cached']
+        
+        # Keep input order regardless of completion order
+        result['windows'] = [path for _, path in sorted(paths['window'])]
+        result['doors'] = [path for _, path in sorted(paths['door'])]
+        return result
+    
+    def generate_project_package(
+        self,
+        project: Project,
+        windows: List[Window] = None,
+        doors: List[Door] = None,
+        cover: bool = True,
+        filename: str = None
+    ) -> Dict:
+        """
+        Generate a single multi-page PDF with every drawing of a project
         
         Args:
             project: Project model instance
             windows: List of Window models (if None, uses project.windows)
             doors: List of Door models (if None, uses project.doors)
+            cover: Include the cover schedule page(s)
+            filename: Optional custom filename
             
         Returns:
-            Dictionary with 'windows' and 'doors' lists of PDF paths
+            Dictionary with 'path', 'windows' and 'doors' counts, and
+            'errors' list of {'item_number', 'type', 'error'} for items
+            that could not be included
         """
-        result = {'windows': [], 'doors': []}
+        result = {'path': None, 'windows': 0, 'doors': 0, 'errors': []}
         
         # Use provided lists or get from project
         windows = windows or (project.windows if hasattr(project, 'windows') else [])
         doors = doors or (project.doors if hasattr(project, 'doors') else [])
         
-        # Generate window drawings
-        for window in windows:
-            try:
-                pdf_path = self.generate_window_from_model(window, project)
-                result['windows'].append(pdf_path)
-            except Exception as e:
-                print(f"Error generating window {window.item_number}: {e}")
-        
-        # Generate door drawings
-        for door in doors:
-            try:
-                pdf_path = self.generate_door_from_model(door, project)
-                result['doors'].append(pdf_path)
-            except Exception as e:
-                print(f"Error generating door {door.item_number}: {e}")
+        items = []
+        for item_type, models, transform in (
+            ('window', windows, DataTransformer.window_to_drawing_data),
+            ('door', doors, DataTransformer.door_to_drawing_data),
+        ):
+            for model in models:
+                try:
+                    items.append((transform(model, project), item_type == 'door'))
+                    result[item_type + 's'] += 1
+                except Exception as e:
+                    print(f"Error preparing {item_type} {model.item_number}: {e}")
+                    result['errors'].append({
+                        'item_number': model.item_number,
+                        'type': item_type,
+                        'error': str(e)
+                    })
         
+        if not items:
+            return result
+        
+        project_data = self._project_metadata(project)
+        if filename is None:
+            po = project_data['po_number'].replace(' ', '-')[:15]
+            filename = f"{po}_PACKAGE.pdf"
+        
+        result['path'] = self.generator.generate_package(items, project_data, filename, cover=cover)
         return result
     
     def generate_from_google_sheets_row(
@@ -270,3 +539,12 @@ def get_drawing_service(output_dir: str = "./drawings") -> IntegratedDrawingServ
         _drawing_service = IntegratedDrawingService(output_dir)
     
     return _drawing_service
+
+
+def shutdown_drawing_service() -> None:
+    """Stop render workers of the global drawing service (app shutdown)"""
+    global _drawing_service
+    
+    if _drawing_service is not None:
+        _drawing_service.render_pool.shutdown()
+        _drawing_service = None
@@ -0,0 +1,323 @@
+"""
+Render Cache
+Content-addressed, size-bounded on-disk cache of rendered drawing PDFs
+
+Entries are keyed by a SHA-256 of the canonical JSON of everything that
+affects the rendered sheet (normalized item data, project metadata, the
+date printed in the title block, engine/template version and backend).
+The cache lives on disk so all uvicorn/gunicorn workers share it; writes
+are atomic (temp file + rename) and eviction is least-recently-used by
+file mtime, serialized across processes with a lock file where fcntl is
+available. Each worker keeps a running estimate of the cache size and
+only rescans the directory when the estimate passes the cap or every
+EVICT_SCAN_INTERVAL stores (to pick up other workers' writes), so the
+cap can be overshot by at most that many entries per worker between
+scans. Eviction trims to EVICT_LOW_WATER of the cap so a full cache is
+not rescanned on every store.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Optional
+
+try:
+    import fcntl
+except ImportError:  # Windows - eviction runs without a cross-process lock
+    fcntl = None
+
+from app.config import settings
+from services.drawing_engine import __version__ as ENGINE_VERSION, TEMPLATE_VERSION
+
+
+def _normalize(value):
+    """Normalize values so equivalent specs serialize identically"""
+    if isinstance(value, dict):
+        return {str(k): _normalize(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_normalize(v) for v in value]
+    if isinstance(value, float):
+        value = round(value, 6)
+        return int(value) if value.is_integer() else value
+    if isinstance(value, str):
+        return value.strip()
+    if value is None or isinstance(value, (bool, int)):
+        return value
+    return str(value)
+
+
+class RenderCache:
+    """
+    Disk-backed LRU of rendered PDFs
+
+    Usage:
+        cache = RenderCache('./cache/renders', max_bytes=500 * 1024 * 1024)
+        key = cache.make_key(item_data, project_data, backend='reportlab')
+        if not cache.get(key, output_path):
+            render(output_path)
+            cache.put(key, output_path)
+    """
+
+    GENERATION_FILE = "GENERATION"
+    LOCK_FILE = ".lock"
+    # Stores between full directory scans when the size estimate is under the cap
+    EVICT_SCAN_INTERVAL = 64
+    # Fraction of max_bytes eviction trims down to once the cap is exceeded
+    EVICT_LOW_WATER = 0.9
+
+    def __init__(self, cache_dir: str, max_bytes: int):
+        """
+        Initialize render cache
+
+        Args:
+            cache_dir: Directory shared by all workers for cached PDFs
+            max_bytes: Total size cap; least recently used entries are evicted
+        """
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+        # Per-process counters
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.evictions = 0
+
+        # Running size estimate (None until the first scan) and stores since that scan
+        self._size_estimate: Optional[int] = None
+        self._stores_since_scan = 0
+
+    # ------------------------------------------------------------------
+    # Keys
+    # ------------------------------------------------------------------
+
+    def generation(self) -> int:
+        """Invalidation generation shared by all workers (bumped by invalidate())"""
+        try:
+            return int((self.cache_dir / self.GENERATION_FILE).read_text().strip() or 0)
+        except (FileNotFoundError, ValueError):
+            return 0
+
+    def make_key(
+        self,
+        item_data: Dict,
+        project_data: Dict,
+        is_door: bool = False,
+        backend: str = "matplotlib"
+    ) -> str:
+        """
+        Build the content hash for one drawing
+
+        Args:
+            item_data: DataTransformer drawing data
+            project_data: Project metadata dict
+            is_door: Door or window sheet
+            backend: Drawing backend that renders it
+
+        Returns:
+            Hex SHA-256 key
+        """
+        payload = {
+            'item': _normalize(item_data),
+            'project': _normalize(project_data),
+            'door': is_door,
+            # The title block prints today's date
+            'date': datetime.now().strftime("%m/%d/%Y"),
+            'engine': ENGINE_VERSION,
+            'template': TEMPLATE_VERSION,
+            'backend': backend,
+            'generation': self.generation(),
+        }
+        canonical = json.dumps(payload, sort_keys=True, separators=(',', ':'))
+        return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+    def _entry_path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.pdf"
+
+    # ------------------------------------------------------------------
+    # Lookup / store
+    # ------------------------------------------------------------------
+
+    def get(self, key: str, output_path: str) -> bool:
+        """
+        Copy a cached PDF to output_path
+
+        Returns:
+            True on hit, False on miss
+        """
+        entry = self._entry_path(key)
+        try:
+            self._copy_atomic(entry, Path(output_path))
+            os.utime(entry)  # mark as recently used
+        except FileNotFoundError:
+            with self._lock:
+                self.misses += 1
+            return False
+
+        with self._lock:
+            self.hits += 1
+        return True
+
+    def put(self, key: str, pdf_path: str) -> None:
+        """Store a freshly rendered PDF under key and evict if over the size cap"""
+        entry = self._entry_path(key)
+        entry.parent.mkdir(parents=True, exist_ok=True)
+        self._copy_atomic(Path(pdf_path), entry)
+        size = os.path.getsize(pdf_path)
+
+        with self._lock:
+            self.stores += 1
+            self._stores_since_scan += 1
+            if self._size_estimate is not None:
+                self._size_estimate += size
+            scan_due = (
+                self._size_estimate is None
+                or self._size_estimate > self.max_bytes
+                or self._stores_since_scan >= self.EVICT_SCAN_INTERVAL
+            )
+        if scan_due:
+            self._evict()
+
+    @staticmethod
+    def _copy_atomic(src: Path, dst: Path) -> None:
+        """Copy via a temp file in the destination directory + rename"""
+        fd, tmp_path = tempfile.mkstemp(dir=str(dst.parent), suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as tmp, open(src, 'rb') as source:
+                shutil.copyfileobj(source, tmp)
+            os.replace(tmp_path, dst)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+
+    # ------------------------------------------------------------------
+    # Eviction / invalidation
+    # ------------------------------------------------------------------
+
+    @contextmanager
+    def _process_lock(self):
+        """Exclusive lock across workers sharing the cache directory"""
+        with open(self.cache_dir / self.LOCK_FILE, 'a') as lock_file:
+            if fcntl is not None:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _entries(self):
+        """(mtime, size, path) for every cached PDF"""
+        entries = []
+        for shard in os.scandir(self.cache_dir):
+            if not shard.is_dir():
+                continue
+            for entry in os.scandir(shard.path):
+                if entry.name.endswith('.pdf'):
+                    try:
+                        stat = entry.stat()
+                    except FileNotFoundError:
+                        continue
+                    entries.append((stat.st_mtime, stat.st_size, entry.path))
+        return entries
+
+    def _evict(self) -> None:
+        """Scan the cache, evict LRU entries over the cap and reset the size estimate"""
+        evicted = 0
+        with self._process_lock():
+            entries = self._entries()
+            total = sum(size for _, size, _ in entries)
+            if total > self.max_bytes:
+                target = int(self.max_bytes * self.EVICT_LOW_WATER)
+                for _, size, path in sorted(entries):
+                    if total <= target:
+                        break
+                    try:
+                        os.unlink(path)
+                    except FileNotFoundError:
+                        pass
+                    total -= size
+                    evicted += 1
+
+        with self._lock:
+            self.evictions += evicted
+            self._size_estimate = total
+            self._stores_since_scan = 0
+
+    def invalidate(self) -> int:
+        """
+        Drop every cached drawing (e.g., after a template change)
+
+        Bumps the shared generation so renders already in flight in other
+        workers can't repopulate the cache with old-template output.
+
+        Returns:
+            Number of entries removed
+        """
+        with self._process_lock():
+            generation_path = self.cache_dir / self.GENERATION_FILE
+            generation_path.write_text(str(self.generation() + 1))
+
+            removed = 0
+            for _, _, path in self._entries():
+                try:
+                    os.unlink(path)
+                    removed += 1
+                except FileNotFoundError:
+                    pass
+
+        with self._lock:
+            self._size_estimate = 0
+            self._stores_since_scan = 0
+        return removed
+
+    def stats(self) -> Dict:
+        """Hit/miss counters (this process) and disk usage (shared)"""
+        entries = self._entries()
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': round(self.hits / lookups, 3) if lookups else 0.0,
+                'stores': self.stores,
+                'evictions': self.evictions,
+                'entries': len(entries),
+                'size_bytes': sum(size for _, size, _ in entries),
+                'max_bytes': self.max_bytes,
+                'generation': self.generation(),
+                'cache_dir': str(self.cache_dir),
+            }
+
+
+# Global cache instance
+_render_cache: Optional[RenderCache] = None
+
+
+def get_render_cache() -> Optional[RenderCache]:
+    """
+    Get or create the global render cache
+
+    Returns:
+        RenderCache instance, or None when RENDER_CACHE_ENABLED is off
+    """
+    global _render_cache
+
+    if not settings.RENDER_CACHE_ENABLED:
+        return None
+
+    if _render_cache is None:
+        _render_cache = RenderCache(
+            settings.RENDER_CACHE_DIR,
+            max_bytes=settings.RENDER_CACHE_MAX_MB * 1024 * 1024
+        )
+
+    return _render_cache
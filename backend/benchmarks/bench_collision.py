@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Collision Detection Benchmark
+Places hundreds of labels with CollisionDetector.find_safe_position and
+compares a linear scan of all placed bounds, the spatial-grid index with
+the scalar spiral search, and the grid with the vectorized spiral search
+
+Usage (from backend directory):
+    python benchmarks/bench_collision.py [--labels 200 500 1000] [--seed 7]
+"""
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from services.drawing_engine.text_bounds import CollisionDetector
+
+# 11x17 sheet in points
+SHEET_WIDTH = 17 * 72
+SHEET_HEIGHT = 11 * 72
+
+WORDS = ['72"', '48 1/2"', 'W-101', 'LOW-E', 'TEMPERED', 'FIXED', 'CASEMENT',
+         'WHITE', 'SERIES 65', 'R.O. 49"', 'QTY 2', 'SLIDER', 'SPEC']
+
+
+class LinearCollisionDetector(CollisionDetector):
+    """Baseline: test every placed box in a plain list (the detector before spatial indexing)"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._boxes = []
+
+    def add_bounds(self, bounds) -> None:
+        super().add_bounds(bounds)
+        self._boxes.append(bounds)
+
+    def check_collision(self, bounds, padding: float = 0) -> bool:
+        effective_padding = self.min_spacing + padding
+        for placed in self._boxes:
+            if bounds.overlaps_with(placed, padding=effective_padding):
+                return True
+        return False
+
+
+def make_labels(count: int, seed: int):
+    """Repeatable labels clustered like dimension/spec text on a sheet"""
+    rng = random.Random(seed)
+    clusters = [(rng.uniform(50, SHEET_WIDTH - 50), rng.uniform(50, SHEET_HEIGHT - 50)) for _ in range(12)]
+    labels = []
+    for _ in range(count):
+        cx, cy = rng.choice(clusters)
+        labels.append((
+            cx + rng.gauss(0, 80), cy + rng.gauss(0, 50),
+            rng.choice(WORDS), rng.choice([6, 7, 8, 9, 10]), rng.random() < 0.2
+        ))
+    return labels
+
+
+def place_all(detector: CollisionDetector, labels):
+    """Place every label, returning (seconds, placements)"""
+    start = time.perf_counter()
+    placements = [
+        detector.find_safe_position(x, y, text, fontsize=size, bold=bold)
+        for x, y, text, size, bold in labels
+    ]
+    return time.perf_counter() - start, placements
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--labels', type=int, nargs='*', default=[100, 300, 1000])
+    parser.add_argument('--seed', type=int, default=7)
+    args = parser.parse_args()
+
+    print("=" * 78)
+    print("COLLISION DETECTION BENCHMARK")
+    print("=" * 78)
+    print(f"{'labels':>8s}{'linear ms':>12s}{'grid ms':>10s}{'grid+vec ms':>13s}"
+          f"{'speed-up':>10s}{'placed':>8s}{'forced':>8s}  match")
+
+    for count in args.labels:
+        labels = make_labels(count, args.seed)
+        linear_time, linear = place_all(LinearCollisionDetector(vectorized=False), labels)
+        grid_time, grid = place_all(CollisionDetector(vectorized=False), labels)
+        vector_time, vector = place_all(CollisionDetector(vectorized=True), labels)
+
+        forced = sum(1 for _, _, found in vector if not found)
+        print(f"{count:8d}{linear_time * 1000:12.1f}{grid_time * 1000:10.1f}{vector_time * 1000:13.1f}"
+              f"{linear_time / vector_time:9.1f}x{count - forced:8d}{forced:8d}  "
+              f"{'yes' if linear == grid == vector else 'NO'}")
+
+
+if __name__ == '__main__':
+    main()
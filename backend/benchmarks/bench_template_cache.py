@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Template Cache Benchmark
+Compares drawing generation with and without the static chrome template cache
+
+Usage (from backend directory):
+    python benchmarks/bench_template_cache.py [--items 20]
+"""
+import argparse
+import sys
+import tempfile
+import time
+import warnings
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+
+from services.drawing_engine import ProfessionalDrawingGenerator
+from services.drawing_engine.template_cache import get_template_cache
+
+WINDOW_TYPES = ['Fixed', 'Double Casement', 'Slider', 'Awning']
+
+PROJECT = {
+    'po_number': 'BENCH-001',
+    'project_name': 'Benchmark Residence',
+    'customer_name': 'Benchmark Customer'
+}
+
+
+def make_items(count: int):
+    """Build a repeatable list of window items"""
+    return [
+        {
+            'item_number': f'W-{i + 1:03d}',
+            'width_inches': 24 + (i * 6) % 96,
+            'height_inches': 36 + (i * 4) % 60,
+            'window_type': WINDOW_TYPES[i % len(WINDOW_TYPES)],
+            'glass_type': 'Low-E Tempered',
+            'frame_color': 'White',
+            'quantity': 1 + i % 3,
+        }
+        for i in range(count)
+    ]
+
+
+def run(items, use_template_cache: bool, output_dir: str):
+    """Render all items, returning (build_seconds, save_seconds) per item"""
+    generator = ProfessionalDrawingGenerator(output_dir, use_template_cache=use_template_cache)
+
+    # Time the build (layout + artists) and save phases separately
+    timings = []
+    for item in items:
+        start = time.perf_counter()
+        template = generator._begin_drawing(item)
+        try:
+            generator._draw_spec_tables(item)
+            generator._draw_elevation(item)
+            generator._draw_right_column(item, PROJECT)
+            built = time.perf_counter()
+            generator.layout.save(str(Path(output_dir) / f"{item['item_number']}.pdf"))
+            saved = time.perf_counter()
+        finally:
+            if template is not None:
+                generator.template_cache.release(template)
+            else:
+                generator.layout.close()
+        timings.append((built - start, saved - built))
+
+    return timings
+
+
+def summarize(label: str, timings):
+    build = sum(t[0] for t in timings)
+    save = sum(t[1] for t in timings)
+    count = len(timings)
+    print(f"{label:<24s} build {build / count * 1000:8.1f} ms/item   "
+          f"save {save / count * 1000:8.1f} ms/item   "
+          f"total {(build + save) / count * 1000:8.1f} ms/item")
+    return build, save
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--items', type=int, default=20, help='Drawings per run')
+    args = parser.parse_args()
+
+    warnings.filterwarnings('ignore', category=UserWarning)
+    items = make_items(args.items)
+
+    print("=" * 70)
+    print("DRAWING TEMPLATE CACHE BENCHMARK")
+    print("=" * 70)
+    print(f"Items per run: {len(items)}\n")
+
+    with tempfile.TemporaryDirectory() as output_dir:
+        # Warm up imports and font caches so neither run pays for them
+        run(items[:2], use_template_cache=False, output_dir=output_dir)
+        get_template_cache().clear()
+
+        before = summarize("Before (no cache)", run(items, False, output_dir))
+        after = summarize("After (template cache)", run(items, True, output_dir))
+
+    print()
+    print(f"Build speed-up: {before[0] / after[0]:.2f}x")
+    print(f"Total speed-up: {sum(before) / sum(after):.2f}x")
+    print(f"Template cache: {get_template_cache().stats()}")
+    plt.close('all')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,386 @@
+#!/usr/bin/env python3
+"""
+Drawing Engine Benchmark
+Renders a fixed matrix of windows and doors and reports wall time, RSS
+growth and output bytes per render stage (plus the process-wide peak RSS)
+
+Stages (matplotlib backend):
+    create_layout       layout + static chrome (template checkout when cached)
+    _draw_spec_tables   left column specification tables
+    _draw_elevation     center elevation with dimensions
+    _draw_right_column  title block, project info, icons
+    save                write the PDF
+
+The reportlab backend draws and saves in one pass and is reported as a
+single 'render' stage.
+
+Results are written as JSON (with the git commit) so runs can be compared:
+
+Usage (from backend directory):
+    python benchmarks/drawing_engine_bench.py [--repeat 3] [--output run.json]
+    python benchmarks/drawing_engine_bench.py --compare baseline.json [--fail-over 10]
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+import warnings
+from datetime import datetime
+from pathlib import Path
+
+try:
+    import resource
+except ImportError:  # Windows - no process peak RSS
+    resource = None
+
+try:
+    import psutil
+except ImportError:  # Current RSS falls back to /proc (Linux only)
+    psutil = None
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+
+from services.drawing_engine import ProfessionalDrawingGenerator, __version__ as ENGINE_VERSION
+from services.drawing_engine.template_cache import get_template_cache
+
+BACKEND_DIR = Path(__file__).parent.parent
+
+# Changes smaller than this are timer noise, whatever the percentage
+MIN_REGRESSION_MS = 1.0
+
+PROJECT = {
+    'po_number': 'BENCH-001',
+    'project_name': 'Benchmark Residence',
+    'customer_name': 'Benchmark Customer'
+}
+
+# (name, window_type, is_door)
+ITEM_TYPES = [
+    ('fixed', 'Fixed', False),
+    ('casement', 'Double Casement', False),
+    ('slider', 'Slider', False),
+    ('awning', 'Awning', False),
+    ('hopper', 'Hopper', False),
+    ('patio_door', 'Patio Slider', True),
+    ('swing_door', 'Single Swing', True),
+]
+
+# (name, window size, door size) in inches
+SIZES = [
+    ('small', (24, 36), (30, 80)),
+    ('large', (96, 72), (144, 96)),
+]
+
+
+def make_matrix():
+    """Build the fixed benchmark matrix: every item type in every size"""
+    cases = []
+    for type_name, window_type, is_door in ITEM_TYPES:
+        for size_name, window_size, door_size in SIZES:
+            width, height = door_size if is_door else window_size
+            cases.append({
+                'name': f'{type_name}_{size_name}',
+                'is_door': is_door,
+                'item': {
+                    'item_number': f'{type_name[:1].upper()}-{size_name[:1].upper()}',
+                    'width_inches': width,
+                    'height_inches': height,
+                    'window_type': window_type,
+                    'glass_type': 'Low-E Tempered',
+                    'frame_color': 'White',
+                    'frame_series': '65',
+                    'quantity': 1,
+                },
+            })
+    return cases
+
+
+def git_info():
+    """Current commit and whether the tree has local changes"""
+    def git(*args):
+        try:
+            return subprocess.run(
+                ['git', *args], cwd=BACKEND_DIR, capture_output=True, text=True, timeout=10
+            ).stdout.strip()
+        except (OSError, subprocess.SubprocessError):
+            return ''
+
+    return {
+        'commit': git('rev-parse', 'HEAD') or None,
+        'dirty': bool(git('status', '--porcelain', '--untracked-files=no')),
+    }
+
+
+def peak_rss_mb():
+    """Peak resident set size of this process so far (None where unavailable)"""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS bytes
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+
+def current_rss_mb():
+    """Current resident set size of this process (None where unavailable)"""
+    if psutil is not None:
+        return psutil.Process().memory_info().rss / (1024 * 1024)
+    try:
+        with open('/proc/self/statm') as statm:
+            pages = int(statm.read().split()[1])
+    except (OSError, ValueError, IndexError):
+        return None
+    return pages * os.sysconf('SC_PAGE_SIZE') / (1024 * 1024)
+
+
+class StageTimer:
+    """Measures wall time, RSS growth and (optionally) Python heap per stage"""
+
+    def __init__(self, trace_heap: bool = False):
+        self.trace_heap = trace_heap
+        self.stages = {}
+
+    def run(self, name: str, func, *args):
+        if self.trace_heap:
+            tracemalloc.reset_peak()
+        rss_before = current_rss_mb()
+        start = time.perf_counter()
+        result = func(*args)
+        elapsed = time.perf_counter() - start
+        rss_after = current_rss_mb()
+
+        # Memory this stage left resident (ru_maxrss is a process-wide high-water
+        # mark, so it can't be attributed to a stage)
+        rss_delta = rss_after - rss_before if rss_before is not None and rss_after is not None else None
+        stage = {'wall_ms': elapsed * 1000, 'rss_delta_mb': rss_delta}
+        if self.trace_heap:
+            stage['heap_peak_kb'] = tracemalloc.get_traced_memory()[1] / 1024
+        self.stages[name] = stage
+        return result
+
+
+def render_case(generator, case, output_path: str, trace_heap: bool):
+    """Render one case stage by stage (mirrors ProfessionalDrawingGenerator._render)"""
+    item, is_door = case['item'], case['is_door']
+    timer = StageTimer(trace_heap)
+
+    if generator.backend == 'reportlab':
+        timer.run('render', generator._get_vector_renderer().render, item, PROJECT, output_path, is_door)
+    else:
+        template = timer.run('create_layout', generator._begin_drawing, item)
+        try:
+            timer.run('_draw_spec_tables', generator._draw_spec_tables, item, is_door)
+            timer.run('_draw_elevation', generator._draw_elevation, item, is_door)
+            timer.run('_draw_right_column', generator._draw_right_column, item, PROJECT, is_door)
+            timer.run('save', generator.layout.save, output_path)
+        finally:
+            if template is not None:
+                generator.template_cache.release(template)
+            else:
+                generator.layout.close()
+
+    return timer.stages, os.path.getsize(output_path)
+
+
+def run_benchmark(args):
+    """Render the matrix args.repeat times and aggregate per case/stage"""
+    cases = make_matrix()
+    if args.cases:
+        cases = [case for case in cases if any(pattern in case['name'] for pattern in args.cases)]
+
+    if args.trace_heap:
+        tracemalloc.start()
+
+    results = []
+    with tempfile.TemporaryDirectory() as output_dir:
+        generator = ProfessionalDrawingGenerator(
+            output_dir, use_template_cache=not args.no_template_cache, backend=args.backend
+        )
+
+        # Warm up imports, fonts and (if enabled) templates so the first
+        # case doesn't carry one-off costs
+        for case in cases[:2]:
+            render_case(generator, case, os.path.join(output_dir, 'warmup.pdf'), False)
+
+        for case in cases:
+            output_path = os.path.join(output_dir, f"{case['name']}.pdf")
+            runs = [render_case(generator, case, output_path, args.trace_heap) for _ in range(args.repeat)]
+
+            stages = {}
+            for name in runs[0][0]:
+                deltas = [run[0][name]['rss_delta_mb'] for run in runs]
+                stage = {
+                    'wall_ms': round(statistics.median(run[0][name]['wall_ms'] for run in runs), 3),
+                    'rss_delta_mb': round(max(deltas), 2) if None not in deltas else None,
+                }
+                if args.trace_heap:
+                    stage['heap_peak_kb'] = round(max(run[0][name]['heap_peak_kb'] for run in runs), 1)
+                stages[name] = stage
+
+            results.append({
+                'name': case['name'],
+                'is_door': case['is_door'],
+                'window_type': case['item']['window_type'],
+                'width_inches': case['item']['width_inches'],
+                'height_inches': case['item']['height_inches'],
+                'stages': stages,
+                'total_ms': round(sum(stage['wall_ms'] for stage in stages.values()), 3),
+                'output_bytes': runs[-1][1],
+            })
+
+    if args.trace_heap:
+        tracemalloc.stop()
+    plt.close('all')
+
+    stage_names = list(results[0]['stages']) if results else []
+    return {
+        'meta': {
+            **git_info(),
+            'timestamp': datetime.now().isoformat(timespec='seconds'),
+            'engine_version': ENGINE_VERSION,
+            'backend': args.backend,
+            'template_cache': not args.no_template_cache,
+            'repeat': args.repeat,
+            'python': platform.python_version(),
+            'matplotlib': matplotlib.__version__,
+            'platform': platform.platform(),
+            'cpu_count': os.cpu_count(),
+        },
+        'cases': results,
+        'totals': {
+            'stages_ms': {
+                name: round(sum(case['stages'][name]['wall_ms'] for case in results), 3)
+                for name in stage_names
+            },
+            'total_ms': round(sum(case['total_ms'] for case in results), 3),
+            'output_bytes': sum(case['output_bytes'] for case in results),
+            'process_rss_peak_mb': peak_rss_mb(),
+            'template_cache': get_template_cache().stats(),
+        },
+    }
+
+
+def print_report(report):
+    meta = report['meta']
+    commit = (meta['commit'] or 'unknown')[:10] + (' (dirty)' if meta['dirty'] else '')
+    print("=" * 100)
+    print("DRAWING ENGINE BENCHMARK")
+    print("=" * 100)
+    print(f"Commit: {commit}   Backend: {meta['backend']}   "
+          f"Template cache: {meta['template_cache']}   Repeat: {meta['repeat']} (median)\n")
+
+    stage_names = list(report['totals']['stages_ms'])
+    header = f"{'case':<20s}" + "".join(f"{name.lstrip('_')[:14]:>15s}" for name in stage_names)
+    print(header + f"{'total ms':>11s}{'bytes':>10s}{'+rss MB':>9s}")
+    print("-" * len(header + " " * 30))
+    for case in report['cases']:
+        row = f"{case['name']:<20s}" + "".join(
+            f"{case['stages'][name]['wall_ms']:15.1f}" for name in stage_names
+        )
+        # RSS growth over the case's stages (worst of the repeats, per stage)
+        deltas = [stage['rss_delta_mb'] for stage in case['stages'].values()]
+        growth = f"{sum(deltas):+9.1f}" if None not in deltas else f"{'n/a':>9s}"
+        print(row + f"{case['total_ms']:11.1f}{case['output_bytes']:10d}{growth}")
+
+    totals = report['totals']
+    print("-" * len(header + " " * 30))
+    print(f"{'TOTAL':<20s}" + "".join(f"{totals['stages_ms'][name]:15.1f}" for name in stage_names) +
+          f"{totals['total_ms']:11.1f}{totals['output_bytes']:10d}")
+    peak = totals['process_rss_peak_mb']
+    print(f"Process peak RSS: {f'{peak:.1f} MB' if peak is not None else 'n/a'}")
+
+
+def compare(report, baseline, fail_over=None) -> bool:
+    """
+    Print per-stage and per-case changes against a baseline run
+
+    Returns:
+        False if any stage or case total regressed by more than fail_over percent
+    """
+    def change(new, old):
+        return (new - old) / old * 100 if old else 0.0
+
+    base_meta = baseline['meta']
+    print(f"\nCompared with {(base_meta.get('commit') or 'unknown')[:10]} "
+          f"({base_meta.get('timestamp')}, backend {base_meta.get('backend')})")
+
+    # Only cases present in both runs are compared
+    base_cases = {case['name']: case for case in baseline['cases']}
+    common = [case for case in report['cases'] if case['name'] in base_cases]
+
+    rows = [
+        (
+            f"stage {name}",
+            sum(case['stages'][name]['wall_ms'] for case in common),
+            sum(base_cases[case['name']]['stages'][name]['wall_ms'] for case in common)
+        )
+        for name in report['totals']['stages_ms']
+        if common and all(name in base_cases[case['name']]['stages'] for case in common)
+    ]
+    rows += [
+        (f"case {case['name']}", case['total_ms'], base_cases[case['name']]['total_ms'])
+        for case in common
+    ]
+    rows.append((
+        "total (common cases)",
+        sum(case['total_ms'] for case in common),
+        sum(base_cases[case['name']]['total_ms'] for case in common)
+    ))
+
+    ok = True
+    print(f"{'':<32s}{'baseline ms':>14s}{'current ms':>14s}{'change':>10s}")
+    for label, new, old in rows:
+        delta = change(new, old)
+        flag = ''
+        if fail_over is not None and delta > fail_over and new - old > MIN_REGRESSION_MS:
+            flag = '  REGRESSION'
+            ok = False
+        print(f"{label:<32s}{old:14.1f}{new:14.1f}{delta:+9.1f}%{flag}")
+
+    new_bytes = sum(case['output_bytes'] for case in common)
+    old_bytes = sum(base_cases[case['name']]['output_bytes'] for case in common)
+    print(f"{'output bytes':<32s}{old_bytes:14d}{new_bytes:14d}{change(new_bytes, old_bytes):+9.1f}%")
+    return ok
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--repeat', type=int, default=3, help='Renders per case (median is reported)')
+    parser.add_argument('--backend', default='matplotlib', choices=ProfessionalDrawingGenerator.BACKENDS)
+    parser.add_argument('--no-template-cache', action='store_true', help='Rebuild the sheet chrome every render')
+    parser.add_argument('--trace-heap', action='store_true', help='Also report Python heap peak per stage (slower)')
+    parser.add_argument('--cases', nargs='*', help='Only run cases whose name contains one of these')
+    parser.add_argument('--output', help='JSON results path (default: benchmarks/results/<commit>-<backend>.json)')
+    parser.add_argument('--compare', help='Baseline JSON results to compare against')
+    parser.add_argument('--fail-over', type=float, help='Exit 1 if anything regressed by more than this percent')
+    args = parser.parse_args()
+
+    warnings.filterwarnings('ignore', category=UserWarning)
+    report = run_benchmark(args)
+    print_report(report)
+
+    output = args.output
+    if output is None:
+        commit = (report['meta']['commit'] or 'nogit')[:10]
+        output = BACKEND_DIR / 'benchmarks' / 'results' / f"{commit}-{args.backend}.json"
+    Path(output).parent.mkdir(parents=True, exist_ok=True)
+    Path(output).write_text(json.dumps(report, indent=2))
+    print(f"\nResults written to {output}")
+
+    if args.compare:
+        baseline = json.loads(Path(args.compare).read_text())
+        if not compare(report, baseline, args.fail_over):
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,13 +1,14 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
+import asyncio
 import sys
 import os
 import logging
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from app.config import settings
-from routers import projects, drawings, frames
+from routers import projects, drawings, frames, images
 from app.database import engine, Base
 
 # Configure logging
@@ -44,6 +45,7 @@ app.add_middleware(
 app.include_router(projects.router)
 app.include_router(drawings.router)
 app.include_router(frames.router)
+app.include_router(images.router)
 
 # Mount static files for frame images FIRST
 static_dir = os.path.join(os.path.dirname(__file__), 'static')
@@ -85,6 +87,22 @@ else:
 async def startup_event():
     logger.info("[OK] Application starting...")
     logger.info("[OK] Frame sync scheduler can be activated via API endpoint")
+    try:
+        from services.asset_manifest import get_asset_manifest
+        counts = get_asset_manifest().stats()['roots']
+        logger.info(f"[OK] Asset manifest built ({sum(r['files'] for r in counts.values())} files)")
+    except Exception as e:
+        logger.warning(f"[WARNING] Asset manifest build failed: {str(e)}")
+    if settings.IMAGE_CACHE_WARMUP:
+        try:
+            from services.image_cache import get_image_cache
+            from services.reference_shop_drawing_generator import PLAN_VIEW_DIRS, PLAN_VIEW_MAX_SIDE
+            loaded = await asyncio.to_thread(
+                get_image_cache().warm_up, [*PLAN_VIEW_DIRS, frame_library_dir], PLAN_VIEW_MAX_SIDE
+            )
+            logger.info(f"[OK] Image cache warmed up ({loaded} images)")
+        except Exception as e:
+            logger.warning(f"[WARNING] Image cache warm-up failed: {str(e)}")
 
 @app.on_event("shutdown")
 async def shutdown_event():
@@ -94,6 +112,16 @@ async def shutdown_event():
         stop_frame_sync_scheduler()
     except Exception as e:
         logger.warning(f"[WARNING] Error stopping scheduler: {str(e)}")
+    try:
+        from tasks.jobs import shutdown_job_manager
+        shutdown_job_manager()
+    except Exception as e:
+        logger.warning(f"[WARNING] Error stopping render jobs: {str(e)}")
+    try:
+        from app.services.integrated_drawing_service import shutdown_drawing_service
+        shutdown_drawing_service()
+    except Exception as e:
+        logger.warning(f"[WARNING] Error stopping render workers: {str(e)}")
     logger.info("[OK] Shutdown complete")
 
 @app.get("/")
@@ -2,18 +2,21 @@
 Drawing generation routes
 API endpoints for generating and retrieving technical shop drawings
 """
-from fastapi import APIRouter, HTTPException, Depends
+from fastapi import APIRouter, HTTPException, Depends, Request
 from fastapi.responses import FileResponse, StreamingResponse, Response
 from sqlalchemy.orm import Session
 from sqlalchemy import text
 import os
 import io
-from typing import List, Dict, Optional
+import json
+import tempfile
+from typing import List, Dict, Iterator, Optional
 from pydantic import BaseModel
 from datetime import datetime
 import base64
 
-from app.database import get_db
+from app.config import settings
+from app.database import get_db, SessionLocal
 from app.models import Project, Window, Door, Unit, Drawing
 
 # Optional imports - gracefully handle missing services
@@ -31,6 +34,20 @@ except ImportError:
     DRAWING_SERVICE_AVAILABLE = False
     get_drawing_service = lambda: None
 
+try:
+    from app.services.render_cache import get_render_cache
+    RENDER_CACHE_AVAILABLE = True
+except ImportError:
+    RENDER_CACHE_AVAILABLE = False
+    get_render_cache = lambda: None
+
+try:
+    from tasks.jobs import get_job_manager
+    RENDER_JOBS_AVAILABLE = True
+except ImportError:
+    RENDER_JOBS_AVAILABLE = False
+    get_job_manager = lambda: None
+
 try:
     from services.reference_shop_drawing_generator import ReferenceShopDrawingGenerator
     REFERENCE_GENERATOR_AVAILABLE = True
@@ -38,6 +55,12 @@ except ImportError:
     REFERENCE_GENERATOR_AVAILABLE = False
     ReferenceShopDrawingGenerator = None
 
+from app.services import drawing_repository
+from app.services.blob_store import blob_sha256, get_blob_store, validate_sha256
+from app.http_caching import (
+    PRIVATE_IMMUTABLE_CACHE_CONTROL, RangeNotSatisfiable, etag_matches, parse_range
+)
+
 router = APIRouter(prefix="/api/drawings", tags=["drawings"])
 
 
@@ -55,6 +78,7 @@ class DrawingParameters(BaseModel):
     notes: str = ""
     special_notes: str = ""
     imageSnapshot: Optional[str] = None  # Base64 encoded canvas image
+    outputProfile: Optional[str] = None  # draft / standard / print (default SNAPSHOT_OUTPUT_PROFILE)
 
 
 @router.post("/project/{po_number}/generate")
@@ -83,6 +107,8 @@ async def generate_project_drawings(po_number: str, db: Session = Depends(get_db
         
         total_generated = len(results['windows']) + len(results['doors'])
         
+        if total_generated == 0 and results['errors']:
+            raise RuntimeError(f"All {len(results['errors'])} item(s) failed: {results['errors'][0]['error']}")
         if total_generated == 0:
             raise ValueError(f"No items found in project {po_number}")
         
@@ -93,10 +119,12 @@ async def generate_project_drawings(po_number: str, db: Session = Depends(get_db
             "message": f"Generated {total_generated} drawing(s)",
             "windows_generated": len(results['windows']),
             "doors_generated": len(results['doors']),
+            "cached": results.get('cached', 0),
             "files": {
                 "windows": [os.path.basename(f) for f in results['windows']],
                 "doors": [os.path.basename(f) for f in results['doors']]
-            }
+            },
+            "errors": results['errors']
         }
         
     except ValueError as e:
@@ -105,6 +133,117 @@ async def generate_project_drawings(po_number: str, db: Session = Depends(get_db
         raise HTTPException(status_code=500, detail=f"Drawing generation failed: {str(e)}")
 
 
+STREAM_FORMATS = {
+    "ndjson": "application/x-ndjson",
+    "sse": "text/event-stream",
+}
+
+
+def _project_drawing_events(po_number: str) -> Iterator[Dict]:
+    """Render events for a project, with a session that lives as long as the stream"""
+    db = SessionLocal()
+    try:
+        project = db.query(Project).filter_by(po_number=po_number).first()
+        if not project:
+            raise ValueError(f"Project with PO number '{po_number}' not found")
+        
+        for event in get_drawing_service().iter_project_drawings(project):
+            if event['event'] == 'item':
+                event = {k: v for k, v in event.items() if k != 'path'}
+                if event['file']:
+                    event['download_url'] = f"/api/drawings/download/{event['file']}"
+            yield event
+    except Exception as e:
+        yield {"event": "error", "error": f"Drawing generation failed: {str(e)}"}
+    finally:
+        db.close()
+
+
+def _encode_event(event: Dict, stream_format: str) -> str:
+    data = json.dumps(event, default=str)
+    if stream_format == "sse":
+        return f"event: {event['event']}\ndata: {data}\n\n"
+    return data + "\n"
+
+
+@router.get("/project/{po_number}/generate/stream")
+async def stream_project_drawings(po_number: str, format: str = "ndjson", db: Session = Depends(get_db)):
+    """
+    Generate all drawings of a project, streaming an event per finished item
+    
+    Events (one JSON object per line for ndjson, or SSE "event:/data:"):
+        start   - {'po_number', 'total'}
+        item    - {'index', 'item_number', 'type', 'file', 'download_url',
+                   'duration', 'cached', 'error', 'done', 'total'}
+        summary - {'total', 'generated', 'windows', 'doors', 'cached',
+                   'failed', 'errors', 'duration'}
+        error   - {'error'} if the batch itself failed
+    
+    Args:
+        po_number: Purchase order number to generate drawings for
+        format: 'ndjson' (default) or 'sse' (for EventSource)
+        
+    Returns:
+        Streaming response; finished sheets can be downloaded while the
+        rest are still rendering
+    """
+    if format not in STREAM_FORMATS:
+        raise HTTPException(status_code=400, detail=f"Unsupported format '{format}' (use ndjson or sse)")
+    
+    if not db.query(Project).filter_by(po_number=po_number).first():
+        raise HTTPException(status_code=404, detail=f"Project with PO number '{po_number}' not found")
+    
+    # Sync generator: Starlette iterates it in a worker thread
+    return StreamingResponse(
+        (_encode_event(event, format) for event in _project_drawing_events(po_number)),
+        media_type=STREAM_FORMATS[format],
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
+@router.get("/project/{po_number}/package")
+async def download_project_package(po_number: str, cover: bool = True, db: Session = Depends(get_db)):
+    """
+    Generate and download all drawings of a project as one multi-page PDF
+    
+    Args:
+        po_number: Purchase order number
+        cover: Include the cover schedule page listing all items
+        
+    Returns:
+        Package PDF file for download
+    """
+    try:
+        project = db.query(Project).filter_by(po_number=po_number).first()
+        
+        if not project:
+            raise ValueError(f"Project with PO number '{po_number}' not found")
+        
+        drawing_service = get_drawing_service()
+        package = drawing_service.generate_project_package(project, cover=cover)
+        
+        if package['path'] is None and package['errors']:
+            raise RuntimeError(f"All {len(package['errors'])} item(s) failed: {package['errors'][0]['error']}")
+        if package['path'] is None:
+            raise ValueError(f"No items found in project {po_number}")
+        
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Package generation failed: {str(e)}")
+    
+    return FileResponse(
+        package['path'],
+        media_type="application/pdf",
+        filename=os.path.basename(package['path']),
+        headers={
+            "X-Package-Windows": str(package['windows']),
+            "X-Package-Doors": str(package['doors']),
+            "X-Package-Skipped": str(len(package['errors']))
+        }
+    )
+
+
 @router.post("/window/{window_id}")
 async def generate_window_drawing(window_id: int, db: Session = Depends(get_db)):
     """
@@ -231,6 +370,188 @@ async def list_all_drawings():
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.get("/cache/stats")
+async def render_cache_stats():
+    """
+    Get render cache statistics
+    
+    Returns:
+        Hit/miss counters (this worker process) and shared disk usage
+    """
+    render_cache = get_render_cache()
+    if render_cache is None:
+        return {"enabled": False}
+    
+    return {"enabled": True, **render_cache.stats()}
+
+
+@router.post("/cache/invalidate")
+async def invalidate_render_cache():
+    """
+    Drop all cached drawings (call after changing the drawing template)
+    
+    Returns:
+        Number of cached drawings removed
+    """
+    render_cache = get_render_cache()
+    if render_cache is None:
+        raise HTTPException(status_code=503, detail="Render cache is disabled")
+    
+    try:
+        removed = render_cache.invalidate()
+        return {
+            "success": True,
+            "removed": removed,
+            "generation": render_cache.generation()
+        }
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Cache invalidation failed: {str(e)}")
+
+
+def _submit_render_job(kind: str, *args) -> Dict:
+    job_manager = get_job_manager()
+    if job_manager is None:
+        raise HTTPException(status_code=503, detail="Render jobs are not available")
+    
+    job_id = job_manager.submit(kind, *args)
+    return {
+        "success": True,
+        "job_id": job_id,
+        "kind": kind,
+        "state": "PENDING",
+        "executor": job_manager.backend,
+        "status_url": f"/api/drawings/jobs/{job_id}",
+        "result_url": f"/api/drawings/jobs/{job_id}/result"
+    }
+
+
+@router.post("/jobs/project/{po_number}", status_code=202)
+async def submit_project_render_job(po_number: str, db: Session = Depends(get_db)):
+    """
+    Queue rendering of all drawings of a project
+    
+    Args:
+        po_number: Purchase order number
+        
+    Returns:
+        Job ID and status/result URLs
+    """
+    if not db.query(Project).filter_by(po_number=po_number).first():
+        raise HTTPException(status_code=404, detail=f"Project with PO number '{po_number}' not found")
+    
+    try:
+        return _submit_render_job('project', po_number)
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Failed to queue render job: {str(e)}")
+
+
+@router.post("/jobs/window/{window_id}", status_code=202)
+async def submit_window_render_job(window_id: int, db: Session = Depends(get_db)):
+    """
+    Queue rendering of a single window drawing
+    
+    Args:
+        window_id: Database ID of the window
+        
+    Returns:
+        Job ID and status/result URLs
+    """
+    if not db.query(Window).filter_by(id=window_id).first():
+        raise HTTPException(status_code=404, detail=f"Window with ID {window_id} not found")
+    
+    try:
+        return _submit_render_job('window', window_id)
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Failed to queue render job: {str(e)}")
+
+
+@router.post("/jobs/door/{door_id}", status_code=202)
+async def submit_door_render_job(door_id: int, db: Session = Depends(get_db)):
+    """
+    Queue rendering of a single door drawing
+    
+    Args:
+        door_id: Database ID of the door
+        
+    Returns:
+        Job ID and status/result URLs
+    """
+    if not db.query(Door).filter_by(id=door_id).first():
+        raise HTTPException(status_code=404, detail=f"Door with ID {door_id} not found")
+    
+    try:
+        return _submit_render_job('door', door_id)
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Failed to queue render job: {str(e)}")
+
+
+@router.get("/jobs/{job_id}")
+async def get_render_job_status(job_id: str):
+    """
+    Get state and progress of a render job
+    
+    Args:
+        job_id: ID returned when the job was submitted
+        
+    Returns:
+        Job state (PENDING, PROGRESS, SUCCESS, FAILURE), progress
+        {'done', 'total'} and error message if it failed
+    """
+    job_manager = get_job_manager()
+    if job_manager is None:
+        raise HTTPException(status_code=503, detail="Render jobs are not available")
+    
+    job = job_manager.status(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Render job '{job_id}' not found")
+    
+    total = job['progress']['total']
+    return {
+        "job_id": job_id,
+        "kind": job['kind'],
+        "state": job['state'],
+        "progress": {
+            **job['progress'],
+            "percent": round(100 * job['progress']['done'] / total) if total else 0
+        },
+        "error": job['error'],
+        "result_url": f"/api/drawings/jobs/{job_id}/result"
+    }
+
+
+@router.get("/jobs/{job_id}/result")
+async def get_render_job_result(job_id: str):
+    """
+    Get the result of a finished render job
+    
+    Args:
+        job_id: ID returned when the job was submitted
+        
+    Returns:
+        Generated file names with download URLs (409 while still running)
+    """
+    job_manager = get_job_manager()
+    if job_manager is None:
+        raise HTTPException(status_code=503, detail="Render jobs are not available")
+    
+    job = job_manager.status(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Render job '{job_id}' not found")
+    
+    if job['state'] == 'FAILURE':
+        raise HTTPException(status_code=500, detail=f"Drawing generation failed: {job['error']}")
+    if job['state'] != 'SUCCESS':
+        raise HTTPException(status_code=409, detail=f"Render job is {job['state']}")
+    
+    return {"success": True, "job_id": job_id, **job['result']}
+
+
 @router.post("/generate")
 async def generate_drawing(drawing_params: dict):
     """
@@ -288,6 +609,14 @@ async def drawing_service_info():
             "Support for professional 3-column layout",
             "Specification tables and project metadata",
             "Batch project drawing generation",
+            "Streaming per-item progress for batch generation (NDJSON/SSE)",
+            "Multi-page project package PDF with cover schedule",
+            "Background render jobs with progress tracking",
+            "Binary canvas snapshot upload (multipart/raw) for reference PDFs",
+            "Snapshot output profiles (draft/standard/print) with size reporting headers",
+            "Server-side vector reference PDFs when no canvas snapshot is sent",
+            "Content-addressed, deduplicated storage for saved drawing PDFs",
+            "Chunked drawing downloads with ETag, Range and immutable caching",
             "PDF download and file management"
         ],
         "output_directory": drawings_dir,
@@ -295,23 +624,60 @@ async def drawing_service_info():
         "api_endpoints": {
             "generate": "POST /api/drawings/generate",
             "generate_reference": "POST /api/drawings/generate-pdf",
+            "generate_reference_upload": "POST /api/drawings/generate-pdf/upload (multipart or raw image body)",
             "generate_project": "POST /api/drawings/project/{po_number}/generate",
+            "generate_project_stream": "GET /api/drawings/project/{po_number}/generate/stream?format=ndjson|sse",
+            "project_package": "GET /api/drawings/project/{po_number}/package",
             "generate_window": "POST /api/drawings/window/{window_id}",
             "generate_door": "POST /api/drawings/door/{door_id}",
             "list_all": "GET /api/drawings/list/all",
             "download": "GET /api/drawings/download/{filename}",
+            "download_saved": "GET /api/drawings/{drawing_id}/download (ETag, Range)",
+            "cache_stats": "GET /api/drawings/cache/stats",
+            "cache_invalidate": "POST /api/drawings/cache/invalidate",
+            "job_project": "POST /api/drawings/jobs/project/{po_number}",
+            "job_window": "POST /api/drawings/jobs/window/{window_id}",
+            "job_door": "POST /api/drawings/jobs/door/{door_id}",
+            "job_status": "GET /api/drawings/jobs/{job_id}",
+            "job_result": "GET /api/drawings/jobs/{job_id}/result",
+            "blob_exists": "HEAD /api/drawings/blobs/{sha256}",
             "info": "GET /api/drawings/info"
         }
     }
 
 
-@router.post("/generate-pdf")
-async def generate_reference_pdf(params: DrawingParameters):
+def _output_stats_headers(stats: Dict) -> Dict[str, str]:
+    """Response headers reporting the render mode and how much the snapshot optimization saved"""
+    if not stats:
+        return {}
+    if stats['render_mode'] == 'vector':
+        return {"X-Render-Mode": "vector", "X-PDF-Bytes": str(stats['pdf_bytes'])}
+    snapshot_bytes = stats['snapshot_bytes']
+    reduction = (1 - stats['pdf_bytes'] / snapshot_bytes) * 100 if snapshot_bytes else 0.0
+    return {
+        "X-Render-Mode": stats['render_mode'],
+        "X-Output-Profile": stats['profile'],
+        "X-Snapshot-Bytes": str(snapshot_bytes),
+        "X-Snapshot-Pixels": "{}x{}".format(*stats['snapshot_pixels']),
+        "X-Embedded-Pixels": "{}x{}".format(*stats['embedded_pixels']),
+        "X-Embedded-Color": stats['embedded_mode'],
+        "X-PDF-Bytes": str(stats['pdf_bytes']),
+        # Negative when the PDF is larger than the uploaded image
+        "X-Size-Reduction": f"{reduction:.1f}%",
+    }
+
+
+def _reference_pdf_response(params: DrawingParameters, snapshot=None) -> StreamingResponse:
     """
-    Generate A3 landscape shop drawing in PDF format with exact reference layout
+    Render a reference-layout PDF and wrap it in a response
+    
+    Args:
+        params: Drawing parameters
+        snapshot: Binary stream of the canvas image (None = params.imageSnapshot,
+            or a server-side vector render when that is empty too)
     
     Returns:
-        PDF document matching Raven's reference layout exactly
+        Inline PDF StreamingResponse
     """
     import logging
     logger = logging.getLogger(__name__)
@@ -330,26 +696,30 @@ async def generate_reference_pdf(params: DrawingParameters):
             raise ValueError(f"Invalid height: {params.height}")
         
         # Create drawing generator
+        parameters = params.dict()
+        parameters['outputProfile'] = params.outputProfile or settings.SNAPSHOT_OUTPUT_PROFILE
         generator = ReferenceShopDrawingGenerator(
             db_connection=None,  # Database optional
-            parameters=params.dict()
+            parameters=parameters
         )
         
         # Generate PDF
         logger.debug("Starting PDF generation")
-        pdf_buffer = generator.generate_pdf()
+        pdf_buffer = generator.generate_pdf(snapshot)
         
-        if not pdf_buffer or pdf_buffer.tell() == 0:
+        pdf_size = pdf_buffer.getbuffer().nbytes if pdf_buffer else 0
+        if pdf_size == 0:
             raise RuntimeError("PDF buffer is empty")
         
-        logger.info(f"PDF generated successfully: {pdf_buffer.tell()} bytes")
+        logger.info(f"PDF generated successfully: {pdf_size} bytes")
         
         # Return as streaming PDF response
         return StreamingResponse(
             pdf_buffer,
             media_type="application/pdf",
             headers={
-                "Content-Disposition": f"inline; filename={params.item_number}_drawing.pdf"
+                "Content-Disposition": f"inline; filename={params.item_number}_drawing.pdf",
+                **_output_stats_headers(generator.output_stats)
             }
         )
         
@@ -374,6 +744,112 @@ async def generate_reference_pdf(params: DrawingParameters):
                 detail=f"Failed to generate drawing: {error_msg}"
             )
 
+
+@router.post("/generate-pdf")
+async def generate_reference_pdf(params: DrawingParameters):
+    """
+    Generate A3 landscape shop drawing in PDF format with exact reference layout
+    
+    Embeds imageSnapshot when given; otherwise the layout is rendered
+    server-side as a vector PDF (X-Render-Mode: vector).
+    
+    Returns:
+        PDF document matching Raven's reference layout exactly
+    """
+    return _reference_pdf_response(params)
+
+
+# Raw request bodies accepted as a snapshot by /generate-pdf/upload
+SNAPSHOT_CONTENT_TYPES = ("image/png", "image/jpeg", "image/webp", "application/octet-stream")
+
+# Snapshot bytes kept in memory before spooling to a temp file
+SNAPSHOT_SPOOL_BYTES = 1024 * 1024
+
+
+class SnapshotTooLarge(Exception):
+    """Upload exceeded SNAPSHOT_MAX_UPLOAD_MB"""
+
+
+def _limited_receive(receive, limit: int):
+    """Wrap an ASGI receive channel so reading more than limit body bytes raises"""
+    received = 0
+    
+    async def limited():
+        nonlocal received
+        message = await receive()
+        if message["type"] == "http.request":
+            received += len(message.get("body", b""))
+            if received > limit:
+                raise SnapshotTooLarge(f"Snapshot exceeds {limit // (1024 * 1024)} MB limit")
+        return message
+    
+    return limited
+
+
+@router.post("/generate-pdf/upload")
+async def generate_reference_pdf_upload(request: Request, parameters: Optional[str] = None):
+    """
+    Generate a reference-layout PDF from a binary canvas snapshot
+    
+    Same result as /generate-pdf without Base64 in JSON: the image bytes are
+    streamed into a spooled buffer and handed to ReportLab as-is.
+    
+    Body (either):
+        multipart/form-data: "snapshot" file part + optional "parameters" JSON field
+        image/png, image/jpeg, image/webp or application/octet-stream: raw image bytes
+            (DrawingParameters as JSON in the ?parameters= query string)
+    
+    Args:
+        parameters: DrawingParameters as a JSON object (imageSnapshot is ignored)
+    
+    Returns:
+        PDF document (413 if the snapshot exceeds SNAPSHOT_MAX_UPLOAD_MB)
+    """
+    limit = settings.SNAPSHOT_MAX_UPLOAD_MB * 1024 * 1024
+    content_length = request.headers.get("content-length", "")
+    if content_length.isdigit() and int(content_length) > limit:
+        raise HTTPException(status_code=413, detail=f"Snapshot exceeds {settings.SNAPSHOT_MAX_UPLOAD_MB} MB limit")
+    
+    content_type = request.headers.get("content-type", "").split(";")[0].strip().lower()
+    limited_request = Request(request.scope, _limited_receive(request.receive, limit))
+    form = None
+    snapshot = None
+    
+    try:
+        try:
+            if content_type == "multipart/form-data":
+                form = await limited_request.form(max_files=1)
+                upload = form.get("snapshot")
+                if upload is None or isinstance(upload, str):
+                    raise HTTPException(status_code=400, detail="Missing 'snapshot' file part")
+                snapshot = upload.file
+                parameters = form.get("parameters") or parameters
+            elif content_type in SNAPSHOT_CONTENT_TYPES:
+                snapshot = tempfile.SpooledTemporaryFile(max_size=SNAPSHOT_SPOOL_BYTES)
+                async for chunk in limited_request.stream():
+                    snapshot.write(chunk)
+            else:
+                raise HTTPException(
+                    status_code=415,
+                    detail=f"Unsupported content type '{content_type}' (expected multipart/form-data or an image)"
+                )
+        except SnapshotTooLarge as e:
+            raise HTTPException(status_code=413, detail=str(e))
+        
+        snapshot.seek(0)
+        try:
+            params = DrawingParameters(**json.loads(parameters)) if parameters else DrawingParameters()
+        except (ValueError, TypeError) as e:
+            raise HTTPException(status_code=400, detail=f"Invalid parameters: {str(e)}")
+        params.imageSnapshot = None
+        
+        return _reference_pdf_response(params, snapshot)
+    finally:
+        if form is not None:
+            await form.close()
+        elif snapshot is not None:
+            snapshot.close()
+
 # ===========================
 # Drawing Persistence Endpoints
 # ===========================
@@ -382,7 +858,9 @@ class SaveDrawingRequest(BaseModel):
     """Request to save a drawing to the database"""
     unitId: int
     projectId: int
-    pdfBase64: str  # Base64 encoded PDF
+    pdfBase64: Optional[str] = None  # Base64 encoded PDF
+    pdfSha256: Optional[str] = None  # Hash of a PDF already in the blob store (see HEAD /blobs/{sha})
+    pdfContentType: str = "application/pdf"
     parameters: dict  # Drawing parameters snapshot
 
 
@@ -392,6 +870,31 @@ class SaveDrawingResponse(BaseModel):
     drawingId: int
     version: int
     message: str
+    pdfSha256: Optional[str] = None
+    deduplicated: bool = False
+
+
+@router.head("/blobs/{sha256}")
+async def head_blob(sha256: str):
+    """
+    Check whether the blob store already has a PDF, before uploading it
+    
+    Args:
+        sha256: Hex SHA-256 of the PDF bytes
+    
+    Returns:
+        200 with Content-Length if stored (save with pdfSha256 instead of
+        pdfBase64), 404 otherwise
+    """
+    try:
+        sha256 = validate_sha256(sha256)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    size = get_blob_store().size(sha256)
+    if size is None:
+        raise HTTPException(status_code=404, detail=f"Blob {sha256} not found")
+    return Response(status_code=200, headers={"Content-Length": str(size), "ETag": f'"{sha256}"'})
 
 
 @router.post("/save", response_model=SaveDrawingResponse)
@@ -399,6 +902,10 @@ async def save_drawing(data: SaveDrawingRequest, db: Session = Depends(get_db)):
     """
     Save a generated drawing to the database.
     Creates a new version if drawing already exists for this unit.
+    
+    The PDF bytes go to the blob store (deduplicated by SHA-256); the row
+    only records the hash. Send pdfSha256 without pdfBase64 to reuse a
+    blob the server already has.
     """
     try:
         print(f"💾 Saving drawing for unit {data.unitId}, project {data.projectId}")
@@ -412,71 +919,62 @@ async def save_drawing(data: SaveDrawingRequest, db: Session = Depends(get_db)):
         if not project:
             raise HTTPException(status_code=404, detail=f"Project {data.projectId} not found")
         
-        # Decode PDF from base64
-        pdf_blob = base64.b64decode(data.pdfBase64)
+        # Store the PDF (or reference an already stored one) by content hash
+        blob_store = get_blob_store()
+        deduplicated = False
+        try:
+            expected_sha = validate_sha256(data.pdfSha256) if data.pdfSha256 else None
+            if data.pdfBase64:
+                pdf_bytes = base64.b64decode(data.pdfBase64)
+                if expected_sha and expected_sha != blob_sha256(pdf_bytes):
+                    raise ValueError("pdfSha256 does not match the uploaded PDF")
+                pdf_sha256, stored = blob_store.put(pdf_bytes)
+                deduplicated = not stored
+            elif expected_sha:
+                pdf_sha256 = expected_sha
+                deduplicated = True
+            else:
+                raise ValueError("pdfBase64 or pdfSha256 is required")
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
         
-        # Check if drawing already exists for this unit
-        existing_count_query = text(
-            "SELECT COUNT(*) FROM drawings WHERE unit_id = :uid"
-        )
-        existing_count = db.execute(existing_count_query, {"uid": data.unitId}).scalar() or 0
-        
-        # If exists, mark old drawings as not current
-        if existing_count > 0:
-            update_query = text(
-                "UPDATE drawings SET is_current = 0 WHERE unit_id = :uid"
-            )
-            db.execute(update_query, {"uid": data.unitId})
-        
-        # Calculate new version number
-        new_version = existing_count + 1
+        pdf_size = blob_store.size(pdf_sha256)
+        if pdf_size is None:
+            raise HTTPException(status_code=404, detail=f"Blob {pdf_sha256} not found - upload pdfBase64")
         
-        # Generate filename
+        # Next version + current flag + insert in one transaction
         params = data.parameters
-        filename = f"drawing_{data.projectId}_{data.unitId}_v{new_version}_{params.get('series', '')}_{params.get('width', 0)}x{params.get('height', 0)}.pdf"
-        
-        # Create new drawing record
-        insert_query = text("""
-            INSERT INTO drawings (
-                unit_id, project_id, pdf_filename, pdf_blob,
-                series, product_type, width, height, glass_type, frame_color, configuration,
-                version, is_current, created_at
-            ) VALUES (
-                :unit_id, :project_id, :pdf_filename, :pdf_blob,
-                :series, :product_type, :width, :height, :glass_type, :frame_color, :configuration,
-                :version, :is_current, :created_at
-            )
-        """)
-        
-        db.execute(insert_query, {
-            "unit_id": data.unitId,
-            "project_id": data.projectId,
-            "pdf_filename": filename,
-            "pdf_blob": pdf_blob,
-            "series": params.get('series', ''),
-            "product_type": params.get('productType', ''),
-            "width": params.get('width', 0),
-            "height": params.get('height', 0),
-            "glass_type": params.get('glassType', ''),
-            "frame_color": params.get('frameColor', ''),
-            "configuration": params.get('configuration', ''),
-            "version": new_version,
-            "is_current": 1,
-            "created_at": datetime.now()
-        })
-        db.commit()
-        
-        # Get the newly created drawing ID
-        drawing_id_query = text("SELECT last_insert_rowid()")
-        drawing_id = db.execute(drawing_id_query).scalar()
+        drawing_id, new_version = drawing_repository.create_drawing_version(
+            db,
+            data.unitId,
+            f"drawing_{data.projectId}_{data.unitId}_v{{version}}_{params.get('series', '')}_"
+            f"{params.get('width', 0)}x{params.get('height', 0)}.pdf",
+            {
+                "project_id": data.projectId,
+                "pdf_sha256": pdf_sha256,
+                "pdf_size": pdf_size,
+                "pdf_content_type": data.pdfContentType,
+                "series": params.get('series', ''),
+                "product_type": params.get('productType', ''),
+                "width": params.get('width', 0),
+                "height": params.get('height', 0),
+                "glass_type": params.get('glassType', ''),
+                "frame_color": params.get('frameColor', ''),
+                "configuration": params.get('configuration', ''),
+                "created_at": datetime.now()
+            }
+        )
         
-        print(f"✅ Drawing {drawing_id} saved (version {new_version})")
+        print(f"✅ Drawing {drawing_id} saved (version {new_version}, blob {pdf_sha256[:12]}"
+              f"{', deduplicated' if deduplicated else ''})")
         
         return {
             "success": True,
             "drawingId": drawing_id,
             "version": new_version,
-            "message": f"Drawing saved successfully (version {new_version})"
+            "message": f"Drawing saved successfully (version {new_version})",
+            "pdfSha256": pdf_sha256,
+            "deduplicated": deduplicated
         }
     
     except HTTPException:
@@ -493,23 +991,16 @@ async def save_drawing(data: SaveDrawingRequest, db: Session = Depends(get_db)):
 async def get_current_drawing(unit_id: int, db: Session = Depends(get_db)):
     """Get the current (latest) drawing for a unit."""
     try:
-        query = text("""
-            SELECT id, pdf_filename, version, created_at
-            FROM drawings
-            WHERE unit_id = :uid AND is_current = 1
-            ORDER BY version DESC
-            LIMIT 1
-        """)
-        result = db.execute(query, {"uid": unit_id}).fetchone()
-        
-        if not result:
+        drawing = drawing_repository.get_current_drawing(db, unit_id)
+        
+        if not drawing:
             raise HTTPException(status_code=404, detail=f"No drawing found for unit {unit_id}")
         
         return {
-            "drawingId": result[0],
-            "filename": result[1],
-            "version": result[2],
-            "createdAt": result[3].isoformat() if result[3] else None
+            "drawingId": drawing.id,
+            "filename": drawing.pdf_filename,
+            "version": drawing.version,
+            "createdAt": drawing.created_at.isoformat() if drawing.created_at else None
         }
     
     except HTTPException:
@@ -523,22 +1014,14 @@ async def get_current_drawing(unit_id: int, db: Session = Depends(get_db)):
 async def get_drawing_versions(unit_id: int, db: Session = Depends(get_db)):
     """Get all drawing versions for a unit."""
     try:
-        query = text("""
-            SELECT id, pdf_filename, version, is_current, created_at
-            FROM drawings
-            WHERE unit_id = :uid
-            ORDER BY version DESC
-        """)
-        results = db.execute(query, {"uid": unit_id}).fetchall()
-        
         versions = []
-        for row in results:
+        for drawing in drawing_repository.list_drawing_versions(db, unit_id):
             versions.append({
-                "drawingId": row[0],
-                "filename": row[1],
-                "version": row[2],
-                "isCurrent": bool(row[3]),
-                "createdAt": row[4].isoformat() if row[4] else None
+                "drawingId": drawing.id,
+                "filename": drawing.pdf_filename,
+                "version": drawing.version,
+                "isCurrent": bool(drawing.is_current),
+                "createdAt": drawing.created_at.isoformat() if drawing.created_at else None
             })
         
         return {"versions": versions}
@@ -548,26 +1031,97 @@ async def get_drawing_versions(unit_id: int, db: Session = Depends(get_db)):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+# Bytes read from the blob store per streamed chunk
+DOWNLOAD_CHUNK_BYTES = 256 * 1024
+
+
+def _iter_byte_range(stream, start: int, length: int) -> Iterator[bytes]:
+    """Yield length bytes of stream from start in chunks, then close it"""
+    try:
+        stream.seek(start)
+        while length > 0:
+            chunk = stream.read(min(DOWNLOAD_CHUNK_BYTES, length))
+            if not chunk:
+                break
+            length -= len(chunk)
+            yield chunk
+    finally:
+        stream.close()
+
+
 @router.get("/{drawing_id}/download")
-async def download_drawing(drawing_id: int, db: Session = Depends(get_db)):
-    """Download a specific drawing as PDF."""
+async def download_drawing(drawing_id: int, request: Request, db: Session = Depends(get_db)):
+    """
+    Download a specific drawing as PDF.
+    
+    The PDF is streamed from the blob store in chunks. Saved versions never
+    change, so responses carry the content hash as a strong ETag with
+    immutable private caching; If-None-Match is answered with 304 and a
+    single Range (honouring If-Range) with 206 Partial Content.
+    """
     try:
-        query = text("""
-            SELECT pdf_blob, pdf_filename
-            FROM drawings
-            WHERE id = :did
-        """)
-        result = db.execute(query, {"did": drawing_id}).fetchone()
-        
-        if not result:
+        drawing = drawing_repository.get_drawing_metadata(db, drawing_id)
+        
+        if not drawing:
             raise HTTPException(status_code=404, detail=f"Drawing {drawing_id} not found")
         
-        pdf_blob, filename = result
+        pdf_sha256, pdf_size = drawing.pdf_sha256, drawing.pdf_size
+        content_type, filename = drawing.pdf_content_type, drawing.pdf_filename
+        if pdf_sha256:
+            blob_store = get_blob_store()
+            if pdf_size is None:
+                pdf_size = blob_store.size(pdf_sha256)
+                if pdf_size is None:
+                    raise HTTPException(status_code=404, detail=f"PDF for drawing {drawing_id} is missing from the blob store")
+            open_stream = lambda: blob_store.open(pdf_sha256)
+        else:
+            # Row saved before the blob store and not migrated yet
+            pdf_blob = drawing_repository.read_legacy_pdf(db, drawing_id)
+            if pdf_blob is None:
+                raise HTTPException(status_code=404, detail=f"Drawing {drawing_id} has no PDF")
+            pdf_sha256, pdf_size = blob_sha256(pdf_blob), len(pdf_blob)
+            open_stream = lambda: io.BytesIO(pdf_blob)
         
-        return Response(
-            content=pdf_blob,
-            media_type="application/pdf",
-            headers={"Content-Disposition": f"attachment; filename={filename}"}
+        etag = f'"{pdf_sha256}"'
+        headers = {
+            "ETag": etag,
+            "Cache-Control": PRIVATE_IMMUTABLE_CACHE_CONTROL,
+            "Accept-Ranges": "bytes",
+            "Content-Disposition": f"attachment; filename={filename}",
+        }
+        if etag_matches(request.headers.get("if-none-match"), etag):
+            return Response(status_code=304, headers=headers)
+        
+        # If-Range: only send the partial content if the client's copy is still current
+        byte_range = None
+        if_range = request.headers.get("if-range")
+        if if_range is None or if_range.strip() == etag:
+            try:
+                byte_range = parse_range(request.headers.get("range"), pdf_size)
+            except RangeNotSatisfiable:
+                return Response(
+                    status_code=416,
+                    headers={**headers, "Content-Range": f"bytes */{pdf_size}"}
+                )
+        
+        try:
+            stream = open_stream()
+        except FileNotFoundError:
+            raise HTTPException(status_code=404, detail=f"PDF for drawing {drawing_id} is missing from the blob store")
+        
+        if byte_range is None:
+            start, length, status_code = 0, pdf_size, 200
+        else:
+            start, end = byte_range
+            length, status_code = end - start + 1, 206
+            headers["Content-Range"] = f"bytes {start}-{end}/{pdf_size}"
+        headers["Content-Length"] = str(length)
+        
+        return StreamingResponse(
+            _iter_byte_range(stream, start, length),
+            status_code=status_code,
+            media_type=content_type or "application/pdf",
+            headers=headers
         )
     
     except HTTPException:
@@ -5,6 +5,9 @@ from pathlib import Path
 import logging
 import os
 
+from app.http_caching import cached_json_response, make_etag
+from services.asset_manifest import get_asset_manifest
+
 router = APIRouter(prefix="/api/frames", tags=["frames"])
 logger = logging.getLogger(__name__)
 
@@ -44,6 +47,59 @@ VIEW_TYPES = {
     "PLAN": {"label": "Plan", "color": "#9b59b6", "required": False},
 }
 
+# Product types offered in the unit editor
+PRODUCT_TYPES = {
+    "doors": [
+        {"value": "Standard Sliding Door", "label": "Standard Sliding Door"},
+        {"value": "Lift Slide Door", "label": "Lift Slide Door"},
+        {"value": "Slim Frame Interior Door", "label": "Slim Frame Interior Door"},
+        {"value": "Slim Frame Sliding Door", "label": "Slim Frame Sliding Door"},
+        {"value": "Casement Door", "label": "Casement Door"},
+        {"value": "Pivot Door", "label": "Pivot Door"},
+    ],
+    "windows": [
+        {"value": "Fixed Window", "label": "Fixed Window"},
+        {"value": "Standard Sliding Window", "label": "Standard Sliding Window"},
+        {"value": "Slim Frame Casement Window", "label": "Slim Frame Casement Window"},
+    ]
+}
+
+# Swing orientations per product type
+SWING_ORIENTATIONS = {
+    "Casement Door": [
+        {"value": "Left Hand Inswing", "label": "Left Hand Inswing"},
+        {"value": "Right Hand Inswing", "label": "Right Hand Inswing"},
+        {"value": "Left Hand Outswing", "label": "Left Hand Outswing"},
+        {"value": "Right Hand Outswing", "label": "Right Hand Outswing"},
+        {"value": "Double Door Inswing", "label": "Double Door Inswing"},
+        {"value": "Double Door Outswing", "label": "Double Door Outswing"},
+    ],
+    "Pivot Door": [
+        {"value": "Pivot Left", "label": "Pivot Left"},
+        {"value": "Pivot Right", "label": "Pivot Right"},
+    ],
+    "Slim Frame Casement Window": [
+        {"value": "Left Hand", "label": "Left Hand"},
+        {"value": "Right Hand", "label": "Right Hand"},
+    ],
+    "Slim Frame Sliding Door": [
+        {"value": "2 Panel", "label": "2 Panel"},
+        {"value": "4 Panel", "label": "4 Panel"},
+    ],
+    "Standard Sliding Door": [
+        {"value": "2 Panel", "label": "2 Panel"},
+    ],
+    "Lift Slide Door": [
+        {"value": "2 Panel", "label": "2 Panel"},
+    ],
+    "Standard Sliding Window": [
+        {"value": "2 Panel", "label": "2 Panel"},
+    ],
+}
+
+# Version of the static catalog above (part of every catalog ETag)
+CATALOG_VERSION = make_etag(FRAME_SERIES, VIEW_TYPES, PRODUCT_TYPES, SWING_ORIENTATIONS)
+
 
 def get_assets_dir() -> Path:
     """Get path to static frames directory."""
@@ -57,52 +113,47 @@ def get_frame_library_dir() -> Path:
 
 def check_image_exists(series_id: str, view_type: str) -> bool:
     """Check if image file exists for series and view type in either location."""
-    # Check standard naming in static/frames (series-86-head.png)
-    assets_dir = get_assets_dir()
+    manifest = get_asset_manifest()
     SERIES_PREFIX = "Series "
     clean_series_id = series_id.replace(SERIES_PREFIX, "").strip()
+    
+    # Check standard naming in static/frames (series-86-head.png)
     filename = f"series-{clean_series_id}-{view_type.lower()}.png"
-    filepath = assets_dir / filename
-    if filepath.exists():
+    if manifest.has("static/frames", filename):
         return True
     
     # Check variant naming in frame_library (Series_86_a.PNG)
-    library_dir = get_frame_library_dir()
     # For variants like a, b, c, d check if any exist
     if view_type.lower() in ['head', 'sill', 'jamb', 'elevation', 'plan']:
         # These are standard views - check first variant
         variant_filename = f"Series_{clean_series_id}_a.PNG"
-        variant_filepath = library_dir / variant_filename
-        return variant_filepath.exists()
+        return manifest.has("frame_library", variant_filename)
     
     return False
 
 
 def get_image_url(series_id: str, view_type: str, request: Request = None):
     """Get image URL for series and view type, checking both locations."""
-    # Check standard naming in static/frames
-    assets_dir = get_assets_dir()
+    manifest = get_asset_manifest()
     SERIES_PREFIX = "Series "
     clean_series_id = series_id.replace(SERIES_PREFIX, "").strip()
     filename = f"series-{clean_series_id}-{view_type.lower()}.png"
-    filepath = assets_dir / filename
     
     base_url = get_backend_url(request)
     
-    if filepath.exists():
+    # Check standard naming in static/frames
+    if manifest.has("static/frames", filename):
         # Return full URL with backend host for cross-origin requests
-        return f"{base_url}/static/frames/series-{clean_series_id}-{view_type.lower()}.png"
+        return f"{base_url}/static/frames/{filename}"
     
     # Check variant naming in frame_library
-    library_dir = get_frame_library_dir()
     if view_type.lower() in ['head', 'sill', 'jamb', 'elevation', 'plan']:
         # Map view types to variant letters (use 'a' variant as default/thumbnail)
         variant_filename = f"Series_{clean_series_id}_a.PNG"
-        variant_filepath = library_dir / variant_filename
         
-        if variant_filepath.exists():
+        if manifest.has("frame_library", variant_filename):
             # Return full URL with backend host for cross-origin requests
-            return f"{base_url}/frame-library/Series_{clean_series_id}_a.PNG"
+            return f"{base_url}/frame-library/{variant_filename}"
     
     return None
 
@@ -121,25 +172,13 @@ def get_series_images(series_id: str, request: Request = None):
     }
 
 
-@router.get("/series")
-def get_series():
-    """Get list of available frame series."""
-    try:
-        return {"series": list(FRAME_SERIES.keys())}
-    except Exception as e:
-        logger.error(f"Error getting series: {e}")
-        return {"series": list(FRAME_SERIES.keys())}
-
-
-@router.get("/test")
-def test_endpoint():
-    """Simple test endpoint."""
-    return {"status": "test works"}
+def images_etag(name: str, request: Request = None) -> str:
+    """ETag for responses containing image URLs (catalog + files on disk + URL host)."""
+    return make_etag(name, CATALOG_VERSION, get_asset_manifest().version, get_backend_url(request))
 
 
-@router.get("/series-with-images")
-def get_series_with_images(request: Request):
-    """Get all series with their available images (multi-view support)."""
+def build_series_with_images(request: Request = None):
+    """Build the series list with their available images."""
     try:
         series_list = []
         for series_id in FRAME_SERIES.keys():
@@ -173,10 +212,51 @@ def get_series_with_images(request: Request):
         }
 
 
+@router.get("/series")
+def get_series(request: Request):
+    """Get list of available frame series."""
+    return cached_json_response(
+        request,
+        make_etag("series", CATALOG_VERSION),
+        lambda: {"series": list(FRAME_SERIES.keys())}
+    )
+
+
+@router.get("/test")
+def test_endpoint():
+    """Simple test endpoint."""
+    return {"status": "test works"}
+
+
+@router.get("/series-with-images")
+def get_series_with_images(request: Request):
+    """Get all series with their available images (multi-view support)."""
+    return cached_json_response(
+        request,
+        images_etag("series-with-images", request),
+        lambda: build_series_with_images(request)
+    )
+
+
 @router.get("/view-types")
-def get_view_types():
+def get_view_types(request: Request):
     """Get view type configuration."""
-    return VIEW_TYPES
+    return cached_json_response(request, make_etag("view-types", CATALOG_VERSION), lambda: VIEW_TYPES)
+
+
+@router.get("/catalog")
+def get_catalog(request: Request):
+    """
+    Get the whole frame catalog in one round trip
+    (series with images, view types, product types, swing orientations).
+    """
+    def build():
+        catalog = build_series_with_images(request)
+        catalog["product_types"] = PRODUCT_TYPES
+        catalog["swing_orientations"] = SWING_ORIENTATIONS
+        return catalog
+    
+    return cached_json_response(request, images_etag("catalog", request), build)
 
 
 @router.get("/check-images")
@@ -248,7 +328,7 @@ def get_series_variants(series_id: str, request: Request):
     if series_id not in FRAME_SERIES:
         return {"error": f"Series {series_id} not found"}, 404
     
-    library_dir = get_frame_library_dir()
+    library_files = get_asset_manifest().files("frame_library")
     clean_series_id = series_id.replace("Series ", "").strip()
     base_url = get_backend_url(request)
     
@@ -257,9 +337,8 @@ def get_series_variants(series_id: str, request: Request):
     
     for letter in variant_letters:
         filename = f"Series_{clean_series_id}_{letter}.PNG"
-        filepath = library_dir / filename
         
-        if filepath.exists():
+        if filename in library_files:
             variants.append({
                 "variant": letter,
                 "url": f"{base_url}/frame-library/{filename}",
@@ -274,61 +353,38 @@ def get_series_variants(series_id: str, request: Request):
     }
 
 
+@router.get("/manifest")
+def get_manifest_stats():
+    """Get the in-memory asset manifest (file counts per directory)."""
+    return get_asset_manifest().stats()
+
+
+@router.post("/manifest/refresh")
+def refresh_manifest():
+    """Re-list all frame asset directories (admin: call after uploading images)."""
+    try:
+        counts = get_asset_manifest().refresh(force=True)
+        return {"success": True, "files": counts}
+    except Exception as e:
+        logger.error(f"Error refreshing asset manifest: {e}")
+        return {"success": False, "error": str(e)}
+
+
 @router.get("/product-types")
-def get_product_types():
+def get_product_types(request: Request):
     """Get list of available product types for doors and windows."""
-    return {
-        "product_types": {
-            "doors": [
-                {"value": "Standard Sliding Door", "label": "Standard Sliding Door"},
-                {"value": "Lift Slide Door", "label": "Lift Slide Door"},
-                {"value": "Slim Frame Interior Door", "label": "Slim Frame Interior Door"},
-                {"value": "Slim Frame Sliding Door", "label": "Slim Frame Sliding Door"},
-                {"value": "Casement Door", "label": "Casement Door"},
-                {"value": "Pivot Door", "label": "Pivot Door"},
-            ],
-            "windows": [
-                {"value": "Fixed Window", "label": "Fixed Window"},
-                {"value": "Standard Sliding Window", "label": "Standard Sliding Window"},
-                {"value": "Slim Frame Casement Window", "label": "Slim Frame Casement Window"},
-            ]
-        }
-    }
+    return cached_json_response(
+        request,
+        make_etag("product-types", CATALOG_VERSION),
+        lambda: {"product_types": PRODUCT_TYPES}
+    )
 
 
 @router.get("/swing-orientations")
-def get_swing_orientations():
+def get_swing_orientations(request: Request):
     """Get list of available swing orientations based on product type."""
-    return {
-        "swing_orientations": {
-            "Casement Door": [
-                {"value": "Left Hand Inswing", "label": "Left Hand Inswing"},
-                {"value": "Right Hand Inswing", "label": "Right Hand Inswing"},
-                {"value": "Left Hand Outswing", "label": "Left Hand Outswing"},
-                {"value": "Right Hand Outswing", "label": "Right Hand Outswing"},
-                {"value": "Double Door Inswing", "label": "Double Door Inswing"},
-                {"value": "Double Door Outswing", "label": "Double Door Outswing"},
-            ],
-            "Pivot Door": [
-                {"value": "Pivot Left", "label": "Pivot Left"},
-                {"value": "Pivot Right", "label": "Pivot Right"},
-            ],
-            "Slim Frame Casement Window": [
-                {"value": "Left Hand", "label": "Left Hand"},
-                {"value": "Right Hand", "label": "Right Hand"},
-            ],
-            "Slim Frame Sliding Door": [
-                {"value": "2 Panel", "label": "2 Panel"},
-                {"value": "4 Panel", "label": "4 Panel"},
-            ],
-            "Standard Sliding Door": [
-                {"value": "2 Panel", "label": "2 Panel"},
-            ],
-            "Lift Slide Door": [
-                {"value": "2 Panel", "label": "2 Panel"},
-            ],
-            "Standard Sliding Window": [
-                {"value": "2 Panel", "label": "2 Panel"},
-            ],
-        }
-    }
+    return cached_json_response(
+        request,
+        make_etag("swing-orientations", CATALOG_VERSION),
+        lambda: {"swing_orientations": SWING_ORIENTATIONS}
+    )
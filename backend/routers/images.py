@@ -0,0 +1,96 @@
+"""
+Image variant routes
+Resized WebP/PNG variants of the frame library, static and asset images
+"""
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.responses import FileResponse, Response
+from typing import Optional
+from urllib.parse import quote, urlencode
+
+from app.http_caching import IMMUTABLE_CACHE_CONTROL, cache_control, etag_matches, make_etag
+from app.config import settings
+from app.services.image_variants import (
+    ENCODER_VERSION, FORMATS, get_image_variant_service, negotiate_format, snap_width
+)
+
+router = APIRouter(prefix="/api/images", tags=["images"])
+
+
+@router.get("/stats")
+async def get_image_variant_stats():
+    """
+    Get image variant cache statistics
+    
+    Returns:
+        Variant count, disk usage and generation counters
+    """
+    try:
+        return get_image_variant_service().stats()
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Failed to read image cache: {str(e)}")
+
+
+@router.get("/{mount}/{path:path}")
+async def get_image_variant(
+    mount: str,
+    path: str,
+    request: Request,
+    w: Optional[int] = None,
+    v: Optional[str] = None,
+    format: Optional[str] = None
+):
+    """
+    Serve an image resized and re-encoded for the client
+    
+    Args:
+        mount: Image root ('frame-library', 'static' or 'assets')
+        path: Image path inside the mount (e.g., Series_86_a.PNG)
+        w: Width in pixels (rounded up to a standard size; omitted = original)
+        v: Content version; when it matches the image the response is cached as immutable
+        format: Force 'webp' or 'png' (default: negotiated from the Accept header)
+    
+    Returns:
+        WebP or PNG image (304 if the client's copy is current)
+    """
+    service = get_image_variant_service()
+    
+    try:
+        source = service.resolve(mount, path)
+    except FileNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    if format is not None and format not in FORMATS:
+        raise HTTPException(status_code=400, detail=f"Unsupported format '{format}' (expected one of {list(FORMATS)})")
+    fmt = format or negotiate_format(request.headers.get("accept"))
+    width = snap_width(w)
+    
+    try:
+        version = service.version(source)
+        etag = make_etag(version, width, fmt, ENCODER_VERSION)
+        
+        if v == version:
+            cache_header = IMMUTABLE_CACHE_CONTROL
+        else:
+            cache_header = cache_control(settings.IMAGE_VARIANT_MAX_AGE)
+        
+        query = {key: value for key, value in (("w", width), ("v", version), ("format", format)) if value}
+        headers = {
+            "ETag": etag,
+            "Cache-Control": cache_header,
+            # Vary only matters when the format was negotiated
+            **({} if format else {"Vary": "Accept"}),
+            # Versioned URL clients can switch to for immutable caching
+            "Content-Location": f"{router.prefix}/{mount}/{quote(path)}?{urlencode(query)}",
+        }
+        
+        if etag_matches(request.headers.get("if-none-match"), etag):
+            return Response(status_code=304, headers=headers)
+        
+        variant_path, media_type, _ = service.get_variant(source, width, fmt)
+        return FileResponse(variant_path, media_type=media_type, headers=headers)
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Image variant failed: {str(e)}")
@@ -0,0 +1,159 @@
+"""
+Frame Asset Manifest
+In-memory listing of the frame image directories, so the frames API can
+answer "does this image exist" without touching the disk per request
+
+Each root directory is listed once and re-listed only when its mtime
+changes (files added, removed or renamed). The mtime check itself runs at
+most once per refresh interval; refresh(force=True) re-lists everything.
+
+version is a hash of the listed names, identical across worker processes
+that see the same files (usable in ETags).
+"""
+import hashlib
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Dict, FrozenSet, Optional
+
+# Backend directory (roots are relative to it)
+BACKEND_DIR = Path(__file__).parent.parent
+
+# Manifest root name -> directory
+ASSET_ROOTS = {
+    'static/frames': BACKEND_DIR / 'static' / 'frames',
+    'frame_library': BACKEND_DIR / 'frame_library',
+    'assets/frames': BACKEND_DIR / 'assets' / 'frames',
+}
+
+# Seconds between directory mtime checks
+REFRESH_INTERVAL_SECONDS = 5.0
+
+
+class AssetManifest:
+    """
+    Thread-safe set of file names per asset root
+
+    Usage:
+        manifest = AssetManifest(ASSET_ROOTS)
+        if manifest.has('frame_library', 'Series_86_a.PNG'):
+            ...
+    """
+
+    def __init__(self, roots: Dict[str, Path], refresh_interval: float = REFRESH_INTERVAL_SECONDS):
+        """
+        Initialize manifest (directories are listed on first use)
+
+        Args:
+            roots: Root name -> directory
+            refresh_interval: Minimum seconds between directory mtime checks
+        """
+        self.roots = {name: Path(path) for name, path in roots.items()}
+        self.refresh_interval = refresh_interval
+        self._files: Dict[str, FrozenSet[str]] = {}
+        self._mtimes: Dict[str, Optional[int]] = {}
+        self._checked_at = 0.0
+        self._version = ''
+        self._lock = threading.Lock()
+        self.builds = 0
+        self.built_at: Optional[float] = None
+
+    @staticmethod
+    def _dir_mtime(path: Path) -> Optional[int]:
+        try:
+            return os.stat(path).st_mtime_ns
+        except OSError:
+            return None
+
+    @staticmethod
+    def _list(path: Path) -> FrozenSet[str]:
+        try:
+            with os.scandir(path) as entries:
+                return frozenset(entry.name for entry in entries if entry.is_file())
+        except OSError:
+            return frozenset()
+
+    def refresh(self, force: bool = False) -> Dict[str, int]:
+        """
+        Re-list roots whose directory changed (or all of them when forced)
+
+        Returns:
+            Root name -> file count
+        """
+        with self._lock:
+            changed = False
+            for name, path in self.roots.items():
+                mtime = self._dir_mtime(path)
+                if force or name not in self._files or mtime != self._mtimes.get(name):
+                    self._files[name] = self._list(path)
+                    self._mtimes[name] = mtime
+                    self.builds += 1
+                    self.built_at = time.time()
+                    changed = True
+            self._checked_at = time.monotonic()
+            if changed:
+                self._version = self._hash(self._files)
+            return {name: len(files) for name, files in self._files.items()}
+
+    @staticmethod
+    def _hash(files: Dict[str, FrozenSet[str]]) -> str:
+        digest = hashlib.sha256()
+        for name in sorted(files):
+            digest.update(name.encode('utf-8') + b'\0')
+            for filename in sorted(files[name]):
+                digest.update(filename.encode('utf-8') + b'\n')
+        return digest.hexdigest()[:16]
+
+    def _maybe_refresh(self) -> None:
+        if time.monotonic() - self._checked_at >= self.refresh_interval:
+            self.refresh()
+
+    @property
+    def version(self) -> str:
+        """Hash of all listed file names (changes whenever a file is added/removed)"""
+        self._maybe_refresh()
+        return self._version
+
+    def files(self, root: str) -> FrozenSet[str]:
+        """File names directly inside a root"""
+        self._maybe_refresh()
+        return self._files.get(root, frozenset())
+
+    def has(self, root: str, filename: str) -> bool:
+        """Whether root contains filename"""
+        return filename in self.files(root)
+
+    def stats(self) -> Dict:
+        """File counts per root and refresh bookkeeping"""
+        self._maybe_refresh()
+        with self._lock:
+            return {
+                'roots': {
+                    name: {'path': str(self.roots[name]), 'files': len(files)}
+                    for name, files in self._files.items()
+                },
+                'version': self._version,
+                'builds': self.builds,
+                'built_at': self.built_at,
+                'refresh_interval': self.refresh_interval,
+            }
+
+
+# Global manifest instance
+_asset_manifest: Optional[AssetManifest] = None
+_asset_manifest_lock = threading.Lock()
+
+
+def get_asset_manifest() -> AssetManifest:
+    """Get or create the process-wide frame asset manifest"""
+    global _asset_manifest
+
+    if _asset_manifest is None:
+        with _asset_manifest_lock:
+            if _asset_manifest is None:
+                manifest = AssetManifest(ASSET_ROOTS)
+                manifest.refresh()
+                _asset_manifest = manifest
+
+    return _asset_manifest
@@ -5,24 +5,35 @@ Technical shop drawing generator with CAD-style dimensions and layouts
 
 from .layout import DrawingLayout
 from .dimensions import DimensionLine, draw_window_frame_with_dimensions
+from .batching import ArtistBatch
 from .components import (
     SpecificationTable,
     CompanyHeader,
     DrawingTitle,
     ProjectInfoBlock,
-    RevisionBlock
+    RevisionBlock,
+    ProjectSchedule
 )
-from .main import ProfessionalDrawingGenerator
+from .main import ProfessionalDrawingGenerator, TEMPLATE_VERSION
+from .render_pool import RenderPool, RenderJob, RenderResult
+from .reportlab_backend import ReportLabDrawingRenderer
 
 __version__ = "1.0.0"
 __all__ = [
     'DrawingLayout',
     'DimensionLine',
     'draw_window_frame_with_dimensions',
+    'ArtistBatch',
     'SpecificationTable',
     'CompanyHeader',
     'DrawingTitle',
     'ProjectInfoBlock',
     'RevisionBlock',
+    'ProjectSchedule',
     'ProfessionalDrawingGenerator',
+    'TEMPLATE_VERSION',
+    'RenderPool',
+    'RenderJob',
+    'RenderResult',
+    'ReportLabDrawingRenderer',
 ]
@@ -0,0 +1,149 @@
+"""
+Artist Batching
+Collects line segments and arrow heads for one axis and adds them as a few
+collections instead of one artist per segment
+
+Lines are grouped by style into LineCollections. Arrow heads become a
+single PathCollection whose marker paths (in points) are oriented at draw
+time, so they look like annotate(arrowstyle='->') regardless of aspect.
+"""
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+from matplotlib.collections import LineCollection, PathCollection
+from matplotlib.path import Path
+from matplotlib.transforms import IdentityTransform
+
+
+# annotate() defaults: mutation scale = 10pt text, '->' head 0.4 x 0.2,
+# both ends shrunk by 2pt
+ARROW_HEAD_LENGTH = 4.0
+ARROW_HEAD_WIDTH = 2.0
+ARROW_SHRINK = 2.0
+
+# Same stacking as the artists they replace (Line2D = 2, annotate = 3)
+LINE_ZORDER = 2
+ARROW_ZORDER = 3
+
+
+class ArrowHeadCollection(PathCollection):
+    """Open '->' arrows anchored in data space, drawn in points"""
+
+    def __init__(self, tips: np.ndarray, tails: np.ndarray, transform, **kwargs):
+        self._tips = tips
+        self._tails = tails
+        super().__init__(
+            [], sizes=[1.0], offsets=tips, offset_transform=transform,
+            transform=IdentityTransform(), facecolors='none', capstyle='butt',
+            joinstyle='round', zorder=ARROW_ZORDER, clip_on=False, **kwargs
+        )
+
+    def _arrow_paths(self) -> List[Path]:
+        trans = self.get_offset_transform()
+        tips = trans.transform(self._tips)
+        tails = trans.transform(self._tails)
+
+        # Display pixels -> points (marker paths are in points)
+        points_per_pixel = 72.0 / self.figure.dpi
+        vectors = (tips - tails) * points_per_pixel
+        lengths = np.hypot(vectors[:, 0], vectors[:, 1])
+
+        # Like FancyArrowPatch: the tip is pulled back so the stroked point
+        # lands on it, and the head end is only shrunk if the shaft is long
+        # enough after shrinking the tail end
+        linewidth = self.get_linewidth()[0]
+        pad = 0.5 * linewidth * np.hypot(ARROW_HEAD_LENGTH, ARROW_HEAD_WIDTH) / ARROW_HEAD_WIDTH
+
+        paths = []
+        for (dx, dy), length in zip(vectors, lengths):
+            if length == 0:
+                paths.append(Path(np.zeros((1, 2))))
+                continue
+            direction = np.array([dx, dy]) / length
+            normal = np.array([-direction[1], direction[0]]) * ARROW_HEAD_WIDTH
+            shrink_tip = ARROW_SHRINK if length - ARROW_SHRINK > ARROW_SHRINK else 0.0
+
+            tip = -direction * (shrink_tip + pad)
+            tail = -direction * max(length - ARROW_SHRINK, 0.0)
+            back = tip - direction * ARROW_HEAD_LENGTH
+            paths.append(Path(
+                [tail, tip, back + normal, tip, back - normal],
+                [Path.MOVETO, Path.LINETO, Path.MOVETO, Path.LINETO, Path.LINETO]
+            ))
+        return paths
+
+    def draw(self, renderer):
+        self.set_paths(self._arrow_paths())
+        super().draw(renderer)
+
+
+class ArtistBatch:
+    """
+    Gather lines and arrows for one axis, then add them in one flush()
+
+    Usage:
+        batch = ArtistBatch(ax)
+        batch.add_line([x1, x2], [y1, y2], linewidth=1.5)
+        batch.add_arrow((x2, y), (x1, y))
+        batch.flush()
+    """
+
+    def __init__(self, ax):
+        """
+        Initialize batch
+
+        Args:
+            ax: Matplotlib axis the collections are added to
+        """
+        self.ax = ax
+        self._segments: Dict[Tuple, List[np.ndarray]] = {}
+        self._arrows: Dict[Tuple, List[Tuple[Tuple[float, float], Tuple[float, float]]]] = {}
+
+    def add_line(
+        self,
+        xs: Sequence[float],
+        ys: Sequence[float],
+        color: str = 'black',
+        linewidth: float = 1.0,
+        linestyle: str = '-',
+        alpha: Optional[float] = None
+    ) -> None:
+        """Queue a polyline (same arguments as ax.plot with explicit style)"""
+        key = (color, linewidth, linestyle, alpha)
+        self._segments.setdefault(key, []).append(np.column_stack([xs, ys]))
+
+    def add_arrow(
+        self,
+        tip: Tuple[float, float],
+        tail: Tuple[float, float],
+        color: str = 'black',
+        linewidth: float = 1.0
+    ) -> None:
+        """Queue an arrow like ax.annotate('', xy=tip, xytext=tail, arrowprops='->')"""
+        self._arrows.setdefault((color, linewidth), []).append((tip, tail))
+
+    def __len__(self) -> int:
+        return (
+            sum(len(segments) for segments in self._segments.values()) +
+            sum(len(arrows) for arrows in self._arrows.values())
+        )
+
+    def flush(self) -> None:
+        """Add queued lines and arrows to the axis as collections"""
+        for (color, linewidth, linestyle, alpha), segments in self._segments.items():
+            self.ax.add_collection(LineCollection(
+                segments, colors=color, linewidths=linewidth, linestyles=linestyle,
+                alpha=alpha, zorder=LINE_ZORDER,
+                capstyle='projecting' if linestyle == '-' else 'butt', joinstyle='round'
+            ), autolim=False)
+
+        for (color, linewidth), arrows in self._arrows.items():
+            tips = np.array([tip for tip, _ in arrows], dtype=float)
+            tails = np.array([tail for _, tail in arrows], dtype=float)
+            self.ax.add_collection(ArrowHeadCollection(
+                tips, tails, self.ax.transData,
+                edgecolors=color, linewidths=linewidth
+            ), autolim=False)
+
+        self._segments = {}
+        self._arrows = {}
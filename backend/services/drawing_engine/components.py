@@ -3,7 +3,6 @@ Professional Drawing Components
 Specification tables, headers, and info blocks for technical drawings
 Includes smart text positioning and overflow prevention
 """
-import matplotlib.pyplot as plt
 import matplotlib.patches as patches
 from matplotlib.patches import FancyBboxPatch
 from typing import List, Dict, Tuple
@@ -420,12 +419,39 @@ class RevisionBlock:
 class ConfigurationIcons:
     """Draw window/door operation type icons with highlighting"""
     
+    # 6 operation types with symbols and positions (2x3 grid)
+    ICONS = [
+        ('FIXED', '□', 1.5, 7),
+        ('CASEMENT', '◄►', 5, 7),
+        ('AWNING', '△', 8.5, 7),
+        ('SLIDER', '⇄', 1.5, 3.5),
+        ('BIFOLD', '⊲⊳', 5, 3.5),
+        ('ACCORDION', '⩘⩗', 8.5, 3.5),
+    ]
+    
     def __init__(self, ax):
         self.ax = ax
         self.ax.set_xlim(0, 10)
         self.ax.set_ylim(0, 10)
         self.ax.axis('off')
     
+    @classmethod
+    def active_names(cls, active_type: str) -> Tuple[str, ...]:
+        """
+        Names of the icons highlighted for a window/door type
+        
+        Args:
+            active_type: Window/door type (e.g., 'Double Casement')
+        
+        Returns:
+            Tuple of highlighted icon names (may be empty)
+        """
+        active_type = str(active_type).upper()
+        return tuple(
+            name for name, _, _, _ in cls.ICONS
+            if name in active_type or active_type in name
+        )
+    
     def draw_icons(self, active_type: str = 'FIXED'):
         """
         Draw 6 operation icons in 2x3 grid, highlight active
@@ -433,25 +459,15 @@ class ConfigurationIcons:
         Args:
             active_type: Window/door type to highlight (e.g., 'CASEMENT', 'SLIDER')
         """
-        active_type = active_type.upper()
+        active = self.active_names(active_type)
         
         # Title
         self.ax.text(5, 9.5, 'OPERATION TYPES', ha='center', va='top',
                     fontsize=9, fontweight='bold')
         
-        # Define 6 operation types with symbols and positions
-        icons = [
-            ('FIXED', '□', 1.5, 7),
-            ('CASEMENT', '◄►', 5, 7),
-            ('AWNING', '△', 8.5, 7),
-            ('SLIDER', '⇄', 1.5, 3.5),
-            ('BIFOLD', '⊲⊳', 5, 3.5),
-            ('ACCORDION', '⩘⩗', 8.5, 3.5),
-        ]
-        
-        for name, symbol, x, y in icons:
+        for name, symbol, x, y in self.ICONS:
             # Check if this icon should be highlighted
-            is_active = name in active_type or active_type in name
+            is_active = name in active
             
             # Draw box
             box = patches.Rectangle(
@@ -471,3 +487,144 @@ class ConfigurationIcons:
             # Draw label
             self.ax.text(x, y - 0.6, name, ha='center', va='center',
                         fontsize=6, fontweight='bold' if is_active else 'normal')
+
+
+class ProjectSchedule:
+    """Render the cover schedule page of a project drawing package"""
+    
+    # (header, x position, max characters)
+    COLUMNS = [
+        ('SHEET', 0.2, 5),
+        ('ITEM', 0.9, 16),
+        ('TYPE', 2.3, 6),
+        ('OPERATION', 3.1, 22),
+        ('SIZE (W x H)', 5.0, 16),
+        ('GLASS', 6.5, 22),
+        ('COLOR', 8.4, 12),
+        ('QTY', 9.4, 4),
+    ]
+    ROWS_PER_PAGE = 40
+    
+    # Vertical layout in axis units (0-10)
+    TABLE_TOP = 8.8
+    TABLE_BOTTOM = 0.4
+    
+    def __init__(self, ax):
+        """
+        Initialize schedule renderer
+        
+        Args:
+            ax: Matplotlib axis covering the page
+        """
+        self.ax = ax
+        self.ax.set_xlim(0, 10)
+        self.ax.set_ylim(0, 10)
+        self.ax.axis('off')
+    
+    @classmethod
+    def page_count(cls, item_count: int) -> int:
+        """Number of cover pages needed for item_count items"""
+        return max(1, -(-item_count // cls.ROWS_PER_PAGE))
+    
+    @classmethod
+    def rows(cls, items: List[Tuple[Dict, bool]], first_sheet: int = 1) -> List[Tuple[str, ...]]:
+        """
+        Build schedule rows for (item_data, is_door) pairs
+        
+        Args:
+            items: Items in sheet order
+            first_sheet: Sheet number of the first item
+        
+        Returns:
+            One tuple of cell strings per item (same order as COLUMNS)
+        """
+        rows = []
+        for i, (item_data, is_door) in enumerate(items):
+            width = float(item_data.get('width_inches', 36))
+            height = float(item_data.get('height_inches', 84 if is_door else 48))
+            cells = (
+                str(first_sheet + i),
+                str(item_data.get('item_number', '')),
+                'Door' if is_door else 'Window',
+                str(item_data.get('window_type', '')),
+                f'{width:g}" x {height:g}"',
+                str(item_data.get('glass_type', '')),
+                str(item_data.get('frame_color', '')),
+                str(item_data.get('quantity', 1)),
+            )
+            rows.append(tuple(
+                SpecificationTableLayouter.truncate_text(cell, max_chars, char_width=1.0)
+                for cell, (_, _, max_chars) in zip(cells, cls.COLUMNS)
+            ))
+        return rows
+    
+    @classmethod
+    def row_height(cls) -> float:
+        return (cls.TABLE_TOP - cls.TABLE_BOTTOM) / (cls.ROWS_PER_PAGE + 1)
+    
+    def draw_schedule(
+        self,
+        rows: List[Tuple[str, ...]],
+        project_data: Dict,
+        page: int = 1,
+        pages: int = 1,
+        total_items: int = None
+    ):
+        """
+        Draw one cover page of the schedule
+        
+        Args:
+            rows: Rows for this page (at most ROWS_PER_PAGE)
+            project_data: Project info dict (po_number, project_name, customer_name)
+            page: Page number within the schedule
+            pages: Total schedule pages
+            total_items: Item count for the summary line (default: len(rows))
+        """
+        # Title block
+        title_box = FancyBboxPatch(
+            (0.2, 9.3), 9.6, 0.5,
+            boxstyle="round,pad=0.05",
+            facecolor='#333333',
+            edgecolor='black',
+            linewidth=1.5
+        )
+        self.ax.add_patch(title_box)
+        self.ax.text(5, 9.55, 'PROJECT SCHEDULE', ha='center', va='center',
+                    fontsize=14, fontweight='bold', color='white')
+        
+        summary = (
+            f"{project_data.get('project_name', 'Project')}  |  "
+            f"PO {project_data.get('po_number', 'PO-XXX')}  |  "
+            f"{project_data.get('customer_name', 'Customer')}  |  "
+            f"{total_items if total_items is not None else len(rows)} item(s)"
+        )
+        self.ax.text(0.2, 9.05, summary, ha='left', va='center', fontsize=8,
+                    family='monospace')
+        self.ax.text(9.8, 9.05, f'Page {page} of {pages}', ha='right', va='center',
+                    fontsize=8, style='italic')
+        
+        # Header row
+        row_height = self.row_height()
+        y = self.TABLE_TOP
+        header_bg = patches.Rectangle(
+            (0.1, y - row_height), 9.8, row_height,
+            facecolor='#dddddd', edgecolor='black', linewidth=0.8
+        )
+        self.ax.add_patch(header_bg)
+        for header, x, _ in self.COLUMNS:
+            self.ax.text(x, y - row_height / 2, header, ha='left', va='center',
+                        fontsize=7, fontweight='bold')
+        
+        # Item rows
+        for i, row in enumerate(rows[:self.ROWS_PER_PAGE]):
+            y = self.TABLE_TOP - (i + 1) * row_height
+            bg = patches.Rectangle(
+                (0.1, y - row_height), 9.8, row_height,
+                facecolor='#f5f5f5' if i % 2 == 0 else 'white',
+                edgecolor='lightgray',
+                linewidth=0.5
+            )
+            self.ax.add_patch(bg)
+            for cell, (_, x, _) in zip(row, self.COLUMNS):
+                self.ax.text(x, y - row_height / 2, cell, ha='left', va='center',
+                            fontsize=7)
@@ -3,12 +3,12 @@ CAD-Style Dimension Line Generator
 Creates professional dimension annotations with extension lines and arrows
 Includes collision detection and smart text positioning
 """
-import matplotlib.pyplot as plt
 import matplotlib.patches as patches
 from matplotlib.patches import FancyArrowPatch, FancyBboxPatch
 import numpy as np
 from typing import Tuple, Optional, List
 from .text_bounds import DimensionTextPositioner, TextBoundsCalculator, TextBounds
+from .batching import ArtistBatch
 
 
 class DimensionLine:
@@ -18,6 +18,10 @@ class DimensionLine:
     - Dimension line with arrow ends
     - Dimension text centered above/below with smart positioning
     - Collision detection to avoid overlapping text
+    
+    Lines and arrows go into an ArtistBatch. Pass a shared batch to collect
+    everything for a drawing and flush it once; without one, each draw_*
+    call flushes its own batch.
     """
     
     # Standard CAD dimension styles
@@ -27,18 +31,25 @@ class DimensionLine:
     MIN_TEXT_SPACING = 0.5  # Minimum spacing between dimension texts
     LINE_WIDTH = 1.0  # points
     
-    def __init__(self, ax, scale: float = 1.0):
+    def __init__(self, ax, scale: float = 1.0, batch: Optional[ArtistBatch] = None):
         """
         Initialize dimension line drawer
         
         Args:
             ax: Matplotlib axis
             scale: Scaling factor (inches to plot units)
+            batch: Shared ArtistBatch (caller flushes); None = flush per dimension
         """
         self.ax = ax
         self.scale = scale
+        self.owns_batch = batch is None
+        self.batch = ArtistBatch(ax) if batch is None else batch
         self.dimension_positions: List[Tuple[float, float]] = []  # Track placed dimensions
     
+    def _flush(self) -> None:
+        if self.owns_batch:
+            self.batch.flush()
+    
     def _calculate_text_offset_smart(
         self,
         x1: float, x2: float,
@@ -88,43 +99,21 @@ class DimensionLine:
         ext_offset = self.EXTENSION_OFFSET * self.scale
         
         # Draw extension lines
-        self.ax.plot(
-            [x1, x1],
-            [y - ext_offset, y + ext_offset],
-            color=color,
-            linewidth=self.LINE_WIDTH
-        )
-        self.ax.plot(
-            [x2, x2],
-            [y - ext_offset, y + ext_offset],
-            color=color,
-            linewidth=self.LINE_WIDTH
-        )
+        self.batch.add_line([x1, x1], [y - ext_offset, y + ext_offset], color, self.LINE_WIDTH)
+        self.batch.add_line([x2, x2], [y - ext_offset, y + ext_offset], color, self.LINE_WIDTH)
         
         # Draw dimension line
-        self.ax.plot(
-            [x1, x2],
-            [y, y],
-            color=color,
-            linewidth=self.LINE_WIDTH
-        )
+        self.batch.add_line([x1, x2], [y, y], color, self.LINE_WIDTH)
         
         # Draw arrow ends
         arrow_size = self.ARROW_SIZE * self.scale
         
         # Left arrow
-        self.ax.annotate(
-            '', xy=(x1 + arrow_size, y),
-            xytext=(x1, y),
-            arrowprops=dict(arrowstyle='->', lw=self.LINE_WIDTH, color=color)
-        )
+        self.batch.add_arrow((x1 + arrow_size, y), (x1, y), color, self.LINE_WIDTH)
         
         # Right arrow
-        self.ax.annotate(
-            '', xy=(x2 - arrow_size, y),
-            xytext=(x2, y),
-            arrowprops=dict(arrowstyle='->', lw=self.LINE_WIDTH, color=color)
-        )
+        self.batch.add_arrow((x2 - arrow_size, y), (x2, y), color, self.LINE_WIDTH)
+        self._flush()
         
         # Calculate smart offset for dimension text
         text_offset = self._calculate_text_offset_smart(x1, x2, dimension)
@@ -189,43 +178,21 @@ class DimensionLine:
         ext_offset = self.EXTENSION_OFFSET * self.scale
         
         # Draw extension lines
-        self.ax.plot(
-            [x - ext_offset, x + ext_offset],
-            [y1, y1],
-            color=color,
-            linewidth=self.LINE_WIDTH
-        )
-        self.ax.plot(
-            [x - ext_offset, x + ext_offset],
-            [y2, y2],
-            color=color,
-            linewidth=self.LINE_WIDTH
-        )
+        self.batch.add_line([x - ext_offset, x + ext_offset], [y1, y1], color, self.LINE_WIDTH)
+        self.batch.add_line([x - ext_offset, x + ext_offset], [y2, y2], color, self.LINE_WIDTH)
         
         # Draw dimension line
-        self.ax.plot(
-            [x, x],
-            [y1, y2],
-            color=color,
-            linewidth=self.LINE_WIDTH
-        )
+        self.batch.add_line([x, x], [y1, y2], color, self.LINE_WIDTH)
         
         # Draw arrow ends
         arrow_size = self.ARROW_SIZE * self.scale
         
         # Bottom arrow
-        self.ax.annotate(
-            '', xy=(x, y1 + arrow_size),
-            xytext=(x, y1),
-            arrowprops=dict(arrowstyle='->', lw=self.LINE_WIDTH, color=color)
-        )
+        self.batch.add_arrow((x, y1 + arrow_size), (x, y1), color, self.LINE_WIDTH)
         
         # Top arrow
-        self.ax.annotate(
-            '', xy=(x, y2 - arrow_size),
-            xytext=(x, y2),
-            arrowprops=dict(arrowstyle='->', lw=self.LINE_WIDTH, color=color)
-        )
+        self.batch.add_arrow((x, y2 - arrow_size), (x, y2), color, self.LINE_WIDTH)
+        self._flush()
         
         # Calculate smart offset for dimension text
         dimension_length = abs(y2 - y1)
@@ -289,29 +256,19 @@ class DimensionLine:
         ext_dx = ext_offset * np.cos(perp_angle)
         ext_dy = ext_offset * np.sin(perp_angle)
         
-        self.ax.plot(
-            [x1 - ext_dx, x1 + ext_dx],
-            [y1 - ext_dy, y1 + ext_dy],
-            color=color,
-            linewidth=self.LINE_WIDTH
-        )
-        self.ax.plot(
-            [x2 - ext_dx, x2 + ext_dx],
-            [y2 - ext_dy, y2 + ext_dy],
-            color=color,
-            linewidth=self.LINE_WIDTH
-        )
+        self.batch.add_line([x1 - ext_dx, x1 + ext_dx], [y1 - ext_dy, y1 + ext_dy], color, self.LINE_WIDTH)
+        self.batch.add_line([x2 - ext_dx, x2 + ext_dx], [y2 - ext_dy, y2 + ext_dy], color, self.LINE_WIDTH)
         
         # Draw dimension line parallel to the measured line
         offset_dx = text_offset * np.cos(perp_angle)
         offset_dy = text_offset * np.sin(perp_angle)
         
-        self.ax.plot(
+        self.batch.add_line(
             [x1 + offset_dx, x2 + offset_dx],
             [y1 + offset_dy, y2 + offset_dy],
-            color=color,
-            linewidth=self.LINE_WIDTH
+            color, self.LINE_WIDTH
         )
+        self._flush()
         
         # Add text at midpoint
         mid_x = (x1 + x2) / 2 + offset_dx
@@ -0,0 +1,223 @@
+"""
+Font Metrics
+Text measurement from the real per-glyph advance widths of the fonts the
+drawings are rendered with
+
+DejaVu Sans (matplotlib backend) is read from matplotlib's bundled TrueType
+files; Helvetica/Courier (reportlab backend) come from ReportLab's standard
+font metrics. Widths are unhinted advances without kerning, in points.
+
+ASCII advances are kept as flat per-size tables (precomputed at import for
+common sizes), and full string measurements are memoized in a bounded LRU.
+"""
+import os
+import threading
+from functools import lru_cache
+from typing import Dict, Optional, Tuple
+
+import matplotlib
+from matplotlib import ft2font
+from reportlab.pdfbase import pdfmetrics
+
+# Family the matplotlib backend renders with (rcParams default)
+DEFAULT_FAMILY = 'DejaVu Sans'
+
+# family -> (regular, bold) TrueType file in matplotlib's font directory
+TRUETYPE_FAMILIES = {
+    'DejaVu Sans': ('DejaVuSans.ttf', 'DejaVuSans-Bold.ttf'),
+    'DejaVu Sans Mono': ('DejaVuSansMono.ttf', 'DejaVuSansMono-Bold.ttf'),
+}
+
+# family -> (regular, bold) standard PDF font names
+STANDARD_FAMILIES = {
+    'Helvetica': ('Helvetica', 'Helvetica-Bold'),
+    'Courier': ('Courier', 'Courier-Bold'),
+}
+
+# Font sizes used on the sheets (ASCII tables precomputed at import)
+COMMON_SIZES = (5, 6, 7, 8, 9, 10, 11, 12, 14)
+
+# Bounded memo of (family, bold, size, text) -> width
+MEASURE_CACHE_SIZE = 8192
+
+_NO_HINTING = (
+    ft2font.LoadFlags.NO_HINTING if hasattr(ft2font, 'LoadFlags') else ft2font.LOAD_NO_HINTING
+)
+
+
+class FontFace:
+    """Advance widths (em units) and vertical metrics of one font"""
+
+    def __init__(self, name: str, ascii_advances, ascent: float, descent: float, measure_char):
+        """
+        Initialize font face
+
+        Args:
+            name: Font name
+            ascii_advances: 128 advance widths in em units, indexed by code point
+            ascent: Ascent in em units (positive)
+            descent: Descent in em units (negative)
+            measure_char: Callable returning the em advance of any other character
+        """
+        self.name = name
+        self.ascii_advances = tuple(ascii_advances)
+        self.ascent = ascent
+        self.descent = descent
+        self._measure_char = measure_char
+        self._other: Dict[str, float] = {}
+
+    @classmethod
+    def from_truetype(cls, path: str) -> 'FontFace':
+        """Read advances from a TrueType file"""
+        font = ft2font.FT2Font(path)
+        # 1000 px/em at 72 dpi: linearHoriAdvance / 65536 is the advance in 1/1000 em
+        font.set_size(1000, 72)
+        # FT2Font keeps the loaded glyph on the object, so renders on other threads must wait
+        lock = threading.Lock()
+
+        def measure_char(char: str) -> float:
+            if not char.isprintable():
+                return 0.0
+            # Index 0 (.notdef) for characters the font doesn't have
+            with lock:
+                glyph = font.load_glyph(font.get_char_index(ord(char)), flags=_NO_HINTING)
+                return glyph.linearHoriAdvance / 65536 / 1000
+
+        return cls(
+            os.path.basename(path),
+            [measure_char(chr(code)) for code in range(128)],
+            font.ascender / font.units_per_EM,
+            font.descender / font.units_per_EM,
+            measure_char
+        )
+
+    @classmethod
+    def from_standard(cls, name: str) -> 'FontFace':
+        """Read advances from a standard PDF font's AFM metrics"""
+        font = pdfmetrics.getFont(name)
+        ascent, descent = pdfmetrics.getAscentDescent(name)
+
+        def measure_char(char: str) -> float:
+            return pdfmetrics.stringWidth(char, name, 1)
+
+        return cls(
+            name,
+            [width / 1000 for width in font.widths[:128]],
+            ascent / 1000,
+            descent / 1000,
+            measure_char
+        )
+
+    def char_advance(self, char: str) -> float:
+        """Advance of one character in em units"""
+        code = ord(char)
+        if code < 128:
+            return self.ascii_advances[code]
+        advance = self._other.get(char)
+        if advance is None:
+            advance = self._other[char] = self._measure_char(char)
+        return advance
+
+
+class FontMetrics:
+    """
+    Text measurement for the drawing fonts
+
+    Usage:
+        width = FontMetrics.string_width('72"', 9, bold=True)
+        height = FontMetrics.line_height(9)
+    """
+
+    _faces: Dict[Tuple[str, bool], FontFace] = {}
+    _size_tables: Dict[Tuple[str, bool, float], Tuple[float, ...]] = {}
+
+    @classmethod
+    def face(cls, family: str = DEFAULT_FAMILY, bold: bool = False) -> FontFace:
+        """
+        Get the face for a family/weight (Helvetica metrics if unknown or missing)
+        """
+        key = (family, bool(bold))
+        face = cls._faces.get(key)
+        if face is not None:
+            return face
+
+        face = None
+        if family in TRUETYPE_FAMILIES:
+            path = os.path.join(
+                matplotlib.get_data_path(), 'fonts', 'ttf', TRUETYPE_FAMILIES[family][int(bool(bold))]
+            )
+            try:
+                face = FontFace.from_truetype(path)
+            except (OSError, RuntimeError) as e:
+                print(f"Font metrics for {family} unavailable ({e}), using Helvetica")
+        if face is None:
+            standard = STANDARD_FAMILIES.get(family, STANDARD_FAMILIES['Helvetica'])
+            face = FontFace.from_standard(standard[int(bool(bold))])
+
+        cls._faces[key] = face
+        return face
+
+    @classmethod
+    def _ascii_table(cls, family: str, bold: bool, size: float) -> Optional[Tuple[float, ...]]:
+        return cls._size_tables.get((family, bool(bold), size))
+
+    @classmethod
+    def precompute(cls, families=(DEFAULT_FAMILY, 'Helvetica'), sizes=COMMON_SIZES) -> None:
+        """Build point-size ASCII width tables for the given families and sizes"""
+        for family in families:
+            for bold in (False, True):
+                face = cls.face(family, bold)
+                for size in sizes:
+                    cls._size_tables[(family, bold, size)] = tuple(
+                        advance * size for advance in face.ascii_advances
+                    )
+
+    @staticmethod
+    def string_width(text: str, fontsize: float, bold: bool = False, family: str = DEFAULT_FAMILY) -> float:
+        """
+        Width of a single-line string in points
+
+        Args:
+            text: Text to measure
+            fontsize: Font size in points
+            bold: Bold weight
+            family: Font family (see TRUETYPE_FAMILIES / STANDARD_FAMILIES)
+
+        Returns:
+            Sum of glyph advances in points
+        """
+        return _measure(family, bool(bold), fontsize, text)
+
+    @classmethod
+    def line_height(cls, fontsize: float, bold: bool = False, family: str = DEFAULT_FAMILY) -> float:
+        """Ascender-to-descender height in points"""
+        face = cls.face(family, bold)
+        return (face.ascent - face.descent) * fontsize
+
+    @staticmethod
+    def text_size(text: str, fontsize: float, bold: bool = False, family: str = DEFAULT_FAMILY) -> Tuple[float, float]:
+        """(string_width, line_height) in points from one cached lookup"""
+        return _measure_size(family, bool(bold), fontsize, text)
+
+    @staticmethod
+    def cache_info():
+        """LRU statistics of string measurements"""
+        return _measure_size.cache_info()
+
+
+@lru_cache(maxsize=MEASURE_CACHE_SIZE)
+def _measure_size(family: str, bold: bool, fontsize: float, text: str) -> Tuple[float, float]:
+    table = FontMetrics._ascii_table(family, bold, fontsize)
+    if table is not None and text.isascii():
+        width = sum(table[ord(char)] for char in text)
+    else:
+        face = FontMetrics.face(family, bold)
+        width = sum(face.char_advance(char) for char in text) * fontsize
+    return width, FontMetrics.line_height(fontsize, bold, family)
+
+
+def _measure(family: str, bold: bool, fontsize: float, text: str) -> float:
+    return _measure_size(family, bold, fontsize, text)[0]
+
+
+FontMetrics.precompute()
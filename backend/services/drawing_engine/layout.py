@@ -2,13 +2,26 @@
 Professional 2D Technical Drawing Layout Engine
 Implements 3-column grid layout with 8 zones for shop drawings
 """
-import matplotlib.pyplot as plt
 import matplotlib.gridspec as gridspec
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
 from matplotlib.patches import Rectangle
 import numpy as np
 from typing import Tuple, Dict, List
 
 
+def new_figure(figsize: Tuple[float, float]) -> Figure:
+    """
+    Create a figure with its own Agg canvas, outside pyplot's figure registry
+    
+    Nothing global holds on to the figure, so it is freed as soon as the
+    caller drops it and separate figures can be drawn from separate threads.
+    """
+    fig = Figure(figsize=figsize)
+    FigureCanvasAgg(fig)
+    return fig
+
+
 class DrawingLayout:
     """
     Manages professional 3-column layout for technical drawings
@@ -29,6 +42,23 @@ class DrawingLayout:
     - Zone 8 (R-Bottom): Revision/sign-off block
     """
     
+    # Grid cells (row slice, column) occupied by each zone
+    ZONE_SPANS = {
+        'spec_1': (slice(0, 2), 0),        # Zone 1: Left top - window/door specs
+        'spec_2': (slice(2, 5), 0),        # Zone 2: Left bottom - material specs
+        'elevation': (slice(0, 4), 1),     # Zone 3: Center top - main elevation
+        'section': (slice(4, 7), 1),       # Zone 4: Center bottom - cross-section
+        'header': (slice(0, 1), 2),        # Zone 5: Right top - company header
+        'title': (slice(1, 2), 2),         # Zone 6: Right upper-mid - drawing title
+        'project_info': (slice(2, 6), 2),  # Zone 7: Right middle - project info
+        'revision': (slice(6, 8), 2),      # Zone 8: Right bottom - revision block
+    }
+    
+    # GridSpec parameters (figure fractions)
+    HEIGHT_RATIOS = [1, 1, 2, 2, 1, 1, 1.5, 0.8]
+    GRID_SPACING = {'hspace': 0.3, 'wspace': 0.2}
+    GRID_MARGINS = {'left': 0.05, 'right': 0.95, 'top': 0.95, 'bottom': 0.05}
+    
     def __init__(self, figsize: Tuple[float, float] = (11, 17)):
         """Initialize drawing layout with standard letter size (landscape)"""
         self.figsize = figsize
@@ -36,8 +66,8 @@ class DrawingLayout:
         self.gs = None
         self.zones = {}
         self._column_widths = [0.30, 0.45, 0.25]  # 30%, 45%, 25%
-        
-    def create_layout(self) -> Tuple[plt.Figure, Dict]:
+    
+    def create_layout(self) -> Tuple[Figure, Dict]:
         """
         Create 8-zone grid layout
         
@@ -46,14 +76,7 @@ class DrawingLayout:
             zones_dict keys: 'spec_1', 'spec_2', 'elevation', 'section', 
                            'header', 'title', 'project_info', 'revision'
         """
-        self.fig, axes_dict = plt.subplots(
-            figsize=self.figsize,
-            nrows=1, ncols=1
-        )
-        
-        # Remove the single axis
-        plt.close(self.fig)
-        self.fig = plt.figure(figsize=self.figsize)
+        self.fig = new_figure(self.figsize)
         
         # Create main GridSpec with 3 columns
         self.gs = gridspec.GridSpec(
@@ -61,60 +84,83 @@ class DrawingLayout:
             ncols=3,
             figure=self.fig,
             width_ratios=self._column_widths,
-            height_ratios=[1, 1, 2, 2, 1, 1, 1.5, 0.8],
-            hspace=0.3,
-            wspace=0.2,
-            left=0.05,
-            right=0.95,
-            top=0.95,
-            bottom=0.05
+            height_ratios=self.HEIGHT_RATIOS,
+            **self.GRID_SPACING,
+            **self.GRID_MARGINS
         )
         
-        # Zone 1: Left column, top - Spec table (window/door specs)
-        self.zones['spec_1'] = self.fig.add_subplot(
-            self.gs[0:2, 0]
-        )
+        for zone_name, (rows, col) in self.ZONE_SPANS.items():
+            self.zones[zone_name] = self.fig.add_subplot(self.gs[rows, col])
         
-        # Zone 2: Left column, bottom - Material specs
-        self.zones['spec_2'] = self.fig.add_subplot(
-            self.gs[2:5, 0]
-        )
+        # Configure all zones
+        for zone_name, ax in self.zones.items():
+            self._configure_zone(ax, zone_name)
         
-        # Zone 3: Center column, top - Main elevation
-        self.zones['elevation'] = self.fig.add_subplot(
-            self.gs[0:4, 1]
-        )
+        return self.fig, self.zones
+    
+    def zone_rects(self) -> Dict[str, Tuple[float, float, float, float]]:
+        """
+        Zone positions without creating a figure (same math as GridSpec)
         
-        # Zone 4: Center column, bottom - Cross-section
-        self.zones['section'] = self.fig.add_subplot(
-            self.gs[4:7, 1]
-        )
+        Returns:
+            Dict of zone name -> (left, bottom, width, height) in figure fractions
+        """
+        margins = self.GRID_MARGINS
         
-        # Zone 5: Right column, top - Company header
-        self.zones['header'] = self.fig.add_subplot(
-            self.gs[0:1, 2]
-        )
+        def cell_edges(ratios, start, total, space, direction):
+            # Matplotlib GridSpec: cells share (total) with (n - 1) gaps of space * mean cell
+            count = len(ratios)
+            cell = total / (count + space * (count - 1))
+            gap = space * cell
+            norm = cell * count / sum(ratios)
+            edges = []
+            pos = start
+            for i, ratio in enumerate(ratios):
+                if i:
+                    pos += direction * gap
+                end = pos + direction * ratio * norm
+                edges.append((pos, end))
+                pos = end
+            return edges
         
-        # Zone 6: Right column, upper-mid - Drawing title
-        self.zones['title'] = self.fig.add_subplot(
-            self.gs[1:2, 2]
+        rows = cell_edges(
+            self.HEIGHT_RATIOS, margins['top'], margins['top'] - margins['bottom'],
+            self.GRID_SPACING['hspace'], -1
         )
-        
-        # Zone 7: Right column, middle - Project info
-        self.zones['project_info'] = self.fig.add_subplot(
-            self.gs[2:6, 2]
+        cols = cell_edges(
+            self._column_widths, margins['left'], margins['right'] - margins['left'],
+            self.GRID_SPACING['wspace'], 1
         )
         
-        # Zone 8: Right column, bottom - Revision block
-        self.zones['revision'] = self.fig.add_subplot(
-            self.gs[6:8, 2]
-        )
+        rects = {}
+        for zone_name, (row_span, col) in self.ZONE_SPANS.items():
+            top = rows[row_span.start][0]
+            bottom = rows[row_span.stop - 1][1]
+            left, right = cols[col]
+            rects[zone_name] = (left, bottom, right - left, top - bottom)
+        return rects
+    
+    @staticmethod
+    def elevation_frame(width: float, height: float) -> Tuple[float, float, float, float]:
+        """
+        Scaled outer frame of an elevation inside a 10x10 zone
         
-        # Configure all zones
-        for zone_name, ax in self.zones.items():
-            self._configure_zone(ax, zone_name)
+        Args:
+            width: Item width in inches
+            height: Item height in inches
         
-        return self.fig, self.zones
+        Returns:
+            Tuple of (offset_x, offset_y, scaled_width, scaled_height)
+        """
+        # Scale to fit in zone (leave room for dimensions)
+        scale = min(6 / width, 6 / height, 0.08)
+        scaled_width = width * scale
+        scaled_height = height * scale
+        
+        # Center the drawing
+        offset_x = (10 - scaled_width) / 2
+        offset_y = (10 - scaled_height) / 2 + 0.5
+        return offset_x, offset_y, scaled_width, scaled_height
     
     def _configure_zone(self, ax, zone_name: str):
         """Configure axis for specific zone"""
@@ -138,6 +184,24 @@ class DrawingLayout:
         self.fig.savefig(filepath, dpi=dpi, bbox_inches='tight')
         print(f"Drawing saved to: {filepath}")
     
+    def save_page(self, pdf, dpi: int = 300):
+        """Append figure as the next page of a multi-page PdfPages document"""
+        pdf.savefig(self.fig, dpi=dpi, bbox_inches='tight')
+    
+    def close(self):
+        """Release the figure (clears its artists so memory is freed immediately)"""
+        if self.fig is not None:
+            self.fig.clear()
+        self.fig = None
+        self.gs = None
+        self.zones = {}
+    
     def show(self):
-        """Display figure"""
-        plt.show()
+        """Display figure in an interactive window (development use only)"""
+        import matplotlib
+        from matplotlib.backends import backend_registry
+        backend = backend_registry.load_backend_module(matplotlib.get_backend())
+        manager = backend.FigureCanvas.new_manager(self.fig, id(self.fig))
+        manager.show()
+        # Block until the window is closed, as plt.show() did
+        manager.start_main_loop()
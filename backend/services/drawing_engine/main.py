@@ -3,22 +3,33 @@ Professional Technical Drawing Generator - Phase 1
 Orchestrates layout, dimensions, and components into complete shop drawings
 """
 import os
+import threading
 from datetime import datetime
-from typing import Dict, Optional
+from typing import Dict, List, Optional, Tuple
 
-import matplotlib.pyplot as plt
+from matplotlib.backends.backend_pdf import PdfPages
 from matplotlib.patches import Rectangle
 
-from .layout import DrawingLayout
+from .layout import DrawingLayout, new_figure
 from .dimensions import DimensionLine, draw_window_frame_with_dimensions
+from .batching import ArtistBatch
 from .components import (
     SpecificationTable,
     CompanyHeader,
     DrawingTitle,
     ProjectInfoBlock,
     RevisionBlock,
-    ConfigurationIcons
+    ConfigurationIcons,
+    ProjectSchedule
 )
+from .template_cache import DrawingTemplate, get_template_cache
+
+
+# Sheet size in inches (width, height)
+PAGE_SIZE = (11, 17)
+
+# Bump whenever the sheet's appearance changes so cached renders are not reused
+TEMPLATE_VERSION = "1"
 
 
 class ProfessionalDrawingGenerator:
@@ -35,23 +46,74 @@ class ProfessionalDrawingGenerator:
     - Specification tables
     - Dimension annotations
     - Project information blocks
+    
+    Static chrome (layout, company header, operation icons, frame
+    cross-sections) comes from the process-wide template cache, so each
+    drawing only adds its item-specific artists.
+    
+    backend='reportlab' draws the same sheet directly as PDF vectors
+    (see reportlab_backend.py) instead of going through matplotlib.
+    
+    The sheet being drawn (layout, figure, zones) is kept per thread, so one
+    generator can render several drawings concurrently from a thread pool.
     """
     
-    def __init__(self, output_dir: str = "./drawings"):
+    BACKENDS = ('matplotlib', 'reportlab')
+    
+    def __init__(
+        self,
+        output_dir: str = "./drawings",
+        use_template_cache: bool = True,
+        backend: str = "matplotlib"
+    ):
         """
         Initialize drawing generator
         
         Args:
             output_dir: Directory to save generated PDFs
+            use_template_cache: Reuse cached static chrome between drawings
+            backend: Rendering backend ('matplotlib' or 'reportlab')
         """
+        if backend not in self.BACKENDS:
+            raise ValueError(f"Unknown drawing backend '{backend}' (expected one of {self.BACKENDS})")
+        
         self.output_dir = output_dir
-        self.layout = None
-        self.zones = None
+        self.backend = backend
+        self._local = threading.local()
+        self.template_cache = get_template_cache() if use_template_cache else None
+        self._vector_renderer = None
         
         # Create output directory if needed
         if not os.path.exists(output_dir):
             os.makedirs(output_dir)
     
+    @property
+    def layout(self) -> Optional[DrawingLayout]:
+        """Layout of the sheet this thread is drawing"""
+        return getattr(self._local, 'layout', None)
+    
+    @layout.setter
+    def layout(self, layout: Optional[DrawingLayout]):
+        self._local.layout = layout
+    
+    @property
+    def fig(self):
+        """Figure of the sheet this thread is drawing"""
+        return getattr(self._local, 'fig', None)
+    
+    @fig.setter
+    def fig(self, fig):
+        self._local.fig = fig
+    
+    @property
+    def zones(self) -> Optional[Dict]:
+        """Zone axes of the sheet this thread is drawing"""
+        return getattr(self._local, 'zones', None)
+    
+    @zones.setter
+    def zones(self, zones: Optional[Dict]):
+        self._local.zones = zones
+    
     def generate_window_drawing(
         self,
         item_data: Dict,
@@ -82,28 +144,14 @@ class ProfessionalDrawingGenerator:
         Returns:
             Path to generated PDF file
         """
-        # Create layout
-        self.layout = DrawingLayout(figsize=(11, 17))
-        self.fig, self.zones = self.layout.create_layout()
-        
         po_number = project_data.get('po_number', 'UNKNOWN')
         item_number = item_data.get('item_number', 'W-001')
         
-        # 1. Fill Left Column - Specification Tables
-        self._draw_spec_tables(item_data)
-        
-        # 2. Fill Center Column - Elevation with Dimensions
-        self._draw_elevation(item_data)
-        
-        # 3. Fill Right Column - Headers and Project Info
-        self._draw_right_column(item_data, project_data)
-        
-        # Save figure
         if output_filename is None:
             output_filename = f"{po_number}_Window-{item_number}_ELEV.pdf"
         
         output_path = os.path.join(self.output_dir, output_filename)
-        self.layout.save(output_path)
+        self._render(item_data, project_data, output_path)
         
         return output_path
     
@@ -124,37 +172,176 @@ class ProfessionalDrawingGenerator:
         Returns:
             Path to generated PDF file
         """
-        # Create layout
-        self.layout = DrawingLayout(figsize=(11, 17))
-        self.fig, self.zones = self.layout.create_layout()
-        
         po_number = project_data.get('po_number', 'UNKNOWN')
         item_number = item_data.get('item_number', 'D-001')
         
-        # 1. Fill Left Column - Specification Tables
-        self._draw_spec_tables(item_data, is_door=True)
+        if output_filename is None:
+            output_filename = f"{po_number}_Door-{item_number}_ELEV.pdf"
+        
+        output_path = os.path.join(self.output_dir, output_filename)
+        self._render(item_data, project_data, output_path, is_door=True)
         
-        # 2. Fill Center Column - Elevation with Dimensions
-        self._draw_elevation(item_data, is_door=True)
+        return output_path
+    
+    def generate_package(
+        self,
+        items: List[Tuple[Dict, bool]],
+        project_data: Dict,
+        output_filename: Optional[str] = None,
+        cover: bool = True
+    ) -> str:
+        """
+        Generate one multi-page PDF with a sheet per item
         
-        # 3. Fill Right Column - Headers and Project Info
-        self._draw_right_column(item_data, project_data, is_door=True)
+        The document is written in a single pass, so fonts (and, with the
+        reportlab backend, the static sheet chrome) are embedded once and
+        shared by every page.
+        
+        Args:
+            items: (item_data, is_door) pairs in sheet order
+            project_data: Project info dict
+            output_filename: Custom output filename (optional)
+            cover: Start with a project schedule listing all items
+        
+        Returns:
+            Path to generated PDF file
+        """
+        po_number = project_data.get('po_number', 'UNKNOWN')
         
-        # Save figure
         if output_filename is None:
-            output_filename = f"{po_number}_Door-{item_number}_ELEV.pdf"
+            output_filename = f"{po_number}_PACKAGE.pdf"
         
         output_path = os.path.join(self.output_dir, output_filename)
-        self.layout.save(output_path)
         
+        if self.backend == 'reportlab':
+            return self._get_vector_renderer().render_package(items, project_data, output_path, cover)
+        
+        metadata = {
+            'Title': f"{po_number} Shop Drawings",
+            'Subject': project_data.get('project_name', ''),
+        }
+        with PdfPages(output_path, metadata=metadata) as pdf:
+            if cover:
+                self._draw_cover_pages(pdf, items, project_data)
+            for item_data, is_door in items:
+                self._render(item_data, project_data, pdf, is_door)
+        
+        print(f"Drawing package saved to: {output_path}")
         return output_path
     
+    def _draw_cover_pages(self, pdf: PdfPages, items: List[Tuple[Dict, bool]], project_data: Dict):
+        """Add the project schedule page(s) to a package"""
+        pages = ProjectSchedule.page_count(len(items))
+        rows = ProjectSchedule.rows(items, first_sheet=pages + 1)
+        per_page = ProjectSchedule.ROWS_PER_PAGE
+        
+        for page in range(pages):
+            fig = new_figure(PAGE_SIZE)
+            try:
+                ax = fig.add_axes([0.05, 0.05, 0.9, 0.9])
+                ProjectSchedule(ax).draw_schedule(
+                    rows[page * per_page:(page + 1) * per_page],
+                    project_data,
+                    page=page + 1,
+                    pages=pages,
+                    total_items=len(items)
+                )
+                pdf.savefig(fig, dpi=300)
+            finally:
+                fig.clear()
+    
+    def _get_vector_renderer(self):
+        if self._vector_renderer is None:
+            from .reportlab_backend import ReportLabDrawingRenderer
+            self._vector_renderer = ReportLabDrawingRenderer(figsize=PAGE_SIZE)
+        return self._vector_renderer
+    
+    def _render(self, item_data: Dict, project_data: Dict, output, is_door: bool = False):
+        """
+        Draw item-specific content on a (cached) sheet and save it
+        
+        Args:
+            output: PDF path, or an open PdfPages to append the sheet to
+        """
+        if self.backend == 'reportlab':
+            self._get_vector_renderer().render(item_data, project_data, output, is_door)
+            return
+        
+        template = self._begin_drawing(item_data)
+        try:
+            # 1. Fill Left Column - Specification Tables
+            self._draw_spec_tables(item_data, is_door)
+            
+            # 2. Fill Center Column - Elevation with Dimensions
+            self._draw_elevation(item_data, is_door)
+            
+            # 3. Fill Right Column - Title and Project Info
+            self._draw_right_column(item_data, project_data, is_door)
+            
+            if isinstance(output, PdfPages):
+                self.layout.save_page(output)
+            else:
+                self.layout.save(output)
+        finally:
+            if template is not None:
+                self.template_cache.release(template)
+            else:
+                self.layout.close()
+    
+    def _begin_drawing(self, item_data: Dict) -> Optional[DrawingTemplate]:
+        """
+        Set up layout and static chrome for a new drawing
+        
+        Returns:
+            The checked-out template, or None when the cache is disabled
+        """
+        active_type = item_data.get('window_type', 'FIXED')
+        
+        if self.template_cache is None:
+            self.layout = DrawingLayout(figsize=PAGE_SIZE)
+            self.fig, self.zones = self.layout.create_layout()
+            self._draw_static_chrome(active_type)
+            return None
+        
+        key = (PAGE_SIZE, ConfigurationIcons.active_names(active_type))
+        template = self.template_cache.acquire(
+            key, lambda: self._build_template(key, active_type)
+        )
+        self.layout = template.layout
+        self.fig, self.zones = template.fig, template.zones
+        return template
+    
+    def _build_template(self, key, active_type: str) -> DrawingTemplate:
+        """Build a new cached sheet with its static chrome drawn"""
+        self.layout = DrawingLayout(figsize=key[0])
+        self.fig, self.zones = self.layout.create_layout()
+        self._draw_static_chrome(active_type)
+        return DrawingTemplate(key, self.layout)
+    
+    def _draw_static_chrome(self, active_type: str):
+        """
+        Draw the parts of the sheet that don't depend on item data
+        
+        Zone 2: Frame cross-sections
+        Zone 3: Cleared elevation zone (no border)
+        Zone 5: Company header
+        Zone 8: Operation icons (highlight depends only on the template key)
+        """
+        self._draw_cross_sections()
+        self.zones['elevation'].clear()
+        
+        header = CompanyHeader(self.zones['header'])
+        header.draw_header()
+        
+        icons = ConfigurationIcons(self.zones['revision'])
+        icons.draw_icons(active_type=active_type)
+    
     def _draw_spec_tables(self, item_data: Dict, is_door: bool = False):
         """
-        Draw specification tables in left column
+        Draw specification table in left column
         
         Zone 1 (top): Product type and dimensions  
-        Zone 2 (bottom): Cross-section views
+        (Zone 2 cross-sections are part of the static chrome)
         """
         # Zone 1: Dimensions and type specs
         spec_1 = SpecificationTable(self.zones['spec_1'])
@@ -171,11 +358,8 @@ class ProfessionalDrawingGenerator:
             specs_data,
             title=item_data.get('item_number', 'ITEM')
         )
-        
-        # Zone 2: Cross-sections
-        self._draw_cross_sections(item_data, is_door)
     
-    def _draw_cross_sections(self, item_data: Dict, is_door: bool = False):
+    def _draw_cross_sections(self, item_data: Dict = None, is_door: bool = False):
         """Draw vertical and horizontal frame cross-sections with nail flanges"""
         ax = self.zones['spec_2']
         ax.clear()
@@ -286,21 +470,14 @@ class ProfessionalDrawingGenerator:
         Zone 3 & 4: Main elevation and section views
         """
         ax = self.zones['elevation']
-        ax.clear()
         
         # Get dimensions
         width = float(item_data.get('width_inches', 36))
         height = float(item_data.get('height_inches', 48))
         window_type = str(item_data.get('window_type', 'Fixed')).upper()
         
-        # Scale to fit in zone (leave room for dimensions)
-        scale = min(6 / width, 6 / height, 0.08)
-        scaled_width = width * scale
-        scaled_height = height * scale
-        
-        # Center the drawing
-        offset_x = (10 - scaled_width) / 2
-        offset_y = (10 - scaled_height) / 2 + 0.5
+        # Scale to fit in zone and center (leave room for dimensions)
+        offset_x, offset_y, scaled_width, scaled_height = DrawingLayout.elevation_frame(width, height)
         
         # Draw outer frame
         frame = Rectangle(
@@ -309,6 +486,9 @@ class ProfessionalDrawingGenerator:
         )
         ax.add_patch(frame)
         
+        # Lines and arrows are batched into a few collections per drawing
+        batch = ArtistBatch(ax)
+        
         # Detect panel configuration and draw mullions
         if 'SLIDER' in window_type or 'PATIO' in window_type or 'SLIDING' in window_type:
             # 4-panel slider configuration
@@ -317,11 +497,11 @@ class ProfessionalDrawingGenerator:
             # Draw vertical mullions
             for i in range(1, 4):
                 x = offset_x + i * panel_width
-                ax.plot([x, x], [offset_y, offset_y + scaled_height], 'k-', linewidth=1.5)
+                batch.add_line([x, x], [offset_y, offset_y + scaled_height], linewidth=1.5)
             
             # Draw horizontal mid-rail
             mid_y = offset_y + scaled_height / 2
-            ax.plot([offset_x, offset_x + scaled_width], [mid_y, mid_y], 'k-', linewidth=1.5)
+            batch.add_line([offset_x, offset_x + scaled_width], [mid_y, mid_y], linewidth=1.5)
             
             # Add panel indicators (F. for Fixed panels in top row)
             for i in range(4):
@@ -331,27 +511,26 @@ class ProfessionalDrawingGenerator:
                        ha='center', va='center', fontsize=8, fontweight='bold')
                 # Bottom panels show arrows for sliding
                 if i < 2:
-                    ax.annotate('', xy=(x_center + 0.2, offset_y + scaled_height * 0.25),
-                               xytext=(x_center - 0.2, offset_y + scaled_height * 0.25),
-                               arrowprops=dict(arrowstyle='->', lw=1))
+                    arrow_y = offset_y + scaled_height * 0.25
+                    batch.add_arrow((x_center + 0.2, arrow_y), (x_center - 0.2, arrow_y))
                     
         elif 'CASEMENT' in window_type:
             # Casement window - split vertically
             mid_x = offset_x + scaled_width / 2
-            ax.plot([mid_x, mid_x], [offset_y, offset_y + scaled_height], 'k-', linewidth=1.5)
+            batch.add_line([mid_x, mid_x], [offset_y, offset_y + scaled_height], linewidth=1.5)
             
             # Add diagonal lines showing swing direction
-            ax.plot([offset_x, mid_x], [offset_y, offset_y + scaled_height], 
-                   'k--', linewidth=0.8, alpha=0.6)
-            ax.plot([mid_x, offset_x + scaled_width], [offset_y, offset_y + scaled_height], 
-                   'k--', linewidth=0.8, alpha=0.6)
+            batch.add_line([offset_x, mid_x], [offset_y, offset_y + scaled_height],
+                           linewidth=0.8, linestyle='--', alpha=0.6)
+            batch.add_line([mid_x, offset_x + scaled_width], [offset_y, offset_y + scaled_height],
+                           linewidth=0.8, linestyle='--', alpha=0.6)
                    
         elif 'AWNING' in window_type or 'HOPPER' in window_type:
             # Horizontal pivot
             mid_y = offset_y + scaled_height / 2
-            ax.plot([offset_x, offset_x + scaled_width], [mid_y, mid_y], 'k-', linewidth=1.5)
-            ax.plot([offset_x, offset_x + scaled_width], [offset_y, offset_y + scaled_height],
-                   'k--', linewidth=0.8, alpha=0.6)
+            batch.add_line([offset_x, offset_x + scaled_width], [mid_y, mid_y], linewidth=1.5)
+            batch.add_line([offset_x, offset_x + scaled_width], [offset_y, offset_y + scaled_height],
+                           linewidth=0.8, linestyle='--', alpha=0.6)
                    
         else:  # FIXED
             # Single pane - just add "F." indicator
@@ -359,13 +538,14 @@ class ProfessionalDrawingGenerator:
                    ha='center', va='center', fontsize=10, fontweight='bold')
         
         # Add dimension lines
-        dim = DimensionLine(ax)
+        dim = DimensionLine(ax, batch=batch)
         # Width dimension (bottom)
         dim.draw_horizontal(offset_x, offset_x + scaled_width, offset_y - 0.8, 
                           f'{width:.0f}"', above=False)
         # Height dimension (left side)
         dim.draw_vertical(offset_x - 0.8, offset_y, offset_y + scaled_height, 
                          f'{height:.0f}"', left=True)
+        batch.flush()
         
         ax.set_xlim(0, 10)
         ax.set_ylim(0, 10)
@@ -383,17 +563,12 @@ class ProfessionalDrawingGenerator:
     
     def _draw_right_column(self, item_data: Dict, project_data: Dict, is_door: bool = False):
         """
-        Draw company header, title, and project info in right column
+        Draw title and project info in right column
         
-        Zone 5: Company header
         Zone 6: Drawing title
         Zone 7: Project information
-        Zone 8: Revision block
+        (Zone 5 header and Zone 8 icons are part of the static chrome)
         """
-        # Zone 5: Company Header
-        header = CompanyHeader(self.zones['header'])
-        header.draw_header()
-        
         # Zone 6: Drawing Title
         title_block = DrawingTitle(self.zones['title'])
         drawing_type = "DOOR" if is_door else "WINDOW"
@@ -413,11 +588,6 @@ class ProfessionalDrawingGenerator:
             date=datetime.now().strftime("%m/%d/%Y"),
             scale="1/4\" = 1'" if width < 48 else "1/8\" = 1'\""
         )
-        
-        # Zone 8: Operation Icons
-        window_type = item_data.get('window_type', 'FIXED')
-        icons = ConfigurationIcons(self.zones['revision'])
-        icons.draw_icons(active_type=window_type)
 
 
 def demo_generate_window():
@@ -0,0 +1,299 @@
+"""
+Render Worker Pool
+Long-lived worker processes for rendering many shop drawings in parallel
+
+Each worker imports matplotlib with the Agg backend and loads the drawing
+fonts once at start-up, then renders (item_data, project_data) jobs sent
+over a pipe. Hung renders are killed after a timeout and the worker is
+respawned for the next job.
+"""
+import multiprocessing
+import os
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+
+# Font families used by the drawing components (warmed up in each worker)
+_WARM_FONTS = [
+    ('DejaVu Sans', 'normal'),
+    ('DejaVu Sans', 'bold'),
+    ('monospace', 'normal'),
+]
+
+
+@dataclass
+class RenderJob:
+    """A single drawing to render"""
+    item_data: Dict
+    project_data: Dict
+    output_filename: Optional[str] = None
+    is_door: bool = False
+
+
+@dataclass
+class RenderResult:
+    """Outcome of a RenderJob (path on success, error message on failure)"""
+    index: int
+    job: RenderJob
+    path: Optional[str] = None
+    error: Optional[str] = None
+    duration: float = 0.0
+    cached: bool = False
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def _render_job(generator, job: RenderJob) -> Tuple[Optional[str], Optional[str]]:
+    """Render one job, capturing any exception as an error string"""
+    try:
+        if job.is_door:
+            path = generator.generate_door_drawing(
+                job.item_data, job.project_data, job.output_filename
+            )
+        else:
+            path = generator.generate_window_drawing(
+                job.item_data, job.project_data, job.output_filename
+            )
+        return path, None
+    except Exception as e:
+        return None, f"{type(e).__name__}: {e}"
+
+
+def _worker_main(conn, output_dir: str, backend: str = 'matplotlib'):
+    """Worker process entry point: warm up once, then serve jobs until told to stop"""
+    import matplotlib
+    matplotlib.use('Agg')
+    from matplotlib import font_manager
+
+    for family, weight in _WARM_FONTS:
+        props = font_manager.FontProperties(family=family, weight=weight)
+        font_manager.get_font(font_manager.findfont(props))
+
+    from .main import ProfessionalDrawingGenerator
+    generator = ProfessionalDrawingGenerator(output_dir, backend=backend)
+
+    while True:
+        try:
+            job = conn.recv()
+        except (EOFError, OSError):
+            break
+        if job is None:
+            break
+
+        conn.send(_render_job(generator, job))
+
+
+class _RenderWorker:
+    """Handle on one worker process and its pipe"""
+
+    def __init__(self, ctx, output_dir: str, backend: str = 'matplotlib'):
+        self._ctx = ctx
+        self._output_dir = output_dir
+        self._backend = backend
+        self.process = None
+        self.conn = None
+
+    @property
+    def alive(self) -> bool:
+        return self.process is not None and self.process.is_alive()
+
+    def start(self):
+        parent_conn, child_conn = self._ctx.Pipe()
+        self.process = self._ctx.Process(
+            target=_worker_main,
+            args=(child_conn, self._output_dir, self._backend),
+            daemon=True
+        )
+        self.process.start()
+        child_conn.close()
+        self.conn = parent_conn
+
+    def run(self, job: RenderJob, timeout: float) -> Tuple[Optional[str], Optional[str]]:
+        """Send a job to the worker and wait for its result"""
+        if not self.alive:
+            self.start()
+
+        try:
+            self.conn.send(job)
+        except (BrokenPipeError, OSError):
+            # Worker died between jobs - restart and retry once
+            self.kill()
+            self.start()
+            self.conn.send(job)
+
+        if not self.conn.poll(timeout):
+            self.kill()
+            return None, f"TimeoutError: render exceeded {timeout:g}s, worker killed"
+
+        try:
+            return self.conn.recv()
+        except (EOFError, OSError):
+            exitcode = self.process.exitcode if self.process else None
+            self.kill()
+            return None, f"WorkerCrashed: render worker exited (code {exitcode})"
+
+    def kill(self):
+        if self.process is not None:
+            if self.process.is_alive():
+                self.process.kill()
+            self.process.join(timeout=5)
+        if self.conn is not None:
+            self.conn.close()
+        self.process = None
+        self.conn = None
+
+    def stop(self):
+        if self.alive:
+            try:
+                self.conn.send(None)
+                self.process.join(timeout=5)
+            except (BrokenPipeError, OSError):
+                pass
+        self.kill()
+
+
+class RenderPool:
+    """
+    Pool of long-lived drawing render workers
+
+    Usage:
+        pool = RenderPool('./drawings', workers=4, timeout=120)
+        results = pool.map([RenderJob(item_data, project_data), ...])
+        for result in pool.imap_unordered(jobs):  # as each one finishes
+            ...
+
+    map() returns results in input order. A failing or hung item only produces
+    an error on its own RenderResult; the rest of the batch still renders.
+    With workers=0 jobs are rendered sequentially in the calling process.
+    """
+
+    def __init__(
+        self,
+        output_dir: str = "./drawings",
+        workers: Optional[int] = None,
+        timeout: float = 120.0,
+        backend: str = 'matplotlib'
+    ):
+        """
+        Initialize render pool (workers are started lazily on first use)
+
+        Args:
+            output_dir: Directory workers save generated PDFs to
+            workers: Number of worker processes (default: CPU count, 0 = in-process)
+            timeout: Seconds a single render may take before its worker is killed
+            backend: ProfessionalDrawingGenerator backend ('matplotlib' or 'reportlab')
+        """
+        self.output_dir = output_dir
+        if workers is None:
+            workers = os.cpu_count() or 1
+        self.workers = max(0, int(workers))
+        self.timeout = timeout
+        self.backend = backend
+
+        self._ctx = multiprocessing.get_context('spawn')
+        self._idle: "queue.Queue[_RenderWorker]" = queue.Queue()
+        self._all_workers: List[_RenderWorker] = []
+        self._lock = threading.Lock()
+        self._local_generator = None
+
+    def start(self):
+        """Spawn worker processes so the first batch doesn't pay start-up cost"""
+        with self._lock:
+            if self._all_workers or self.workers == 0:
+                return
+            for _ in range(self.workers):
+                worker = _RenderWorker(self._ctx, self.output_dir, self.backend)
+                worker.start()
+                self._all_workers.append(worker)
+                self._idle.put(worker)
+
+    def map(
+        self,
+        jobs: List[RenderJob],
+        callback: Optional[Callable[[RenderResult], None]] = None
+    ) -> List[RenderResult]:
+        """
+        Render all jobs in parallel
+
+        Args:
+            jobs: List of RenderJob
+            callback: Called with each RenderResult as soon as it completes
+                (use it for progress reporting)
+
+        Returns:
+            List of RenderResult in the same order as jobs
+        """
+        jobs = list(jobs)
+        results: List[Optional[RenderResult]] = [None] * len(jobs)
+        for result in self.imap_unordered(jobs):
+            results[result.index] = result
+            if callback is not None:
+                callback(result)
+        return results
+
+    def imap_unordered(self, jobs: List[RenderJob]) -> Iterator[RenderResult]:
+        """
+        Render all jobs in parallel, yielding results as they complete
+
+        Args:
+            jobs: List of RenderJob
+
+        Yields:
+            RenderResult in completion order (RenderResult.index is the
+            position in jobs)
+        """
+        jobs = list(jobs)
+        if not jobs:
+            return
+
+        if self.workers == 0:
+            for index, job in enumerate(jobs):
+                yield self._run_local(index, job)
+            return
+
+        self.start()
+        executor = ThreadPoolExecutor(max_workers=min(self.workers, len(jobs)))
+        try:
+            futures = [executor.submit(self._dispatch, index, job) for index, job in enumerate(jobs)]
+            for future in as_completed(futures):
+                yield future.result()
+        finally:
+            # Consumer stopped early: drop jobs that haven't been dispatched
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def _dispatch(self, index: int, job: RenderJob) -> RenderResult:
+        worker = self._idle.get()
+        start = time.perf_counter()
+        try:
+            path, error = worker.run(job, self.timeout)
+        except Exception as e:
+            # e.g. the restarted worker's pipe failed too, or the job couldn't be
+            # pickled: fail this job only and leave a dead worker to be restarted
+            worker.kill()
+            path, error = None, f"{type(e).__name__}: {e}"
+        finally:
+            self._idle.put(worker)
+        return RenderResult(index, job, path, error, time.perf_counter() - start)
+
+    def _run_local(self, index: int, job: RenderJob) -> RenderResult:
+        if self._local_generator is None:
+            from .main import ProfessionalDrawingGenerator
+            self._local_generator = ProfessionalDrawingGenerator(self.output_dir, backend=self.backend)
+
+        start = time.perf_counter()
+        path, error = _render_job(self._local_generator, job)
+        return RenderResult(index, job, path, error, time.perf_counter() - start)
+
+    def shutdown(self):
+        """Stop all worker processes"""
+        with self._lock:
+            for worker in self._all_workers:
+                worker.stop()
+            self._all_workers = []
+            self._idle = queue.Queue()
@@ -0,0 +1,602 @@
+"""
+ReportLab Vector Backend
+Renders the professional drawing zones straight to a reportlab canvas
+
+Produces the same 8-zone sheet as the matplotlib backend (spec table,
+frame sections, elevation with dimensions, header, title, project info,
+operation icons) without building a matplotlib figure or running a
+tight-bbox pass. Zone geometry comes from DrawingLayout.zone_rects().
+"""
+import math
+from datetime import datetime
+from typing import Dict, List, Optional, Set, Tuple
+
+from reportlab.lib import colors
+from reportlab.pdfbase import pdfmetrics
+from reportlab.pdfgen import canvas as rl_canvas
+
+from .layout import DrawingLayout
+from .text_bounds import SpecificationTableLayouter, DimensionTextPositioner
+from .components import ConfigurationIcons, ProjectSchedule
+
+
+# Matplotlib font settings -> standard PDF fonts (no embedding needed)
+_FONTS = {
+    ('sans', False, False): 'Helvetica',
+    ('sans', True, False): 'Helvetica-Bold',
+    ('sans', False, True): 'Helvetica-Oblique',
+    ('sans', True, True): 'Helvetica-BoldOblique',
+    ('mono', False, False): 'Courier',
+    ('mono', True, False): 'Courier-Bold',
+    ('mono', False, True): 'Courier-Oblique',
+    ('mono', True, True): 'Courier-BoldOblique',
+}
+
+# Arrow heads in points (matches matplotlib '->' at default mutation scale)
+ARROW_LENGTH = 4.0
+ARROW_HALF_WIDTH = 2.0
+
+# Labels that fall off the sheet are pulled back inside this margin (points)
+PAGE_MARGIN = 18
+
+
+def _color(value) -> colors.Color:
+    return colors.toColor(value)
+
+
+def _on_white(value, alpha: float) -> colors.Color:
+    """Opaque equivalent of a translucent color drawn on the white sheet"""
+    c = _color(value)
+    return colors.Color(*(alpha * v + (1 - alpha) for v in (c.red, c.green, c.blue)))
+
+
+class _Zone:
+    """Maps a zone's 0-10 data coordinates onto a rectangle of the page"""
+
+    def __init__(self, canvas, x: float, y: float, width: float, height: float):
+        self.c = canvas
+        self.x = x
+        self.y = y
+        self.sx = width / 10
+        self.sy = height / 10
+
+    def pt(self, x: float, y: float) -> Tuple[float, float]:
+        return self.x + x * self.sx, self.y + y * self.sy
+
+    def _stroke_style(self, color, width: float, dash=None, alpha: float = 1.0):
+        self.c.setStrokeColor(_color(color))
+        self.c.setStrokeAlpha(alpha)
+        self.c.setLineWidth(width)
+        self.c.setDash(dash or [])
+
+    def line(self, x1, y1, x2, y2, color='black', width: float = 1.0, dash=None, alpha: float = 1.0):
+        self._stroke_style(color, width, dash, alpha)
+        self.c.line(*self.pt(x1, y1), *self.pt(x2, y2))
+
+    def rect(self, x, y, w, h, edgecolor='black', facecolor=None, width: float = 1.0,
+             alpha: float = 1.0, radius: float = 0):
+        """Rectangle in data units (radius > 0 draws a rounded box)"""
+        px, py = self.pt(x, y)
+        pw, ph = w * self.sx, h * self.sy
+        fill = facecolor not in (None, 'none')
+        stroke = edgecolor not in (None, 'none')
+        if fill:
+            self.c.setFillColor(_color(facecolor))
+            self.c.setFillAlpha(alpha)
+        if stroke:
+            self._stroke_style(edgecolor, width, alpha=alpha)
+        if radius:
+            self.c.roundRect(px, py, pw, ph, radius * min(self.sx, self.sy),
+                             stroke=int(stroke), fill=int(fill))
+        else:
+            self.c.rect(px, py, pw, ph, stroke=int(stroke), fill=int(fill))
+        self.c.setFillAlpha(1)
+        self.c.setStrokeAlpha(1)
+
+    def fancy_box(self, x, y, w, h, pad: float, **kwargs):
+        """Equivalent of FancyBboxPatch(boxstyle='round,pad=...')"""
+        self.rect(x - pad, y - pad, w + 2 * pad, h + 2 * pad, radius=pad, **kwargs)
+
+    def arrow_head(self, tip_x, tip_y, tail_x, tail_y, color='black', width: float = 1.0):
+        """Open '->' arrow head at tip, pointing away from tail"""
+        tx, ty = self.pt(tip_x, tip_y)
+        bx, by = self.pt(tail_x, tail_y)
+        angle = math.atan2(ty - by, tx - bx)
+        self._stroke_style(color, width)
+        path = self.c.beginPath()
+        for side in (1, -1):
+            wing = angle + math.pi - side * math.atan2(ARROW_HALF_WIDTH, ARROW_LENGTH)
+            reach = math.hypot(ARROW_LENGTH, ARROW_HALF_WIDTH)
+            path.moveTo(tx + reach * math.cos(wing), ty + reach * math.sin(wing))
+            path.lineTo(tx, ty)
+        self.c.drawPath(path, stroke=1, fill=0)
+
+    def text(self, x, y, s: str, size: float, ha: str = 'left', va: str = 'baseline',
+             bold: bool = False, italic: bool = False, mono: bool = False,
+             color='black', rotation: int = 0, box: Optional[Dict] = None) -> None:
+        """
+        Draw text using matplotlib-style alignment
+
+        Args:
+            box: Optional {'pad', 'facecolor', 'edgecolor', 'alpha'} drawn behind
+                 the text (pad in multiples of the font size, like bbox=dict(...))
+        """
+        font = _FONTS[('mono' if mono else 'sans', bold, italic)]
+        s = str(s)
+        text_width = pdfmetrics.stringWidth(s, font, size)
+        ascent, descent = pdfmetrics.getAscentDescent(font, size)
+
+        if rotation == 90:
+            # matplotlib aligns the rotated bounding box: ha is across the
+            # (now vertical) baseline, va is along the string
+            dx = {'bottom': 0, 'baseline': 0, 'center': -text_width / 2, 'top': -text_width}[va]
+            dy = -{'right': descent, 'center': (ascent + descent) / 2, 'left': ascent}[ha]
+        else:
+            dx = {'left': 0, 'center': -text_width / 2, 'right': -text_width}[ha]
+            dy = {
+                'baseline': 0,
+                'bottom': -descent,
+                'center': -(ascent + descent) / 2,
+                'top': -ascent,
+            }[va]
+
+        px, py = self.pt(x, y)
+        self.c.saveState()
+        self.c.translate(px, py)
+        if rotation:
+            self.c.rotate(rotation)
+
+        if box:
+            pad = box.get('pad', 0.3) * size
+            self.c.setFillColor(_color(box.get('facecolor', 'white')))
+            self.c.setFillAlpha(box.get('alpha', 1.0))
+            edge = box.get('edgecolor', 'none')
+            if edge != 'none':
+                self.c.setStrokeColor(_color(edge))
+                self.c.setLineWidth(0.5)
+            self.c.roundRect(dx - pad, dy + descent - pad, text_width + 2 * pad,
+                             ascent - descent + 2 * pad, pad,
+                             stroke=int(edge != 'none'), fill=1)
+            self.c.setFillAlpha(1)
+
+        self.c.setFillColor(_color(color))
+        self.c.setFont(font, size)
+        self.c.drawString(dx, dy, s)
+        self.c.restoreState()
+
+
+class ReportLabDrawingRenderer:
+    """
+    Draw professional shop drawings directly with reportlab
+
+    Usage:
+        renderer = ReportLabDrawingRenderer()
+        renderer.render(item_data, project_data, 'W-001.pdf')
+    """
+
+    def __init__(self, figsize: Tuple[float, float] = (11, 17)):
+        """
+        Initialize renderer
+
+        Args:
+            figsize: Sheet size in inches (same as DrawingLayout)
+        """
+        self.page_size = (figsize[0] * 72, figsize[1] * 72)
+        self.zone_rects = DrawingLayout(figsize=figsize).zone_rects()
+
+    def render(self, item_data: Dict, project_data: Dict, output_path: str, is_door: bool = False) -> str:
+        """
+        Render one drawing to a PDF file
+
+        Returns:
+            Path to generated PDF file
+        """
+        c = rl_canvas.Canvas(output_path, pagesize=self.page_size, pageCompression=1)
+        self.draw_sheet(c, item_data, project_data, is_door)
+        c.showPage()
+        c.save()
+        print(f"Drawing saved to: {output_path}")
+        return output_path
+
+    def draw_sheet(
+        self,
+        c,
+        item_data: Dict,
+        project_data: Dict,
+        is_door: bool = False,
+        shared_forms: Optional[Set[str]] = None
+    ):
+        """
+        Draw every zone of one sheet onto the current canvas page
+
+        Args:
+            shared_forms: Names of chrome forms already defined on this canvas.
+                When given, the static chrome is defined once per icon set as
+                a PDF form XObject and referenced from each page.
+        """
+        zones = self._zones(c)
+        active_type = item_data.get('window_type', 'FIXED')
+
+        # Frame sections use transparency, so they are drawn per page
+        self._draw_cross_sections(zones['spec_2'])
+
+        if shared_forms is None:
+            self._draw_static_chrome(zones, active_type)
+        else:
+            active = ConfigurationIcons.active_names(active_type)
+            form_name = 'chrome_' + ('_'.join(active) or 'none')
+            if form_name not in shared_forms:
+                c.beginForm(form_name)
+                self._draw_static_chrome(zones, active_type)
+                c.endForm()
+                shared_forms.add(form_name)
+            c.doForm(form_name)
+
+        self._draw_spec_table(zones['spec_1'], item_data)
+        self._draw_elevation(zones['elevation'], item_data)
+        self._draw_title(zones['title'], item_data, is_door)
+        self._draw_project_info(zones['project_info'], item_data, project_data)
+
+    def render_package(
+        self,
+        items: List[Tuple[Dict, bool]],
+        project_data: Dict,
+        output_path: str,
+        cover: bool = True
+    ) -> str:
+        """
+        Render all items into one multi-page PDF
+
+        Args:
+            items: (item_data, is_door) pairs in sheet order
+            project_data: Project info dict
+            output_path: Package PDF path
+            cover: Start with the project schedule page(s)
+
+        Returns:
+            Path to generated PDF file
+        """
+        c = rl_canvas.Canvas(output_path, pagesize=self.page_size, pageCompression=1)
+        c.setTitle(f"{project_data.get('po_number', '')} Shop Drawings")
+        c.setSubject(project_data.get('project_name', ''))
+
+        if cover:
+            pages = ProjectSchedule.page_count(len(items))
+            rows = ProjectSchedule.rows(items, first_sheet=pages + 1)
+            per_page = ProjectSchedule.ROWS_PER_PAGE
+            for page in range(pages):
+                self._draw_schedule(
+                    c, rows[page * per_page:(page + 1) * per_page], project_data,
+                    page + 1, pages, len(items)
+                )
+                c.showPage()
+
+        shared_forms: Set[str] = set()
+        for item_data, is_door in items:
+            self.draw_sheet(c, item_data, project_data, is_door, shared_forms=shared_forms)
+            c.showPage()
+
+        c.save()
+        print(f"Drawing package saved to: {output_path}")
+        return output_path
+
+    def _draw_static_chrome(self, zones: Dict[str, _Zone], active_type: str):
+        """Zone borders, company header and operation icons (no transparency)"""
+        # Zone borders (the cross-section and elevation zones are drawn without)
+        for name, zone in zones.items():
+            if name not in ('spec_2', 'elevation'):
+                zone.rect(0, 0, 10, 10, edgecolor='lightgrey', width=0.5)
+
+        self._draw_header(zones['header'])
+        self._draw_icons(zones['revision'], active_type)
+
+    def _zones(self, c) -> Dict[str, _Zone]:
+        page_w, page_h = self.page_size
+        zones = {}
+        for name, (left, bottom, width, height) in self.zone_rects.items():
+            x, y, w, h = left * page_w, bottom * page_h, width * page_w, height * page_h
+            if name == 'elevation':
+                # Equal aspect: matplotlib shrinks the box to a centered square
+                side = min(w, h)
+                x, y, w, h = x + (w - side) / 2, y + (h - side) / 2, side, side
+            zones[name] = _Zone(c, x, y, w, h)
+        return zones
+
+    # ------------------------------------------------------------------
+    # Zone 1: Specification table
+    # ------------------------------------------------------------------
+
+    def _draw_spec_table(self, zone: _Zone, item_data: Dict, min_column_padding: float = 2.0):
+        data = [
+            ("Glass:", item_data.get('glass_type', 'Standard')),
+            ("Frame Color:", item_data.get('frame_color', 'White')),
+            ("Screen Spec:", item_data.get('screen', 'None')),
+            ("Hardware:", item_data.get('hardware', 'Standard')),
+            ("Quantity:", str(item_data.get('quantity', 1))),
+        ]
+        title = item_data.get('item_number', 'ITEM')
+
+        label_width, value_width = SpecificationTableLayouter.calculate_column_widths(data, 9.6)
+
+        zone.fancy_box(0.2, 8.5, 9.6, 1.2, pad=0.1, facecolor='#333333', edgecolor='black', width=1.5)
+        truncated_title = SpecificationTableLayouter.truncate_text(title, 9.6 - 0.4, char_width=1.1)
+        zone.text(5, 9.1, truncated_title, 11, ha='center', va='center', bold=True, color='white')
+
+        row_height = 1.0
+        for i, (label, value) in enumerate(data):
+            y = 8.5 - (i + 1) * row_height
+            if y < 0.5:
+                break
+
+            zone.rect(0.2, y - row_height + 0.2, 9.6, row_height - 0.2,
+                      edgecolor='lightgrey', facecolor='#f5f5f5' if i % 2 == 0 else 'white',
+                      width=0.5)
+
+            text_y = y - row_height / 2
+            truncated_label = SpecificationTableLayouter.truncate_text(
+                label, label_width - min_column_padding, char_width=1.0
+            )
+            zone.text(0.5, text_y, truncated_label, 8, va='center', bold=True)
+
+            truncated_value = SpecificationTableLayouter.truncate_text(
+                value, value_width - min_column_padding, char_width=1.0
+            )
+            zone.text(label_width + 0.3, text_y, truncated_value, 8, va='center')
+
+    # ------------------------------------------------------------------
+    # Zone 2: Frame cross-sections (static)
+    # ------------------------------------------------------------------
+
+    def _draw_cross_sections(self, zone: _Zone):
+        zone.text(5, 9.5, 'FRAME SECTIONS', 9, ha='center', va='top', bold=True)
+
+        # Vertical section
+        v_y_base, v_y_top, v_x_center = 5, 8.5, 2.5
+        frame_width = 1.2
+        flange_width, flange_thickness = 0.8, 0.15
+        zone.rect(v_x_center - frame_width / 2, v_y_base, frame_width, v_y_top - v_y_base,
+                  facecolor='lightgrey', width=1.5, alpha=0.3)
+        zone.rect(v_x_center - frame_width / 2 - flange_width, v_y_base + 0.5,
+                  flange_width, flange_thickness, edgecolor='red', facecolor='red', width=1.2, alpha=0.4)
+        zone.rect(v_x_center + frame_width / 2, v_y_base + 0.5,
+                  flange_width, flange_thickness, edgecolor='red', facecolor='red', width=1.2, alpha=0.4)
+        zone.text(v_x_center - frame_width / 2 - flange_width / 2, v_y_base + 0.35,
+                  'Nail Fin', 5, ha='center', bold=True, color='red')
+        zone.text(0.5, v_y_base + 1.5, 'INT', 6, ha='center', italic=True)
+        zone.text(4.5, v_y_base + 1.5, 'EXT', 6, ha='center', italic=True)
+        for dx in (-0.3, 0.3):
+            zone.line(v_x_center + dx, v_y_base, v_x_center + dx, v_y_top,
+                      width=0.5, dash=[3, 2], alpha=0.5)
+        zone.text(2.5, 4.5, 'VERTICAL SECTION', 7, ha='center', bold=True)
+
+        # Horizontal section
+        h_y_base, h_y_top, h_x_start, h_x_end = 0.5, 3, 1, 9
+        h_y_center = (h_y_base + h_y_top) / 2
+        frame_height = 0.8
+        zone.rect(h_x_start + 1, h_y_center - frame_height / 2, h_x_end - h_x_start - 2, frame_height,
+                  facecolor='lightgrey', width=1.5, alpha=0.3)
+        for flange_y in (h_y_center + frame_height / 2,
+                         h_y_center - frame_height / 2 - flange_thickness):
+            zone.rect(h_x_start + 1.5, flange_y, h_x_end - h_x_start - 3, flange_thickness,
+                      edgecolor='red', facecolor='red', width=1.2, alpha=0.4)
+        for dy in (-0.2, 0.2):
+            zone.line(h_x_start + 2, h_y_center + dy, h_x_end - 2, h_y_center + dy,
+                      width=0.5, dash=[3, 2], alpha=0.5)
+        zone.text(5, 0.2, 'HORIZONTAL SECTION', 7, ha='center', bold=True)
+
+        dim_y = h_y_center + frame_height / 2 + flange_thickness + 0.3
+        zone.line(h_x_start + 1.5, dim_y, h_x_start + 2.3, dim_y, color='red', width=0.6)
+        zone.arrow_head(h_x_start + 1.5, dim_y, h_x_start + 2.3, dim_y, color='red', width=0.6)
+        zone.arrow_head(h_x_start + 2.3, dim_y, h_x_start + 1.5, dim_y, color='red', width=0.6)
+        zone.text(h_x_start + 1.9, dim_y + 0.15, '30mm', 6, ha='center', color='red')
+
+    # ------------------------------------------------------------------
+    # Zone 3: Elevation with dimensions
+    # ------------------------------------------------------------------
+
+    def _draw_elevation(self, zone: _Zone, item_data: Dict):
+        width = float(item_data.get('width_inches', 36))
+        height = float(item_data.get('height_inches', 48))
+        window_type = str(item_data.get('window_type', 'Fixed')).upper()
+
+        offset_x, offset_y, scaled_width, scaled_height = DrawingLayout.elevation_frame(width, height)
+        top = offset_y + scaled_height
+        right = offset_x + scaled_width
+
+        zone.rect(offset_x, offset_y, scaled_width, scaled_height, width=2)
+
+        if 'SLIDER' in window_type or 'PATIO' in window_type or 'SLIDING' in window_type:
+            panel_width = scaled_width / 4
+            for i in range(1, 4):
+                x = offset_x + i * panel_width
+                zone.line(x, offset_y, x, top, width=1.5)
+            mid_y = offset_y + scaled_height / 2
+            zone.line(offset_x, mid_y, right, mid_y, width=1.5)
+            for i in range(4):
+                x_center = offset_x + (i + 0.5) * panel_width
+                zone.text(x_center, offset_y + scaled_height * 0.75, 'F.', 8,
+                          ha='center', va='center', bold=True)
+                if i < 2:
+                    arrow_y = offset_y + scaled_height * 0.25
+                    zone.line(x_center - 0.2, arrow_y, x_center + 0.2, arrow_y)
+                    zone.arrow_head(x_center + 0.2, arrow_y, x_center - 0.2, arrow_y)
+
+        elif 'CASEMENT' in window_type:
+            mid_x = offset_x + scaled_width / 2
+            zone.line(mid_x, offset_y, mid_x, top, width=1.5)
+            zone.line(offset_x, offset_y, mid_x, top, width=0.8, dash=[4, 2], alpha=0.6)
+            zone.line(mid_x, offset_y, right, top, width=0.8, dash=[4, 2], alpha=0.6)
+
+        elif 'AWNING' in window_type or 'HOPPER' in window_type:
+            mid_y = offset_y + scaled_height / 2
+            zone.line(offset_x, mid_y, right, mid_y, width=1.5)
+            zone.line(offset_x, offset_y, right, top, width=0.8, dash=[4, 2], alpha=0.6)
+
+        else:  # FIXED
+            zone.text(offset_x + scaled_width / 2, offset_y + scaled_height / 2, 'F.', 10,
+                      ha='center', va='center', bold=True)
+
+        self._draw_dimension_horizontal(zone, offset_x, right, offset_y - 0.8, f'{width:.0f}"')
+        self._draw_dimension_vertical(zone, offset_x - 0.8, offset_y, top, f'{height:.0f}"')
+
+        zone.text(5, 0.3, "ELEVATION VIEW", 10, ha='center', va='bottom', bold=True, italic=True)
+
+    def _draw_dimension_horizontal(self, zone: _Zone, x1, x2, y, dimension: str, above: bool = False):
+        """Same geometry as DimensionLine.draw_horizontal (scale 1)"""
+        ext = 0.125
+        zone.line(x1, y - ext, x1, y + ext)
+        zone.line(x2, y - ext, x2, y + ext)
+        zone.line(x1, y, x2, y)
+        zone.arrow_head(x1 + 0.15, y, x1, y)
+        zone.arrow_head(x2 - 0.15, y, x2, y)
+
+        offset = max(0.2, DimensionTextPositioner.calculate_offset(dimension, abs(x2 - x1), fontsize=9))
+        text_y = y + offset if above else y - offset
+        zone.text((x1 + x2) / 2, text_y, dimension, 9, ha='center',
+                  va='bottom' if above else 'top', bold=True,
+                  box={'pad': 0.4, 'facecolor': 'white', 'alpha': 0.9})
+
+    def _draw_dimension_vertical(self, zone: _Zone, x, y1, y2, dimension: str, left: bool = True):
+        """Same geometry as DimensionLine.draw_vertical (scale 1)"""
+        ext = 0.125
+        zone.line(x - ext, y1, x + ext, y1)
+        zone.line(x - ext, y2, x + ext, y2)
+        zone.line(x, y1, x, y2)
+        zone.arrow_head(x, y1 + 0.15, x, y1)
+        zone.arrow_head(x, y2 - 0.15, x, y2)
+
+        offset = DimensionTextPositioner.calculate_offset(dimension, abs(y2 - y1), fontsize=9)
+        text_x = x - offset if left else x + offset
+        # matplotlib's tight bbox grows the sheet to fit far-off labels; the
+        # fixed reportlab page can't, so keep the label inside the margin
+        text_x = max(text_x, (PAGE_MARGIN + 9 - zone.x) / zone.sx)
+        zone.text(text_x, (y1 + y2) / 2, dimension, 9, ha='right' if left else 'left',
+                  va='center', bold=True, rotation=90,
+                  box={'pad': 0.4, 'facecolor': 'white', 'alpha': 0.9})
+
+    # ------------------------------------------------------------------
+    # Zones 5-7: Header, title, project info
+    # ------------------------------------------------------------------
+
+    def _draw_header(self, zone: _Zone, company_name: str = "RAVEN CUSTOM GLASS"):
+        zone.fancy_box(0.2, 2, 9.6, 8, pad=0.15, facecolor='#f0f0f0', edgecolor='black', width=2)
+        zone.text(5, 8, company_name, 14, ha='center', va='center', bold=True, mono=True)
+        zone.text(5, 6.5, "Technical Shop Drawings", 10, ha='center', va='center',
+                  italic=True, color='#666666')
+        zone.text(5, 5, "Professional Window & Door Drawings", 8, ha='center', va='center',
+                  color='#888888')
+
+    def _draw_title(self, zone: _Zone, item_data: Dict, is_door: bool):
+        zone.fancy_box(0.2, 2, 9.6, 8, pad=0.1, facecolor='white', edgecolor='black', width=1.5)
+        zone.text(5, 8, "DOOR" if is_door else "WINDOW", 12, ha='center', va='center', bold=True)
+        zone.text(5, 6.5, f"Item: {item_data.get('item_number', 'UNKNOWN')}", 10,
+                  ha='center', va='center', mono=True)
+        zone.text(5, 5, "ELEVATION", 10, ha='center', va='center', italic=True, color='#333333')
+
+    def _draw_project_info(self, zone: _Zone, item_data: Dict, project_data: Dict):
+        width = item_data.get('width_inches', 36)
+        zone.fancy_box(0.2, 0.2, 9.6, 9.8, pad=0.1, facecolor='#fafafa', edgecolor='black', width=1)
+
+        info_data = [
+            ("Project", project_data.get('project_name', 'Project')),
+            ("PO Number", project_data.get('po_number', 'PO-XXX')),
+            ("Customer", project_data.get('customer_name', 'Customer')),
+            ("Date", datetime.now().strftime("%m/%d/%Y")),
+            ("Scale", "1/4\" = 1'" if width < 48 else "1/8\" = 1'\""),
+        ]
+
+        row_height = 1.8
+        for i, (label, value) in enumerate(info_data):
+            y = 9 - i * row_height
+            zone.text(0.8, y, label + ":", 7, va='center', bold=True)
+            zone.text(0.8, y - 0.5, value, 8, va='center', mono=True,
+                      box={'pad': 0.3, 'facecolor': 'white', 'edgecolor': 'lightgrey'})
+
+    # ------------------------------------------------------------------
+    # Zone 8: Operation icons
+    # ------------------------------------------------------------------
+
+    def _draw_icons(self, zone: _Zone, active_type: str):
+        active = ConfigurationIcons.active_names(active_type)
+        zone.text(5, 9.5, 'OPERATION TYPES', 9, ha='center', va='top', bold=True)
+
+        for name, _, x, y in ConfigurationIcons.ICONS:
+            is_active = name in active
+            # Pre-blended instead of alpha so the icons can live in a shared
+            # form XObject (reportlab forms carry no ExtGState resources)
+            alpha = 0.7 if is_active else 0.3
+            zone.rect(x - 1, y - 0.9, 2, 1.8,
+                      edgecolor=_on_white('red' if is_active else 'black', alpha),
+                      facecolor=_on_white('yellow' if is_active else 'white', alpha),
+                      width=2 if is_active else 1)
+            self._draw_icon_symbol(zone, name, x, y + 0.2, bold=is_active)
+            zone.text(x, y - 0.6, name, 6, ha='center', va='center', bold=is_active)
+
+    def _draw_icon_symbol(self, zone: _Zone, name: str, x: float, y: float, bold: bool):
+        """Vector pictogram for each operation type (standard PDF fonts lack the glyphs)"""
+        width = 1.2 if bold else 0.8
+        s = 0.35  # half size in data units
+
+        def poly(points: List[Tuple[float, float]], closed: bool = True):
+            for (x1, y1), (x2, y2) in zip(points, points[1:] + (points[:1] if closed else [])):
+                zone.line(x + x1, y + y1, x + x2, y + y2, width=width)
+
+        if name == 'FIXED':
+            poly([(-s, -s), (s, -s), (s, s), (-s, s)])
+        elif name == 'CASEMENT':
+            poly([(-0.05, -s), (-0.05, s), (-2 * s, 0)])
+            poly([(0.05, -s), (0.05, s), (2 * s, 0)])
+        elif name == 'AWNING':
+            poly([(-s, -s), (s, -s), (0, s)])
+        elif name == 'SLIDER':
+            zone.line(x - s, y + 0.1, x + s, y + 0.1, width=width)
+            zone.arrow_head(x + s, y + 0.1, x - s, y + 0.1, width=width)
+            zone.line(x - s, y - 0.1, x + s, y - 0.1, width=width)
+            zone.arrow_head(x - s, y - 0.1, x + s, y - 0.1, width=width)
+        elif name == 'BIFOLD':
+            poly([(-0.1, -s), (-0.1, s), (-s - 0.2, 0)])
+            poly([(0.1, -s), (0.1, s), (s + 0.2, 0)])
+        elif name == 'ACCORDION':
+            poly([(-2 * s, -s), (-s, s), (0, -s), (s, s), (2 * s, -s)], closed=False)
+
+    # ------------------------------------------------------------------
+    # Package cover: project schedule
+    # ------------------------------------------------------------------
+
+    def _draw_schedule(
+        self,
+        c,
+        rows: List[Tuple[str, ...]],
+        project_data: Dict,
+        page: int,
+        pages: int,
+        total_items: int
+    ):
+        """Same layout as components.ProjectSchedule on a full-page zone"""
+        page_w, page_h = self.page_size
+        zone = _Zone(c, page_w * 0.05, page_h * 0.05, page_w * 0.9, page_h * 0.9)
+
+        zone.fancy_box(0.2, 9.3, 9.6, 0.5, pad=0.05, facecolor='#333333', edgecolor='black', width=1.5)
+        zone.text(5, 9.55, 'PROJECT SCHEDULE', 14, ha='center', va='center', bold=True, color='white')
+
+        summary = (
+            f"{project_data.get('project_name', 'Project')}  |  "
+            f"PO {project_data.get('po_number', 'PO-XXX')}  |  "
+            f"{project_data.get('customer_name', 'Customer')}  |  "
+            f"{total_items} item(s)"
+        )
+        zone.text(0.2, 9.05, summary, 8, va='center', mono=True)
+        zone.text(9.8, 9.05, f'Page {page} of {pages}', 8, ha='right', va='center', italic=True)
+
+        row_height = ProjectSchedule.row_height()
+        y = ProjectSchedule.TABLE_TOP
+        zone.rect(0.1, y - row_height, 9.8, row_height, facecolor='#dddddd', width=0.8)
+        for header, x, _ in ProjectSchedule.COLUMNS:
+            zone.text(x, y - row_height / 2, header, 7, va='center', bold=True)
+
+        for i, row in enumerate(rows[:ProjectSchedule.ROWS_PER_PAGE]):
+            y = ProjectSchedule.TABLE_TOP - (i + 1) * row_height
+            zone.rect(0.1, y - row_height, 9.8, row_height, edgecolor='lightgrey',
+                      facecolor='#f5f5f5' if i % 2 == 0 else 'white', width=0.5)
+            for cell, (_, x, _) in zip(row, ProjectSchedule.COLUMNS):
+                zone.text(x, y - row_height / 2, cell, 7, va='center')
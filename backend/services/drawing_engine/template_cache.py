@@ -0,0 +1,139 @@
+"""
+Drawing Template Cache
+Reuses the static chrome of a sheet (grid layout, company header, operation
+icons, zone borders, frame cross-sections) across drawings
+
+A template is built once per key (page size + highlighted operation icons).
+Each render draws only the item-specific artists on top of it; releasing the
+template removes those artists again so the next render starts clean.
+"""
+import threading
+from typing import Callable, Dict, Hashable, List
+
+from .layout import DrawingLayout
+
+
+class DrawingTemplate:
+    """A laid-out figure whose current artists are the static chrome"""
+
+    def __init__(self, key: Hashable, layout: DrawingLayout):
+        """
+        Initialize template from a layout that already has its chrome drawn
+
+        Args:
+            key: Cache key the template was built for
+            layout: DrawingLayout with create_layout() called
+        """
+        self.key = key
+        self.layout = layout
+        self.fig = layout.fig
+        self.zones = layout.zones
+        self._static = {}
+        self._view = {}
+
+    @staticmethod
+    def _artists(ax) -> List:
+        return (
+            list(ax.patches) + list(ax.lines) + list(ax.texts) +
+            list(ax.collections) + list(ax.images) + list(ax.artists)
+        )
+
+    def freeze(self) -> None:
+        """Record the current artists and view limits as the static chrome"""
+        for name, ax in self.zones.items():
+            self._static[name] = set(self._artists(ax))
+            self._view[name] = (ax.get_xlim(), ax.get_ylim(), ax.get_aspect(), ax.axison)
+
+    def reset(self) -> None:
+        """Remove everything drawn since freeze() and restore view limits"""
+        for name, ax in self.zones.items():
+            static = self._static.get(name, set())
+            for artist in self._artists(ax):
+                if artist not in static:
+                    artist.remove()
+
+            xlim, ylim, aspect, axison = self._view[name]
+            ax.set_xlim(xlim)
+            ax.set_ylim(ylim)
+            ax.set_aspect(aspect)
+            ax.axison = axison
+
+
+class DrawingTemplateCache:
+    """
+    Thread-safe pool of built DrawingTemplates keyed by page size/template
+
+    Templates are checked out with acquire() and must be handed back with
+    release(); a template is only ever used by one render at a time.
+    """
+
+    def __init__(self, max_idle_per_key: int = 2):
+        """
+        Initialize template cache
+
+        Args:
+            max_idle_per_key: Idle templates kept per key (extras are dropped)
+        """
+        self.max_idle_per_key = max_idle_per_key
+        self._idle: Dict[Hashable, List[DrawingTemplate]] = {}
+        self._lock = threading.Lock()
+        self.builds = 0
+        self.hits = 0
+
+    def acquire(self, key: Hashable, build: Callable[[], DrawingTemplate]) -> DrawingTemplate:
+        """
+        Check out a template for key, building it if none is idle
+
+        Args:
+            key: Template key (e.g., (figsize, active icon names))
+            build: Callable returning a new DrawingTemplate with chrome drawn
+
+        Returns:
+            DrawingTemplate ready for item-specific drawing
+        """
+        with self._lock:
+            idle = self._idle.get(key)
+            if idle:
+                self.hits += 1
+                return idle.pop()
+            self.builds += 1
+
+        template = build()
+        template.freeze()
+        return template
+
+    def release(self, template: DrawingTemplate) -> None:
+        """Strip item-specific artists and return the template to the pool"""
+        template.reset()
+        with self._lock:
+            idle = self._idle.setdefault(template.key, [])
+            if len(idle) < self.max_idle_per_key:
+                idle.append(template)
+                return
+        template.layout.close()
+
+    def clear(self) -> None:
+        """Drop all cached templates (e.g., after changing the chrome)"""
+        with self._lock:
+            idle, self._idle = self._idle, {}
+        for templates in idle.values():
+            for template in templates:
+                template.layout.close()
+
+    def stats(self) -> Dict[str, int]:
+        """Cache counters"""
+        with self._lock:
+            return {
+                'builds': self.builds,
+                'hits': self.hits,
+                'idle': sum(len(idle) for idle in self._idle.values()),
+            }
+
+
+# Process-wide template cache
+_template_cache = DrawingTemplateCache()
+
+
+def get_template_cache() -> DrawingTemplateCache:
+    """Get the process-wide drawing template cache"""
+    return _template_cache
@@ -1,17 +1,24 @@
 """
 Text Bounds and Collision Detection
 Handles text positioning, collision detection, and smart text layout
-Uses ReportLab's stringWidth for accurate text measurement
+Text is measured with real glyph advance widths (see font_metrics)
 """
 
-from typing import List, Dict, Tuple, Optional
+from typing import List, Dict, Tuple, Optional, Set, Iterator
 from dataclasses import dataclass
+from functools import lru_cache
 import math
 
+import numpy as np
+
+from .font_metrics import FontMetrics, DEFAULT_FAMILY
+
 
 @dataclass
 class TextBounds:
     """Represents text bounding box with position and dimensions"""
+    __slots__ = ('x', 'y', 'width', 'height')
+    
     x: float  # Left edge
     y: float  # Bottom edge
     width: float  # Text width
@@ -67,62 +74,188 @@ class TextBounds:
         return math.sqrt(dx**2 + dy**2)
 
 
-class TextBoundsCalculator:
+class TextBoundsStore:
     """
-    Calculates text bounds and handles collision detection
-    Uses approximate font measurements (can integrate ReportLab later)
+    Compact column store of placed TextBounds
+    
+    Boxes live in one preallocated NumPy array (x, y, width, height, x_max,
+    y_max per row) that doubles when full. Overlap and distance queries run
+    over the columns without creating a TextBounds per box; indexing and
+    iteration return TextBounds views for code that expects a list.
     """
     
-    # Standard font dimensions (approximate at different sizes)
-    # Format: font_size -> (char_width_ratio, line_height_ratio)
-    FONT_METRICS = {
-        5: (0.45, 0.6),
-        6: (0.50, 0.7),
-        7: (0.55, 0.8),
-        8: (0.60, 0.9),
-        9: (0.65, 1.0),
-        10: (0.70, 1.1),
-        12: (0.80, 1.3),
-        14: (0.90, 1.5),
-    }
+    X, Y, WIDTH, HEIGHT, X_MAX, Y_MAX = range(6)
     
-    @staticmethod
-    def _get_font_metrics(fontsize: int) -> Tuple[float, float]:
+    def __init__(self, bounds=(), capacity: int = 64):
         """
-        Get or interpolate font metrics for a given font size
+        Initialize store
         
         Args:
-            fontsize: Font size in points
+            bounds: Initial TextBounds
+            capacity: Initial number of preallocated rows
+        """
+        self._data = np.empty((max(1, capacity), 6), dtype=float)
+        self._size = 0
+        # Bumped by anything other than appending (indexes must rebuild)
+        self.mutations = 0
+        self.extend(bounds)
+    
+    def _reserve(self, rows: int) -> None:
+        capacity = len(self._data)
+        if rows <= capacity:
+            return
+        while capacity < rows:
+            capacity *= 2
+        data = np.empty((capacity, 6), dtype=float)
+        data[:self._size] = self._data[:self._size]
+        self._data = data
+    
+    def add(self, x: float, y: float, width: float, height: float) -> int:
+        """Append a box, returning its row index"""
+        index = self._size
+        self._reserve(index + 1)
+        # x_max/y_max use the same arithmetic as the TextBounds properties
+        self._data[index] = (x, y, width, height, x + width, y + height)
+        self._size = index + 1
+        return index
+    
+    def append(self, bounds: TextBounds) -> None:
+        self.add(bounds.x, bounds.y, bounds.width, bounds.height)
+    
+    def extend(self, bounds) -> None:
+        for item in bounds:
+            self.append(item)
+    
+    def pop(self, index: int = -1) -> TextBounds:
+        bounds = self[index]
+        index = range(self._size)[index]
+        self._data[index:self._size - 1] = self._data[index + 1:self._size]
+        self._size -= 1
+        self.mutations += 1
+        return bounds
+    
+    def clear(self) -> None:
+        self._size = 0
+        self.mutations += 1
+    
+    def __len__(self) -> int:
+        return self._size
+    
+    def _view(self, index: int) -> TextBounds:
+        x, y, width, height = self._data[index, :4].tolist()
+        return TextBounds(x, y, width, height)
+    
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._view(i) for i in range(self._size)[index]]
+        return self._view(range(self._size)[index])
+    
+    def __iter__(self) -> Iterator[TextBounds]:
+        for x, y, width, height in self._data[:self._size, :4].tolist():
+            yield TextBounds(x, y, width, height)
+    
+    def __eq__(self, other) -> bool:
+        if isinstance(other, TextBoundsStore):
+            return np.array_equal(self._data[:self._size, :4], other._data[:other._size, :4])
+        try:
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        except TypeError:
+            return NotImplemented
+    
+    def __repr__(self) -> str:
+        return f"TextBoundsStore({list(self)!r})"
+    
+    def column(self, name: int, rows=None) -> np.ndarray:
+        """One column (e.g. TextBoundsStore.X_MAX) for all rows or the given rows"""
+        values = self._data[:self._size, name]
+        return values if rows is None else values[rows]
+    
+    def extents(self, start: int = 0, stop: Optional[int] = None) -> List[List[float]]:
+        """[x_min, y_min, x_max, y_max] of rows start..stop as plain floats"""
+        columns = [self.X, self.Y, self.X_MAX, self.Y_MAX]
+        return self._data[start:self._size if stop is None else stop, columns].tolist()
+    
+    def overlaps(self, x_min, y_min, x_max, y_max, padding: float = 0, rows=None) -> np.ndarray:
+        """
+        Overlap test of candidate boxes against stored boxes
         
-        Returns:
-            Tuple of (char_width_ratio, line_height_ratio)
-        """
-        if fontsize in TextBoundsCalculator.FONT_METRICS:
-            return TextBoundsCalculator.FONT_METRICS[fontsize]
-        
-        sizes = sorted(TextBoundsCalculator.FONT_METRICS.keys())
-        if fontsize < sizes[0]:
-            return TextBoundsCalculator.FONT_METRICS[sizes[0]]
-        if fontsize > sizes[-1]:
-            return TextBoundsCalculator.FONT_METRICS[sizes[-1]]
-        
-        for i in range(len(sizes) - 1):
-            if sizes[i] < fontsize < sizes[i+1]:
-                f = (fontsize - sizes[i]) / (sizes[i+1] - sizes[i])
-                char_width_ratio = (
-                    TextBoundsCalculator.FONT_METRICS[sizes[i]][0] +
-                    f * (TextBoundsCalculator.FONT_METRICS[sizes[i+1]][0] -
-                         TextBoundsCalculator.FONT_METRICS[sizes[i]][0])
-                )
-                line_height_ratio = (
-                    TextBoundsCalculator.FONT_METRICS[sizes[i]][1] +
-                    f * (TextBoundsCalculator.FONT_METRICS[sizes[i+1]][1] -
-                         TextBoundsCalculator.FONT_METRICS[sizes[i]][1])
-                )
-                return char_width_ratio, line_height_ratio
+        Same predicate as TextBounds.overlaps_with (candidate as self).
         
-        return TextBoundsCalculator.FONT_METRICS[sizes[0]]
+        Args:
+            x_min, y_min, x_max, y_max: Candidate extents (scalars or arrays)
+            padding: Padding applied to both boxes
+            rows: Stored rows to test (default: all)
+        
+        Returns:
+            Boolean array (candidates x rows)
+        """
+        x_min, y_min, x_max, y_max = (
+            np.atleast_1d(np.asarray(value, dtype=float))[:, None]
+            for value in (x_min, y_min, x_max, y_max)
+        )
+        return (
+            (x_min - padding <= self.column(self.X_MAX, rows) + padding) &
+            (x_max + padding >= self.column(self.X, rows) - padding) &
+            (y_min - padding <= self.column(self.Y_MAX, rows) + padding) &
+            (y_max + padding >= self.column(self.Y, rows) - padding)
+        )
+    
+    # Below this many rows a plain float loop beats array operations
+    SMALL_QUERY_ROWS = 48
+    
+    def any_overlap(self, bounds: TextBounds, padding: float = 0, rows=None) -> bool:
+        """True if bounds overlaps any stored (or the given) rows"""
+        data = self._data[:self._size] if rows is None else self._data[rows]
+        if not len(data):
+            return False
+        
+        # overlaps() for a single candidate, with its side of each test as scalars
+        x_min = bounds.x_min - padding
+        x_max = bounds.x_max + padding
+        y_min = bounds.y_min - padding
+        y_max = bounds.y_max + padding
+        
+        if len(data) <= self.SMALL_QUERY_ROWS:
+            for x, y, _, _, placed_x_max, placed_y_max in data.tolist():
+                if (x_min <= placed_x_max + padding and x_max >= x - padding and
+                        y_min <= placed_y_max + padding and y_max >= y - padding):
+                    return True
+            return False
+        
+        return bool((
+            (x_min <= data[:, self.X_MAX] + padding) &
+            (x_max >= data[:, self.X] - padding) &
+            (y_min <= data[:, self.Y_MAX] + padding) &
+            (y_max >= data[:, self.Y] - padding)
+        ).any())
+    
+    def distances_to(self, bounds: TextBounds, rows=None) -> np.ndarray:
+        """TextBounds.distance_to from bounds to every stored (or the given) row"""
+        dx = np.maximum(
+            np.maximum(bounds.x_min - self.column(self.X_MAX, rows), 0),
+            self.column(self.X, rows) - bounds.x_max
+        )
+        dy = np.maximum(
+            np.maximum(bounds.y_min - self.column(self.Y_MAX, rows), 0),
+            self.column(self.Y, rows) - bounds.y_max
+        )
+        return np.sqrt(dx ** 2 + dy ** 2)
+    
+    def nearest(self, bounds: TextBounds) -> Tuple[Optional[int], float]:
+        """(row, distance) of the stored box closest to bounds, (None, inf) if empty"""
+        if self._size == 0:
+            return None, math.inf
+        distances = self.distances_to(bounds)
+        index = int(np.argmin(distances))
+        return index, float(distances[index])
+
 
+class TextBoundsCalculator:
+    """
+    Calculates text bounds and handles collision detection
+    Widths and heights come from the rendered fonts' metrics (FontMetrics)
+    """
+    
     @staticmethod
     def _adjust_position_for_alignment(
         x: float, y: float, width: float, height: float,
@@ -162,7 +295,8 @@ class TextBoundsCalculator:
         fontsize: int = 8,
         ha: str = 'left',
         va: str = 'baseline',
-        bold: bool = False
+        bold: bool = False,
+        family: str = DEFAULT_FAMILY
     ) -> TextBounds:
         """
         Calculate bounding box for text
@@ -174,15 +308,12 @@ class TextBoundsCalculator:
             ha: Horizontal alignment ('left', 'center', 'right')
             va: Vertical alignment ('baseline', 'bottom', 'center', 'top')
             bold: Whether text is bold (affects width)
+            family: Font family the text is rendered with
         
         Returns:
             TextBounds object with calculated dimensions
         """
-        char_width_ratio, line_height_ratio = TextBoundsCalculator._get_font_metrics(fontsize)
-        
-        bold_factor = 1.1 if bold else 1.0
-        width = len(text) * fontsize * char_width_ratio * bold_factor
-        height = fontsize * line_height_ratio
+        width, height = FontMetrics.text_size(text, fontsize, bold, family)
         
         x, y = TextBoundsCalculator._adjust_position_for_alignment(
             x, y, width, height, ha, va
@@ -191,22 +322,177 @@ class TextBoundsCalculator:
         return TextBounds(x=x, y=y, width=width, height=height)
 
 
+class SpatialGrid:
+    """
+    Uniform grid index over bounding boxes
+    
+    Each box is registered in every cell it touches, so a query only has to
+    look at boxes in the cells its own area touches instead of all of them.
+    Boxes that would span more than MAX_CELLS_PER_BOX cells are kept in a
+    separate list that every query checks.
+    """
+    
+    MAX_CELLS_PER_BOX = 64
+    
+    def __init__(self, cell_size: float = 20.0):
+        """
+        Initialize spatial grid
+        
+        Args:
+            cell_size: Edge length of a grid cell (same units as the boxes)
+        """
+        if cell_size <= 0:
+            raise ValueError("cell_size must be positive")
+        self.cell_size = cell_size
+        self._cells: Dict[Tuple[int, int], List[int]] = {}
+        self._oversized: List[int] = []
+    
+    def _cell_range(
+        self, x_min: float, y_min: float, x_max: float, y_max: float
+    ) -> Tuple[int, int, int, int]:
+        size = self.cell_size
+        return (
+            math.floor(x_min / size), math.floor(y_min / size),
+            math.floor(x_max / size), math.floor(y_max / size)
+        )
+    
+    @staticmethod
+    def _finite(x_min: float, y_min: float, x_max: float, y_max: float) -> bool:
+        # A sum is non-finite if any term is (or on overflow - then the
+        # extent is treated as unbounded, which is still correct)
+        return math.isfinite(x_min + y_min + x_max + y_max)
+    
+    def insert(self, key: int, x_min: float, y_min: float, x_max: float, y_max: float) -> None:
+        """Register box key covering the given extent"""
+        if not self._finite(x_min, y_min, x_max, y_max):
+            self._oversized.append(key)
+            return
+        
+        cx0, cy0, cx1, cy1 = self._cell_range(x_min, y_min, x_max, y_max)
+        if (cx1 - cx0 + 1) * (cy1 - cy0 + 1) > self.MAX_CELLS_PER_BOX:
+            self._oversized.append(key)
+            return
+        for cx in range(cx0, cx1 + 1):
+            for cy in range(cy0, cy1 + 1):
+                self._cells.setdefault((cx, cy), []).append(key)
+    
+    def query(self, x_min: float, y_min: float, x_max: float, y_max: float) -> Set[int]:
+        """Keys of boxes registered in any cell the extent touches"""
+        found = set(self._oversized)
+        if not self._finite(x_min, y_min, x_max, y_max):
+            for keys in self._cells.values():
+                found.update(keys)
+            return found
+        
+        cx0, cy0, cx1, cy1 = self._cell_range(x_min, y_min, x_max, y_max)
+        
+        if (cx1 - cx0 + 1) * (cy1 - cy0 + 1) > len(self._cells):
+            # Query covers more cells than are occupied: walk occupied cells
+            for (cx, cy), keys in self._cells.items():
+                if cx0 <= cx <= cx1 and cy0 <= cy <= cy1:
+                    found.update(keys)
+            return found
+        
+        for cx in range(cx0, cx1 + 1):
+            for cy in range(cy0, cy1 + 1):
+                keys = self._cells.get((cx, cy))
+                if keys:
+                    found.update(keys)
+        return found
+    
+    def clear(self) -> None:
+        """Remove all boxes"""
+        self._cells = {}
+        self._oversized = []
+
+
+@lru_cache(maxsize=32)
+def _spiral_offsets(search_radius: float, search_steps: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Offsets of every spiral candidate in search order (step-major, angle-minor)
+    
+    Computed with the same float operations as the scalar search so both
+    paths try exactly the same positions.
+    """
+    offsets_x = []
+    offsets_y = []
+    angle_step = 360.0 / search_steps
+    for step in range(1, search_steps + 1):
+        distance = search_radius * (step / search_steps)
+        for i in range(search_steps):
+            rad = math.radians(i * angle_step)
+            offsets_x.append(distance * math.cos(rad))
+            offsets_y.append(distance * math.sin(rad))
+    
+    offsets_x = np.array(offsets_x)
+    offsets_y = np.array(offsets_y)
+    offsets_x.flags.writeable = False
+    offsets_y.flags.writeable = False
+    return offsets_x, offsets_y
+
+
 class CollisionDetector:
-    """Detects and resolves text collisions"""
+    """
+    Detects and resolves text collisions
+    
+    Placed bounds are kept in a TextBoundsStore and indexed in a SpatialGrid,
+    so each collision query only tests nearby boxes, as array operations.
+    placed_bounds still behaves like a list (append, index, iterate); the
+    index catches up with any change on the next query.
+    """
     
-    def __init__(self, min_spacing: float = 2.0):
+    def __init__(self, min_spacing: float = 2.0, cell_size: float = 20.0, vectorized: bool = True):
         """
         Initialize collision detector
         
         Args:
             min_spacing: Minimum spacing between text elements in mm
+            cell_size: Spatial index cell size (roughly a typical label width)
+            vectorized: Test all spiral candidates of find_safe_position in one
+                NumPy pass (False = scalar search with early exit)
         """
         self.min_spacing = min_spacing
-        self.placed_bounds: List[TextBounds] = []
+        self.vectorized = vectorized
+        self._grid = SpatialGrid(cell_size)
+        self.placed_bounds = TextBoundsStore()
+    
+    @property
+    def placed_bounds(self) -> TextBoundsStore:
+        """Registered bounds"""
+        return self._placed
+    
+    @placed_bounds.setter
+    def placed_bounds(self, bounds) -> None:
+        if not isinstance(bounds, TextBoundsStore):
+            bounds = TextBoundsStore(bounds)
+        self._placed = bounds
+        self._grid.clear()
+        self._indexed_count = 0
+        self._indexed_mutations = bounds.mutations
     
     def add_bounds(self, bounds: TextBounds) -> None:
         """Register a text bounding box"""
-        self.placed_bounds.append(bounds)
+        self._placed.append(bounds)
+    
+    def _sync_index(self) -> None:
+        """Index bounds added since the last query (rebuild after removals)"""
+        placed = self._placed
+        if placed.mutations == self._indexed_mutations and len(placed) == self._indexed_count:
+            return
+        if placed.mutations != self._indexed_mutations:
+            self._grid.clear()
+            self._indexed_count = 0
+            self._indexed_mutations = placed.mutations
+        
+        start = self._indexed_count
+        for index, (x_min, y_min, x_max, y_max) in enumerate(placed.extents(start), start):
+            self._grid.insert(index, x_min, y_min, x_max, y_max)
+        self._indexed_count = len(placed)
+    
+    def _nearby_rows(self, x_min: float, y_min: float, x_max: float, y_max: float, reach: float) -> List[int]:
+        """Rows of placed bounds that may lie within reach of the extent"""
+        self._sync_index()
+        return list(self._grid.query(x_min - reach, y_min - reach, x_max + reach, y_max + reach))
     
     def check_collision(self, bounds: TextBounds, padding: float = 0) -> bool:
         """
@@ -220,10 +506,15 @@ class CollisionDetector:
             True if collision detected
         """
         effective_padding = self.min_spacing + padding
-        for placed in self.placed_bounds:
-            if bounds.overlaps_with(placed, padding=effective_padding):
-                return True
-        return False
+        # overlaps_with pads both boxes
+        rows = self._nearby_rows(
+            bounds.x_min, bounds.y_min, bounds.x_max, bounds.y_max, 2 * abs(effective_padding)
+        )
+        return self._placed.any_overlap(bounds, effective_padding, rows)
+    
+    def nearest_distance(self, bounds: TextBounds) -> float:
+        """Distance from bounds to the closest placed bounds (inf if none)"""
+        return self._placed.nearest(bounds)[1]
     
     def find_safe_position(
         self,
@@ -261,6 +552,11 @@ class CollisionDetector:
             self.add_bounds(bounds)
             return base_x, base_y, True
         
+        if self.vectorized and search_steps > 0:
+            return self._find_safe_position_vectorized(
+                base_x, base_y, bounds, ha, va, search_radius, search_steps
+            )
+        
         # Search in spiral pattern around base position
         for step in range(1, search_steps + 1):
             angle_step = 360.0 / search_steps
@@ -288,9 +584,55 @@ class CollisionDetector:
         self.add_bounds(bounds)
         return base_x, base_y, False
     
+    def _find_safe_position_vectorized(
+        self,
+        base_x: float,
+        base_y: float,
+        base_bounds: TextBounds,
+        ha: str,
+        va: str,
+        search_radius: float,
+        search_steps: int
+    ) -> Tuple[float, float, bool]:
+        """
+        Spiral search of find_safe_position as one broadcast overlap check
+        
+        Builds every candidate box at once, tests them against the packed
+        nearby placed boxes and takes the first free one in spiral order.
+        """
+        offsets_x, offsets_y = _spiral_offsets(search_radius, search_steps)
+        width, height = base_bounds.width, base_bounds.height
+        
+        # Same arithmetic as get_text_bounds for each candidate
+        xs, ys = TextBoundsCalculator._adjust_position_for_alignment(
+            base_x + offsets_x, base_y + offsets_y, width, height, ha, va
+        )
+        x_max = xs + width
+        y_max = ys + height
+        
+        padding = self.min_spacing
+        rows = self._nearby_rows(
+            float(xs.min()), float(ys.min()), float(x_max.max()), float(y_max.max()), 2 * abs(padding)
+        )
+        
+        if len(rows):
+            collides = self._placed.overlaps(xs, ys, x_max, y_max, padding, rows).any(axis=1)
+            free = np.flatnonzero(~collides)
+        else:
+            free = np.arange(len(xs))
+        
+        if len(free):
+            index = free[0]
+            self.add_bounds(TextBounds(x=float(xs[index]), y=float(ys[index]), width=width, height=height))
+            return base_x + float(offsets_x[index]), base_y + float(offsets_y[index]), True
+        
+        # Like the scalar search: the last candidate tried is registered
+        self.add_bounds(TextBounds(x=float(xs[-1]), y=float(ys[-1]), width=width, height=height))
+        return base_x, base_y, False
+    
     def clear(self) -> None:
         """Clear all registered bounds"""
-        self.placed_bounds = []
+        self.placed_bounds = TextBoundsStore()
 
 
 class DimensionTextPositioner:
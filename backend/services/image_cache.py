@@ -0,0 +1,192 @@
+"""
+Decoded Image Cache
+Process-wide LRU of decoded raster assets (plan-view icons, frame library
+images) so drawings don't decode the same PNG on every render
+
+Entries are keyed by file path and the pixel size the sheet needs, and are
+only valid for the file's mtime at decode time: a changed file is decoded
+again on its next use. Images are downscaled once with PIL to the smallest
+power-of-two bucket covering the requested size, stored as read-only uint8
+arrays, and evicted least-recently-used when the byte cap is exceeded.
+"""
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Tuple
+
+import numpy as np
+from PIL import Image
+
+from app.config import settings
+
+# File patterns decoded by warm_up() when given a directory
+IMAGE_PATTERNS = ('*.png', '*.PNG', '*.jpg', '*.JPG', '*.jpeg')
+
+# Smallest size bucket (longest side, pixels)
+MIN_BUCKET = 64
+
+
+def size_bucket(max_side: Optional[int]) -> Optional[int]:
+    """Round a requested longest side up to its power-of-two bucket (None = full size)"""
+    if max_side is None:
+        return None
+    bucket = MIN_BUCKET
+    while bucket < max_side:
+        bucket *= 2
+    return bucket
+
+
+def decode_image(path: str, max_side: Optional[int] = None) -> np.ndarray:
+    """
+    Decode an image file to a uint8 array, downscaled to fit max_side
+
+    Args:
+        path: Image file path
+        max_side: Longest side in pixels (never upscaled; None = full size)
+
+    Returns:
+        (height, width, 3|4) uint8 array (RGBA when the image has transparency)
+    """
+    with Image.open(path) as image:
+        has_alpha = image.mode in ('RGBA', 'LA', 'PA') or 'transparency' in image.info
+        image = image.convert('RGBA' if has_alpha else 'RGB')
+        if max_side is not None and max(image.size) > max_side:
+            image.thumbnail((max_side, max_side), Image.LANCZOS)
+        array = np.asarray(image)
+    array.setflags(write=False)
+    return array
+
+
+class ImageCache:
+    """
+    Thread-safe, byte-capped LRU of decoded images
+
+    Usage:
+        cache = ImageCache(max_bytes=64 * 1024 * 1024)
+        img = cache.get('static/plan_views/slider_2panel.png', max_side=1024)
+        if img is not None:
+            ax.imshow(img, extent=...)
+
+    Returned arrays are shared between callers and read-only.
+    """
+
+    def __init__(self, max_bytes: int):
+        """
+        Initialize image cache
+
+        Args:
+            max_bytes: Total decoded size cap; least recently used images are evicted
+        """
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[Tuple[str, Optional[int]], Tuple[int, np.ndarray]]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, path: str, max_side: Optional[int] = None) -> Optional[np.ndarray]:
+        """
+        Get a decoded image, decoding (and caching) it on a miss
+
+        Args:
+            path: Image file path
+            max_side: Longest side the drawing needs in pixels (None = full size)
+
+        Returns:
+            Read-only uint8 array, or None if the file doesn't exist
+        """
+        try:
+            mtime = os.stat(path).st_mtime_ns
+        except OSError:
+            return None
+
+        key = (os.path.abspath(path), size_bucket(max_side))
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == mtime:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+
+        array = decode_image(path, key[1])
+        self._store(key, mtime, array)
+        return array
+
+    def _store(self, key, mtime: int, array: np.ndarray) -> None:
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._bytes -= old[1].nbytes
+            if array.nbytes > self.max_bytes:
+                return
+
+            self._entries[key] = (mtime, array)
+            self._bytes += array.nbytes
+            while self._bytes > self.max_bytes:
+                _, (_, evicted) = self._entries.popitem(last=False)
+                self._bytes -= evicted.nbytes
+                self.evictions += 1
+
+    def warm_up(self, paths: Iterable[str], max_side: Optional[int] = None) -> int:
+        """
+        Decode images ahead of the first render
+
+        Args:
+            paths: Image files and/or directories (IMAGE_PATTERNS inside them)
+            max_side: Longest side the drawings will request
+
+        Returns:
+            Number of images decoded or already cached
+        """
+        loaded = 0
+        for path in paths:
+            path = Path(path)
+            if path.is_dir():
+                files = sorted({file for pattern in IMAGE_PATTERNS for file in path.glob(pattern)})
+            else:
+                files = [path]
+            for file in files:
+                try:
+                    if self.get(str(file), max_side) is not None:
+                        loaded += 1
+                except (OSError, ValueError) as e:
+                    print(f"[WARNING] Image warm-up skipped {file}: {e}")
+        return loaded
+
+    def clear(self) -> None:
+        """Drop all decoded images"""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> Dict:
+        """Cache counters and current size"""
+        with self._lock:
+            return {
+                'entries': len(self._entries),
+                'size_bytes': self._bytes,
+                'max_bytes': self.max_bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+            }
+
+
+# Global cache instance
+_image_cache: Optional[ImageCache] = None
+_image_cache_lock = threading.Lock()
+
+
+def get_image_cache() -> ImageCache:
+    """Get or create the process-wide decoded image cache"""
+    global _image_cache
+
+    if _image_cache is None:
+        with _image_cache_lock:
+            if _image_cache is None:
+                _image_cache = ImageCache(max_bytes=settings.IMAGE_CACHE_MAX_MB * 1024 * 1024)
+
+    return _image_cache
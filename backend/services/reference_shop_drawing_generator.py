@@ -4,22 +4,86 @@ Output: A4 Landscape PDF (297mm x 210mm)
 
 This version accepts a Base64-encoded image from the frontend canvas
 and embeds it directly into a PDF, ensuring 100% match with what the user sees.
+When no snapshot is supplied the same A4 layout is drawn server-side from
+the parameters alone and saved as a vector PDF.
 """
 
 import io
 import base64
 import logging
-from typing import Dict, Optional
+from typing import BinaryIO, Dict, Optional, Tuple
 import os
-import matplotlib.image as mpimg
 from matplotlib.patches import Rectangle, Circle
+import numpy as np
+from PIL import Image
 
 from reportlab.lib.pagesizes import landscape, A4
 from reportlab.pdfgen import canvas as rl_canvas
 from reportlab.lib.utils import ImageReader
 
+from .drawing_engine.layout import new_figure
+from .image_cache import get_image_cache
+
 logger = logging.getLogger(__name__)
 
+# Plan-view icons (PNG) looked up by product type / swing, in search order:
+# site-specific overrides first, then the bundled icon library
+PLAN_VIEWS_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'static', 'plan_views'))
+ICON_LIBRARY_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'static', 'O-Icon_library'))
+PLAN_VIEW_DIRS = (PLAN_VIEWS_DIR, ICON_LIBRARY_DIR)
+
+# Longest side of the plan-view box at 300 dpi (~86 mm), used for image warm-up
+PLAN_VIEW_MAX_SIDE = 1024
+
+# Snapshot output profiles:
+#   dpi: resolution the snapshot is downsampled to on the A4 landscape page
+#   colors: quantize to this many colours (None = keep all colours)
+OUTPUT_PROFILES = {
+    'draft': {'dpi': 100, 'colors': 16},
+    'standard': {'dpi': 150, 'colors': 64},
+    'print': {'dpi': 300, 'colors': None},
+}
+DEFAULT_OUTPUT_PROFILE = 'standard'
+
+
+def optimize_snapshot(image: Image.Image, profile: Dict, page_size_in: Tuple[float, float]) -> Image.Image:
+    """
+    Prepare a canvas snapshot for embedding: flatten, downsample, reduce colours
+    
+    Args:
+        image: Decoded snapshot
+        profile: Entry of OUTPUT_PROFILES
+        page_size_in: (width, height) of the page in inches
+    
+    Returns:
+        'L' image when the drawing has no colour, otherwise 'RGB'
+    """
+    # Flatten transparency onto the white page
+    if image.mode in ('RGBA', 'LA', 'PA') or 'transparency' in image.info:
+        rgba = image.convert('RGBA')
+        image = Image.new('RGB', rgba.size, 'white')
+        image.paste(rgba, mask=rgba.getchannel('A'))
+    else:
+        image = image.convert('RGB')
+    
+    # Downsample to the profile DPI at the size it is drawn (aspect-fit to the page)
+    scale = min(page_size_in[0] * profile['dpi'] / image.width,
+                page_size_in[1] * profile['dpi'] / image.height)
+    if scale < 1:
+        size = (max(1, round(image.width * scale)), max(1, round(image.height * scale)))
+        # Box (area-average) filter: LANCZOS ringing around thin lines adds colours Flate can't squeeze
+        image = image.resize(size, Image.BOX)
+    
+    # Grayscale when every pixel is neutral (1 channel instead of 3)
+    pixels = np.asarray(image)
+    if np.array_equal(pixels[..., 0], pixels[..., 1]) and np.array_equal(pixels[..., 1], pixels[..., 2]):
+        image = image.convert('L')
+    
+    # Fewer distinct colours compress much better under Flate
+    if profile['colors'] is not None:
+        image = image.quantize(profile['colors'], method=Image.Quantize.MEDIANCUT).convert(image.mode)
+    return image
+
 
 class ReferenceShopDrawingGenerator:
     """
@@ -42,46 +106,85 @@ class ReferenceShopDrawingGenerator:
         # Margins and layout
         self.margin_mm = 8
         self.dpi = 300
+        
+        # Snapshot optimization profile (see OUTPUT_PROFILES)
+        self.output_profile = self.params.get('outputProfile') or DEFAULT_OUTPUT_PROFILE
+        if self.output_profile not in OUTPUT_PROFILES:
+            raise ValueError(
+                f"Unknown output profile '{self.output_profile}' (expected one of {list(OUTPUT_PROFILES)})"
+            )
+        # Filled by generate_pdf: render mode and snapshot/PDF sizes for reporting
+        self.render_mode: Optional[str] = None
+        self.output_stats: Dict = {}
     
-    def generate_pdf(self) -> io.BytesIO:
-        """Generate PDF from client-side captured canvas image"""
-        logger.info("Generating PDF from canvas snapshot with params: %s", self.params)
+    def _decode_snapshot_parameter(self) -> io.BytesIO:
+        """Decode the Base64 imageSnapshot parameter (JSON API) into a stream"""
+        # Check for imageSnapshot parameter
+        image_snapshot = self.params.get('imageSnapshot')
+        if not image_snapshot:
+            raise ValueError("Missing imageSnapshot parameter - frontend must capture canvas")
+        
+        # Decode Base64 image
+        # Format: "data:image/png;base64,iVBORw0KG..."
+        logger.debug("Decoding Base64 image (length: %d)", len(image_snapshot))
+        
+        if ',' in image_snapshot:
+            # Strip the data URL prefix
+            image_data_base64 = image_snapshot.split(',')[1]
+        else:
+            # Already raw Base64
+            image_data_base64 = image_snapshot
         
         try:
-            # Check for imageSnapshot parameter
-            image_snapshot = self.params.get('imageSnapshot')
-            if not image_snapshot:
-                raise ValueError("Missing imageSnapshot parameter - frontend must capture canvas")
-            
-            # Decode Base64 image
-            # Format: "data:image/png;base64,iVBORw0KG..."
-            logger.debug("Decoding Base64 image (length: %d)", len(image_snapshot))
-            
-            if ',' in image_snapshot:
-                # Strip the data URL prefix
-                image_data_base64 = image_snapshot.split(',')[1]
-            else:
-                # Already raw Base64
-                image_data_base64 = image_snapshot
-            
-            try:
-                image_bytes = base64.b64decode(image_data_base64)
-                logger.debug("Decoded image bytes: %d", len(image_bytes))
-            except Exception as decode_error:
-                logger.error("Failed to decode Base64 image: %s", str(decode_error))
-                raise ValueError(f"Invalid Base64 image data: {str(decode_error)}")
+            image_bytes = base64.b64decode(image_data_base64)
+            logger.debug("Decoded image bytes: %d", len(image_bytes))
+        except Exception as decode_error:
+            logger.error("Failed to decode Base64 image: %s", str(decode_error))
+            raise ValueError(f"Invalid Base64 image data: {str(decode_error)}")
+        
+        return io.BytesIO(image_bytes)
+    
+    def generate_pdf(self, snapshot: Optional[BinaryIO] = None) -> io.BytesIO:
+        """
+        Generate PDF from client-side captured canvas image
+        
+        Args:
+            snapshot: Binary stream of the canvas image (PNG/JPEG). When omitted
+                the Base64 imageSnapshot parameter is decoded instead; with no
+                snapshot at all the layout is rendered server-side as vectors.
+        
+        Returns:
+            BytesIO positioned at the start of the PDF
+        """
+        if snapshot is None and not self.params.get('imageSnapshot'):
+            return self.generate_vector_pdf()
+        
+        logger.info("Generating PDF from canvas snapshot with params: %s",
+                    {k: v for k, v in self.params.items() if k != 'imageSnapshot'})
+        self.render_mode = 'snapshot'
+        
+        try:
+            if snapshot is None:
+                snapshot = self._decode_snapshot_parameter()
             
             # Create PDF buffer
             pdf_buffer = io.BytesIO()
             page_width, page_height = landscape(A4)  # 842 x 595 points
             
             logger.debug("Creating PDF canvas (%.1f x %.1f points)", page_width, page_height)
-            c = rl_canvas.Canvas(pdf_buffer, pagesize=landscape(A4))
+            c = rl_canvas.Canvas(pdf_buffer, pagesize=landscape(A4), pageCompression=1)
             
-            # Create ImageReader from bytes
+            # Decode from the stream (PIL reads it in place, no extra copy) and optimize
             try:
-                img_buffer = io.BytesIO(image_bytes)
-                img = ImageReader(img_buffer)
+                snapshot.seek(0, io.SEEK_END)
+                snapshot_bytes = snapshot.tell()
+                snapshot.seek(0)
+                source = Image.open(snapshot)
+                source_size = source.size
+                optimized = optimize_snapshot(
+                    source, OUTPUT_PROFILES[self.output_profile], (page_width / 72, page_height / 72)
+                )
+                img = ImageReader(optimized)
                 logger.debug("Image loaded successfully")
             except Exception as img_error:
                 logger.error("Failed to load image: %s", str(img_error))
@@ -105,14 +208,23 @@ class ReferenceShopDrawingGenerator:
             pdf_buffer.seek(0)
             
             # Validate PDF size
-            pdf_data = pdf_buffer.getvalue()
-            file_size = len(pdf_data)
+            file_size = pdf_buffer.getbuffer().nbytes
             
             if file_size == 0:
                 raise RuntimeError("Generated PDF is empty")
             
-            logger.info("PDF generated successfully (%d bytes)", file_size)
-            return io.BytesIO(pdf_data)
+            self.output_stats = {
+                'render_mode': self.render_mode,
+                'profile': self.output_profile,
+                'snapshot_bytes': snapshot_bytes,
+                'snapshot_pixels': source_size,
+                'embedded_pixels': optimized.size,
+                'embedded_mode': optimized.mode,
+                'pdf_bytes': file_size,
+            }
+            logger.info("PDF generated successfully (%d bytes, %s profile, %dx%d -> %dx%d %s)",
+                        file_size, self.output_profile, *source_size, *optimized.size, optimized.mode)
+            return pdf_buffer
             
         except ValueError as e:
             logger.warning("Validation error in PDF generation: %s", str(e))
@@ -120,43 +232,106 @@ class ReferenceShopDrawingGenerator:
         except Exception as e:
             logger.error("Error generating shop drawing: %s", str(e), exc_info=True)
             raise RuntimeError(f"PDF generation failed: {str(e)}")
-        """Draw entire A4 landscape layout"""
+    
+    def generate_vector_pdf(self) -> io.BytesIO:
+        """
+        Render the A4 landscape layout server-side from the parameters alone
+        
+        Text, lines and fills are written as PDF vectors (only the plan-view
+        icon is embedded as an image), so no canvas snapshot is needed.
         
+        Returns:
+            BytesIO positioned at the start of the PDF
+        """
+        logger.info("Generating vector PDF with params: %s", self.params)
+        self.render_mode = 'vector'
+        
+        fig = new_figure((self.page_width_in, self.page_height_in))
+        try:
+            # One axis covering the page, in millimetres
+            ax = fig.add_axes([0, 0, 1, 1])
+            ax.set_xlim(0, self.page_width_mm)
+            ax.set_ylim(0, self.page_height_mm)
+            ax.axis('off')
+            self._draw_layout(ax)
+            
+            pdf_buffer = io.BytesIO()
+            fig.savefig(pdf_buffer, format='pdf')
+        except ValueError as e:
+            logger.warning("Validation error in PDF generation: %s", str(e))
+            raise
+        except Exception as e:
+            logger.error("Error generating shop drawing: %s", str(e), exc_info=True)
+            raise RuntimeError(f"PDF generation failed: {str(e)}")
+        finally:
+            fig.clear()
+        
+        pdf_buffer.seek(0)
+        file_size = pdf_buffer.getbuffer().nbytes
+        if file_size == 0:
+            raise RuntimeError("Generated PDF is empty")
+        
+        self.output_stats = {'render_mode': self.render_mode, 'pdf_bytes': file_size}
+        logger.info("Vector PDF generated successfully (%d bytes)", file_size)
+        return pdf_buffer
+    
+    def _layout_regions(self):
+        """
+        Page regions in millimetres, each as (x, y_bottom, width, height)
+
+        Region-level helpers take the bottom-left corner; the helpers they
+        call for a sub-box (frame section, elevation, plan, icons, info)
+        take the box's TOP edge and draw downwards from it.
+        """
+
         w = self.page_width_mm  # 297
         h = self.page_height_mm  # 210
         m = self.margin_mm
-        
-        # Page border
-        border = Rectangle((0, 0), w, h, linewidth=1, edgecolor='black', 
-                          facecolor='white', zorder=0)
-        ax.add_patch(border)
-        
+
         # 1. HEADER (top ~28mm)
         header_y = h - 28
-        self._draw_header(ax, header_y, w)
-        
+
         # 2. MAIN CONTENT AREA
         main_y_top = header_y - 5
         main_y_bottom = 45  # Leave room for specs table
         main_height = main_y_top - main_y_bottom
-        
+
         # Three columns
         col_width = (w - 2*m - 4) / 3
-        
-        # Column 1: Frames
         col1_x = m
-        self._draw_column1_frames(ax, col1_x, main_y_bottom, col_width, main_height)
-        
-        # Column 2: Elevation & Plan
         col2_x = col1_x + col_width + 2
-        self._draw_column2_elevation_plan(ax, col2_x, main_y_bottom, col_width, main_height)
-        
-        # Column 3: Icons & Info
         col3_x = col2_x + col_width + 2
-        self._draw_column3_info(ax, col3_x, main_y_bottom, col_width, main_height)
-        
-        # 3. SPECIFICATIONS TABLE (bottom ~40mm)
-        self._draw_specifications_table(ax, m, 0, w - 2*m, 40)
+
+        return {
+            'header': (0, header_y, w, 28),
+            'column1': (col1_x, main_y_bottom, col_width, main_height),
+            'column2': (col2_x, main_y_bottom, col_width, main_height),
+            'column3': (col3_x, main_y_bottom, col_width, main_height),
+            # 3. SPECIFICATIONS TABLE (bottom ~40mm)
+            'specifications': (m, 0, w - 2*m, 40),
+        }
+
+    def _draw_layout(self, ax):
+        """Draw entire A4 landscape layout"""
+
+        w = self.page_width_mm
+        h = self.page_height_mm
+        regions = self._layout_regions()
+
+        # Page border
+        border = Rectangle((0, 0), w, h, linewidth=1, edgecolor='black',
+                          facecolor='white', zorder=0)
+        ax.add_patch(border)
+
+        _, header_y, header_width, _ = regions['header']
+        self._draw_header(ax, header_y, header_width)
+
+        # Column 1: Frames / Column 2: Elevation & Plan / Column 3: Icons & Info
+        self._draw_column1_frames(ax, *regions['column1'])
+        self._draw_column2_elevation_plan(ax, *regions['column2'])
+        self._draw_column3_info(ax, *regions['column3'])
+
+        self._draw_specifications_table(ax, *regions['specifications'])
     
     def _draw_header(self, ax, y, width):
         """Draw header section"""
@@ -188,20 +363,15 @@ class ReferenceShopDrawingGenerator:
         ax.add_patch(col)
         
         y_top = y_bottom + height
-        section_height = (height - 8) / 3
-        
-        # Three sections
-        head_y = y_top - section_height
-        self._draw_frame_section(ax, x + 5, head_y - 5, width - 10, 
-                                section_height - 5, "HEAD")
-        
-        sill_y = head_y - section_height
-        self._draw_frame_section(ax, x + 5, sill_y - 5, width - 10,
-                                section_height - 5, "SILL")
-        
-        jamb_y = sill_y - section_height
-        self._draw_frame_section(ax, x + 5, jamb_y - 5, width - 10,
-                                section_height - 5, "JAMB")
+        padding = 4
+        gap = 4
+        section_height = (height - 2 * padding - 2 * gap) / 3
+
+        # Three sections, stacked downwards from the top of the column
+        for i, label in enumerate(("HEAD", "SILL", "JAMB")):
+            section_top = y_top - padding - i * (section_height + gap)
+            self._draw_frame_section(ax, x + 5, section_top, width - 10,
+                                    section_height, label)
     
     def _draw_frame_section(self, ax, x, y, width, height, label):
         """
@@ -210,7 +380,7 @@ class ReferenceShopDrawingGenerator:
         
         Args:
             ax: Matplotlib axis
-            x, y: Position
+            x, y: Left and TOP edge of the section
             width, height: Dimensions
             label: Label text (HEAD, SILL, JAMB)
         """
@@ -259,24 +429,29 @@ class ReferenceShopDrawingGenerator:
         mid_y = y_bottom + height / 2
         
         # Elevation (top half)
-        self._draw_elevation_view(ax, x + 2, mid_y + 2, width - 4, height/2 - 4)
-        
+        self._draw_elevation_view(ax, x + 2, y_top - 2, width - 4, height/2 - 4)
+
         # Plan (bottom half)
-        self._draw_plan_view(ax, x + 2, y_bottom + 2, width - 4, height/2 - 4)
+        self._draw_plan_view(ax, x + 2, mid_y - 2, width - 4, height/2 - 4)
     
     def _draw_elevation_view(self, ax, x, y, width, height):
         """
         Draw elevation view with improved dimension text positioning
+        (x, y is the top-left corner of the box)
         """
-        
+
         try:
-            # Title with padding to avoid overlap
-            ax.text(x, y - 2, 'ELEVATION', fontsize=7, fontweight='bold', va='top', ha='left')
-            
+            # Title above the frame
+            ax.text(x, y - 0.5, 'ELEVATION', fontsize=7, fontweight='bold', va='top', ha='left')
+
             # Frame
-            frame = Rectangle((x, y - height), width, height - 3, linewidth=0.5,
+            frame = Rectangle((x, y - height), width, height - 4.5, linewidth=0.5,
                              edgecolor='black', facecolor='white')
             ax.add_patch(frame)
+
+            # Panels sit above a strip reserved for the dimensions
+            panels_bottom = y - height + 9
+            panels_height = height - 15
             
             # Panel grid
             w_inch = float(self.params.get('width', 48))
@@ -297,19 +472,19 @@ class ReferenceShopDrawingGenerator:
             for i, char in enumerate(config):
                 panel_x = x + 2 + i * panel_width
                 
-                panel = Rectangle((panel_x, y - height + 2), panel_width - 1, height - 5,
+                panel = Rectangle((panel_x, panels_bottom), panel_width - 1, panels_height,
                                 linewidth=0.5, edgecolor='black', facecolor='#E8F4FF')
                 ax.add_patch(panel)
-                
+
                 # Panel label centered in panel
                 label = 'O' if char in ['O', 'V'] else 'X'
-                ax.text(panel_x + panel_width/2, y - height/2, label,
+                ax.text(panel_x + panel_width/2, panels_bottom + panels_height/2, label,
                        fontsize=8, fontweight='bold', ha='center', va='center', zorder=5)
-            
-            # Dimensions positioned below frame with extra spacing to avoid overlap
+
+            # Dimensions stacked in the strip under the panels, inside the frame
             dim_x = x + 2
-            dim_y_width = y - height - 4  # Extra spacing below frame
-            dim_y_height = y - height - 7  # Further spacing for second dimension
+            dim_y_width = y - height + 8
+            dim_y_height = y - height + 4.5
             
             width_ft = int(w_inch / 12)
             width_in = int(w_inch % 12)
@@ -334,62 +509,63 @@ class ReferenceShopDrawingGenerator:
     def _draw_plan_view(self, ax, x, y, width, height):
         """
         Draw plan view with improved element spacing
+        (x, y is the top-left corner of the box)
         """
         try:
-            # Title with padding
-            ax.text(x, y - 2, 'PLAN', fontsize=7, fontweight='bold', va='top', ha='left')
-            
+            # Title above the frame
+            ax.text(x, y - 0.5, 'PLAN', fontsize=7, fontweight='bold', va='top', ha='left')
+
             # Frame
-            frame = Rectangle((x, y - height), width, height - 3, linewidth=0.5,
+            frame = Rectangle((x, y - height), width, height - 4.5, linewidth=0.5,
                              edgecolor='black', facecolor='white')
             ax.add_patch(frame)
-            
-            # Plan rectangle with proper margins
+
+            # Plan rectangle with proper margins, above the scale label
             plan_margin = 3
             plan_width = width - 2*plan_margin
-            plan_height = height - 7  # More space for label at bottom
-            
+            plan_height = height - 12.5
+            plan_bottom = y - height + 6
+
             if plan_width > 0 and plan_height > 0:
-                plan_rect = Rectangle((x + plan_margin, y - height + 3), plan_width, plan_height - 2,
+                plan_rect = Rectangle((x + plan_margin, plan_bottom), plan_width, plan_height,
                                      linewidth=0.5, edgecolor='black', facecolor='#FFFACD')
                 ax.add_patch(plan_rect)
-                
+
                 # Person silhouette for scale - positioned to avoid overlap
                 person_x = x + plan_margin + plan_width/4
-                person_y = y - height + plan_height/2.5
-                
+                person_y = plan_bottom + plan_height/2
+
                 # Simple stick figure (smaller to avoid overlap)
                 head_radius = 1.0
-                
+
                 # Head (using Circle from matplotlib.patches, already imported)
                 head = Circle((person_x, person_y), head_radius, color='black', zorder=5)
                 ax.add_patch(head)
-                
+
                 # Body
                 ax.plot([person_x, person_x], [person_y - head_radius, person_y - 2.5], 
                        'k-', linewidth=0.8, zorder=5)
-                
+
                 # Arms
                 ax.plot([person_x - 1.2, person_x + 1.2], [person_y - 1.5, person_y - 1.5], 
                        'k-', linewidth=0.8, zorder=5)
-                
+
                 # Legs
                 ax.plot([person_x, person_x - 0.5], [person_y - 2.5, person_y - 3.8], 
                        'k-', linewidth=0.8, zorder=5)
                 ax.plot([person_x, person_x + 0.5], [person_y - 2.5, person_y - 3.8], 
                        'k-', linewidth=0.8, zorder=5)
-            
-            # Scale label at bottom with padding
-            scale_y = y - height + 0.8
+
+            # Scale label at the bottom of the frame, under the plan rectangle
+            scale_y = y - height + 1.2
             ax.text(x + width/2, scale_y, 'SCALE', 
-                   fontsize=5, ha='center', style='italic', va='top',
+                   fontsize=5, ha='center', style='italic', va='bottom',
                    bbox=dict(boxstyle='round,pad=0.2', facecolor='white', alpha=0.8))
-                   
-            # Attempt to load a plan-view icon from static/plan_views based on product/config
+
+            # Attempt to load a plan-view icon (PLAN_VIEW_DIRS) based on product/config
             try:
-                product = (self.params.get('productType') or '').strip()
+                product = (self.params.get('product_type') or self.params.get('productType') or '').strip()
                 swing = (self.params.get('swingOrientation') or self.params.get('configuration') or '').strip()
-                static_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'static', 'plan_views'))
 
                 def candidate_names(prod, swing_val):
                     prod_lower = (prod or '').lower()
@@ -398,6 +574,13 @@ class ReferenceShopDrawingGenerator:
                     # Sliding
                     if 'slid' in prod_lower or 'slider' in prod_lower:
                         names += ['slider_2panel.png', 'D-2_Panel_Slider.PNG']
+                    # Casement windows
+                    if 'casement' in prod_lower:
+                        if 'left' in swing_lower:
+                            names += ['W-Left_Casement_O.PNG']
+                        if 'right' in swing_lower:
+                            names += ['W-Right_Casement_O.PNG']
+                        names += ['W-Double_Casement_O.PNG']
                     # Casement / Hinged
                     if 'casement' in prod_lower or 'hinged' in prod_lower or 'door' in prod_lower:
                         if 'left' in swing_lower:
@@ -414,21 +597,33 @@ class ReferenceShopDrawingGenerator:
                     names += ['plan_slider.png', 'plan_casement.png', 'plan_default.png']
                     return names
 
-                found = None
-                for fname in candidate_names(product, swing):
-                    candidate = os.path.join(static_dir, fname)
-                    if os.path.exists(candidate):
+                # Decode at the resolution the box is printed at (cached across renders)
+                max_side = int(max(plan_width, plan_height) / 25.4 * self.dpi)
+                image_cache = get_image_cache()
+
+                found = img = None
+                candidates = [
+                    os.path.join(directory, fname)
+                    for fname in candidate_names(product, swing)
+                    for directory in PLAN_VIEW_DIRS
+                ]
+                for candidate in candidates:
+                    try:
+                        img = image_cache.get(candidate, max_side)
+                    except Exception as img_err:
+                        logger.warning(f"Failed to render plan view image '{candidate}': {img_err}")
+                        break
+                    if img is not None:
                         found = candidate
                         break
 
                 if found:
                     try:
-                        img = mpimg.imread(found)
                         # Compute extent for imshow: left, right, bottom, top
                         left = x + plan_margin
-                        bottom = y - height + 3
+                        bottom = plan_bottom
                         right = left + plan_width
-                        top = bottom + plan_height - 2
+                        top = bottom + plan_height
                         ax.imshow(img, extent=(left, right, bottom, top), aspect='auto', zorder=10)
                     except Exception as img_err:
                         logger.warning(f"Failed to render plan view image '{found}': {img_err}")
@@ -447,25 +642,27 @@ class ReferenceShopDrawingGenerator:
                        edgecolor='#CCCCCC', facecolor='white')
         ax.add_patch(col)
         
+        y_top = y_bottom + height
+
         # Icons (top half)
-        self._draw_frame_icons(ax, x + 2, y_bottom + height * 0.5 + 2, 
+        self._draw_frame_icons(ax, x + 2, y_top - 2,
                               width - 4, height * 0.5 - 4)
-        
+
         # Info table (bottom half)
-        self._draw_drawing_info_table(ax, x + 2, y_bottom + 2,
+        self._draw_drawing_info_table(ax, x + 2, y_bottom + height * 0.5 - 2,
                                      width - 4, height * 0.5 - 4)
     
     def _draw_frame_icons(self, ax, x, y, width, height):
-        """Draw 3x2 grid of frame type icons"""
-        
-        ax.text(x, y - 2, 'FRAME TYPES', fontsize=6, fontweight='bold')
+        """Draw 3x2 grid of frame type icons (x, y is the top-left corner)"""
+
+        ax.text(x, y - 0.5, 'FRAME TYPES', fontsize=6, fontweight='bold', va='top')
         
         types = [
             ('FIXED', '⬚'),
             ('CASEMENT', '⬌'),
             ('SLIDER', '⬌⬌'),
-            ('AWNING', '⌢'),
-            ('HOPPER', '⌣'),
+            ('AWNING', '◠'),
+            ('HOPPER', '◡'),
             ('PROJECTED', '⬍'),
         ]
         
@@ -494,12 +691,13 @@ class ReferenceShopDrawingGenerator:
             ax.text(icon_x + icon_width/2 - 1, icon_y - icon_height/2,
                    icon_char, fontsize=6, ha='center', va='center')
             
-            ax.text(icon_x + icon_width/2 - 1, icon_y - icon_height + 1,
-                   type_name, fontsize=4, ha='center', va='top')
+            ax.text(icon_x + icon_width/2 - 1, icon_y - icon_height + 0.5,
+                   type_name, fontsize=4, ha='center', va='bottom')
     
     def _draw_drawing_info_table(self, ax, x, y, width, height):
         """
         Draw drawing information table with improved text spacing
+        (x, y is the top-left corner of the table)
         """
         
         ax.text(x, y - 1, 'DRAWING INFO', fontsize=6, fontweight='bold', va='top',
@@ -1,10 +1,31 @@
-﻿from celery import Celery
+﻿"""
+Celery Application
+Background render jobs run here when CELERY_BROKER_URL is configured
 
-app = Celery('backend')
+Start a worker from the backend directory:
+    celery -A tasks.celery_app worker --loglevel=info
 
-app.config_from_object('backend.config', silent=True)
+Without a broker the API runs the same tasks in-process (see tasks.jobs).
+"""
+from app.config import settings
 
-# Set broker and result backend
-app.conf.broker_url = 'redis://localhost:6379/0'
-app.conf.result_backend = 'redis://localhost:6379/0'
+try:
+    from celery import Celery
+    CELERY_AVAILABLE = True
+except ImportError:
+    Celery = None
+    CELERY_AVAILABLE = False
 
+app = None
+
+if CELERY_AVAILABLE and settings.CELERY_BROKER_URL:
+    app = Celery('backend', include=['tasks.render_tasks'])
+    app.config_from_object('backend.config', silent=True)
+    app.conf.broker_url = settings.CELERY_BROKER_URL
+    app.conf.result_backend = settings.CELERY_RESULT_BACKEND or settings.CELERY_BROKER_URL
+    # Results only carry file paths; PDFs stay on the shared drawings volume
+    app.conf.task_serializer = 'json'
+    app.conf.result_serializer = 'json'
+    app.conf.accept_content = ['json']
+    app.conf.task_track_started = True
+    app.conf.result_expires = settings.RENDER_JOB_TTL_SECONDS
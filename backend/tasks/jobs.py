@@ -0,0 +1,191 @@
+"""
+Render Job Manager
+Submits render tasks and tracks their state/progress
+
+Jobs go to Celery when CELERY_BROKER_URL is set; otherwise they run on a
+small in-process thread pool with in-memory job records, so the API works
+without Redis in development and tests. Either way a job reports one of
+PENDING, PROGRESS, SUCCESS or FAILURE.
+"""
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Optional
+
+from app.config import settings
+from tasks.render_tasks import RENDER_FUNCTIONS, CELERY_TASKS
+from tasks.celery_app import app as celery_app
+
+
+class RenderJobManager:
+    """
+    Submit render jobs and look up their status
+
+    Usage:
+        jobs = get_job_manager()
+        job_id = jobs.submit('project', 'PO-123')
+        jobs.status(job_id)  # {'state': 'PROGRESS', 'progress': {'done': 3, 'total': 12}, ...}
+    """
+
+    def __init__(self, workers: int = 2, ttl_seconds: int = 3600, use_celery: bool = None):
+        """
+        Initialize job manager
+
+        Args:
+            workers: Threads of the in-process executor
+            ttl_seconds: Finished in-process jobs are forgotten after this long
+            use_celery: Dispatch to Celery (default: when a broker is configured)
+        """
+        self.use_celery = (celery_app is not None) if use_celery is None else use_celery
+        self.ttl_seconds = ttl_seconds
+        self._jobs: Dict[str, Dict] = {}
+        self._lock = threading.Lock()
+        self._executor = None if self.use_celery else ThreadPoolExecutor(
+            max_workers=max(1, workers), thread_name_prefix="render-job"
+        )
+
+    @property
+    def backend(self) -> str:
+        return "celery" if self.use_celery else "in-process"
+
+    def submit(self, kind: str, *args) -> str:
+        """
+        Queue a render job
+
+        Args:
+            kind: 'project', 'window' or 'door'
+            *args: Arguments of the render task (PO number or item ID)
+
+        Returns:
+            Job ID
+        """
+        if kind not in RENDER_FUNCTIONS:
+            raise ValueError(f"Unknown render job kind '{kind}'")
+
+        if self.use_celery:
+            return CELERY_TASKS[kind].apply_async(args=args).id
+
+        job_id = uuid.uuid4().hex
+        with self._lock:
+            self._prune()
+            self._jobs[job_id] = {
+                'job_id': job_id,
+                'kind': kind,
+                'state': 'PENDING',
+                'progress': {'done': 0, 'total': 0},
+                'result': None,
+                'error': None,
+                'submitted_at': time.time(),
+                'finished_at': None,
+            }
+        self._executor.submit(self._run, job_id, kind, args)
+        return job_id
+
+    def _run(self, job_id: str, kind: str, args) -> None:
+        def progress(done: int, total: int) -> None:
+            self._update(job_id, state='PROGRESS', progress={'done': done, 'total': total})
+
+        self._update(job_id, state='PROGRESS')
+        try:
+            result = RENDER_FUNCTIONS[kind](*args, progress=progress)
+        except Exception as e:
+            print(f"Render job {job_id} ({kind}) failed: {e}")
+            self._update(job_id, state='FAILURE', error=str(e), finished_at=time.time())
+        else:
+            self._update(job_id, state='SUCCESS', result=result, finished_at=time.time())
+
+    def _update(self, job_id: str, **fields) -> None:
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is not None:
+                job.update(fields)
+
+    def _prune(self) -> None:
+        """Drop finished jobs older than the TTL (caller holds the lock)"""
+        cutoff = time.time() - self.ttl_seconds
+        expired = [
+            job_id for job_id, job in self._jobs.items()
+            if job['finished_at'] is not None and job['finished_at'] < cutoff
+        ]
+        for job_id in expired:
+            del self._jobs[job_id]
+
+    def status(self, job_id: str) -> Optional[Dict]:
+        """
+        Get job state, progress and (when finished) result or error
+
+        Returns:
+            Job dict, or None if the job is unknown
+        """
+        if self.use_celery:
+            return self._celery_status(job_id)
+
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None:
+                return None
+            return {**job, 'progress': dict(job['progress'])}
+
+    @staticmethod
+    def _celery_status(job_id: str) -> Dict:
+        # Celery reports unknown IDs as PENDING, so they can't be told apart
+        result = celery_app.AsyncResult(job_id)
+        state = result.state
+        job = {
+            'job_id': job_id,
+            'kind': None,
+            'state': 'PROGRESS' if state in ('STARTED', 'RETRY') else state,
+            'progress': {'done': 0, 'total': 0},
+            'result': None,
+            'error': None,
+        }
+
+        if state == 'PROGRESS' and isinstance(result.info, dict):
+            job['progress'] = {
+                'done': result.info.get('done', 0),
+                'total': result.info.get('total', 0)
+            }
+        elif state == 'SUCCESS':
+            job['result'] = result.result
+            job['kind'] = result.result.get('kind')
+        elif state == 'FAILURE':
+            job['error'] = str(result.result)
+
+        return job
+
+    def shutdown(self) -> None:
+        """Stop the in-process executor, dropping jobs that haven't started"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+# Global job manager
+_job_manager: Optional[RenderJobManager] = None
+
+
+def get_job_manager() -> RenderJobManager:
+    """
+    Get or create the global render job manager
+
+    Returns:
+        RenderJobManager instance
+    """
+    global _job_manager
+
+    if _job_manager is None:
+        _job_manager = RenderJobManager(
+            workers=settings.RENDER_JOB_WORKERS,
+            ttl_seconds=settings.RENDER_JOB_TTL_SECONDS
+        )
+
+    return _job_manager
+
+
+def shutdown_job_manager() -> None:
+    """Stop the in-process job executor (app shutdown)"""
+    global _job_manager
+
+    if _job_manager is not None:
+        _job_manager.shutdown()
+        _job_manager = None
@@ -0,0 +1,174 @@
+"""
+Render Tasks
+Drawing renders that run outside the HTTP request
+
+Each task opens its own database session, renders through the shared
+drawing service and returns only file names/paths - the PDFs themselves
+stay in the drawings directory (a volume shared with the API when running
+on a Celery worker), so large results never go through the result backend.
+"""
+import os
+from typing import Callable, Dict, Optional
+
+from app.database import SessionLocal
+from app.models import Project, Window, Door
+from app.services.integrated_drawing_service import get_drawing_service
+from tasks.celery_app import app as celery_app
+
+# progress(done, total)
+ProgressCallback = Optional[Callable[[int, int], None]]
+
+
+def _file_entry(path: str) -> Dict[str, str]:
+    filename = os.path.basename(path)
+    return {
+        'file': filename,
+        'path': path,
+        'download_url': f"/api/drawings/download/{filename}"
+    }
+
+
+def render_project(po_number: str, progress: ProgressCallback = None) -> Dict:
+    """
+    Render every window and door of a project
+
+    Args:
+        po_number: Purchase order number
+        progress: Optional callback receiving (done, total)
+
+    Returns:
+        Dictionary with 'windows'/'doors' file entries, 'errors' and 'cached'
+    """
+    db = SessionLocal()
+    try:
+        project = db.query(Project).filter_by(po_number=po_number).first()
+        if not project:
+            raise ValueError(f"Project with PO number '{po_number}' not found")
+
+        results = get_drawing_service().generate_project_drawings(
+            project, progress_callback=progress
+        )
+
+        total_generated = len(results['windows']) + len(results['doors'])
+        if total_generated == 0 and results['errors']:
+            raise RuntimeError(f"All {len(results['errors'])} item(s) failed: {results['errors'][0]['error']}")
+        if total_generated == 0:
+            raise ValueError(f"No items found in project {po_number}")
+
+        return {
+            'kind': 'project',
+            'po_number': po_number,
+            'project_name': project.project_name,
+            'windows': [_file_entry(path) for path in results['windows']],
+            'doors': [_file_entry(path) for path in results['doors']],
+            'cached': results.get('cached', 0),
+            'errors': results['errors']
+        }
+    finally:
+        db.close()
+
+
+def render_window(window_id: int, progress: ProgressCallback = None) -> Dict:
+    """
+    Render a single window drawing
+
+    Args:
+        window_id: Database ID of the window
+        progress: Optional callback receiving (done, total)
+
+    Returns:
+        File entry of the generated PDF plus window info
+    """
+    db = SessionLocal()
+    try:
+        window = db.query(Window).filter_by(id=window_id).first()
+        if not window:
+            raise ValueError(f"Window with ID {window_id} not found")
+
+        project = db.query(Project).filter_by(id=window.project_id).first()
+
+        if progress:
+            progress(0, 1)
+        pdf_path = get_drawing_service().generate_window_from_model(window, project)
+        if progress:
+            progress(1, 1)
+
+        return {
+            'kind': 'window',
+            'window_id': window_id,
+            'item_number': window.item_number,
+            **_file_entry(pdf_path)
+        }
+    finally:
+        db.close()
+
+
+def render_door(door_id: int, progress: ProgressCallback = None) -> Dict:
+    """
+    Render a single door drawing
+
+    Args:
+        door_id: Database ID of the door
+        progress: Optional callback receiving (done, total)
+
+    Returns:
+        File entry of the generated PDF plus door info
+    """
+    db = SessionLocal()
+    try:
+        door = db.query(Door).filter_by(id=door_id).first()
+        if not door:
+            raise ValueError(f"Door with ID {door_id} not found")
+
+        project = db.query(Project).filter_by(id=door.project_id).first()
+
+        if progress:
+            progress(0, 1)
+        pdf_path = get_drawing_service().generate_door_from_model(door, project)
+        if progress:
+            progress(1, 1)
+
+        return {
+            'kind': 'door',
+            'door_id': door_id,
+            'item_number': door.item_number,
+            **_file_entry(pdf_path)
+        }
+    finally:
+        db.close()
+
+
+# Job kind -> render function (used by the in-process executor)
+RENDER_FUNCTIONS = {
+    'project': render_project,
+    'window': render_window,
+    'door': render_door,
+}
+
+# Job kind -> Celery task (only when a broker is configured)
+CELERY_TASKS = {}
+
+if celery_app is not None:
+
+    def _report_progress(task):
+        return lambda done, total: task.update_state(
+            state='PROGRESS', meta={'done': done, 'total': total}
+        )
+
+    @celery_app.task(bind=True, name='tasks.render_project')
+    def render_project_task(self, po_number: str) -> Dict:
+        return render_project(po_number, progress=_report_progress(self))
+
+    @celery_app.task(bind=True, name='tasks.render_window')
+    def render_window_task(self, window_id: int) -> Dict:
+        return render_window(window_id, progress=_report_progress(self))
+
+    @celery_app.task(bind=True, name='tasks.render_door')
+    def render_door_task(self, door_id: int) -> Dict:
+        return render_door(door_id, progress=_report_progress(self))
+
+    CELERY_TASKS.update({
+        'project': render_project_task,
+        'window': render_window_task,
+        'door': render_door_task,
+    })
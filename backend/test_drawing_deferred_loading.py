@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+Drawing Deferred Loading Regression Test
+Seeds one unit with 1,000 saved drawing versions (each carrying inline
+PDF/thumbnail bytes) and checks that listing versions, looking up the
+current drawing, walking project/unit.drawings and cascading a project
+delete never SELECT the binary columns
+
+Usage (from backend directory):
+    python test_drawing_deferred_loading.py
+    python -m pytest test_drawing_deferred_loading.py
+"""
+import os
+import sys
+from contextlib import contextmanager
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+os.environ.setdefault('DATABASE_URL', 'sqlite://')
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.database import Base
+from app.models import Drawing, Project, Unit
+from app.services import drawing_repository
+
+VERSIONS = 1000
+BLOB_BYTES = 16 * 1024
+BLOB_COLUMNS = ('pdf_blob', 'thumbnail_blob')
+
+
+def _make_session():
+    """Fresh in-memory database seeded with one unit and VERSIONS drawings"""
+    engine = create_engine('sqlite://', connect_args={'check_same_thread': False}, poolclass=StaticPool)
+    Base.metadata.create_all(bind=engine)
+    db = sessionmaker(bind=engine)()
+
+    project = Project(project_name='Deferred Loading', po_number='DEFER-001')
+    db.add(project)
+    db.flush()
+    unit = Unit(project_id=project.id, item_number='W-101', series='65')
+    db.add(unit)
+    db.flush()
+    project_id, unit_id = project.id, unit.id
+
+    pdf = b'%PDF-1.4\n' + b'\0' * BLOB_BYTES
+    db.bulk_insert_mappings(Drawing, [
+        {
+            'unit_id': unit_id,
+            'project_id': project_id,
+            'pdf_filename': f'drawing_v{version}.pdf',
+            'pdf_blob': pdf,
+            'thumbnail_blob': pdf[:1024],
+            'version': version,
+            'is_current': 1 if version == VERSIONS else 0,
+        }
+        for version in range(1, VERSIONS + 1)
+    ])
+    db.commit()
+    db.expunge_all()
+    return engine, db, project_id, unit_id
+
+
+@contextmanager
+def _capture_selects(engine):
+    """Collect the SQL of every SELECT run on engine inside the block"""
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith('SELECT'):
+            statements.append(statement)
+
+    event.listen(engine, 'before_cursor_execute', before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, 'before_cursor_execute', before_cursor_execute)
+
+
+def _assert_no_blob_reads(statements, drawings):
+    for statement in statements:
+        for column in BLOB_COLUMNS:
+            assert column not in statement, f"{column} was selected:\n{statement}"
+    for drawing in drawings:
+        for column in BLOB_COLUMNS:
+            assert column not in drawing.__dict__, f"{column} loaded on drawing {drawing.id}"
+
+
+def test_list_versions_reads_no_blobs():
+    engine, db, _, unit_id = _make_session()
+    with _capture_selects(engine) as statements:
+        versions = drawing_repository.list_drawing_versions(db, unit_id)
+
+    assert len(versions) == VERSIONS
+    assert [d.version for d in versions[:3]] == [VERSIONS, VERSIONS - 1, VERSIONS - 2]
+    _assert_no_blob_reads(statements, versions)
+
+
+def test_current_drawing_reads_no_blobs():
+    engine, db, _, unit_id = _make_session()
+    with _capture_selects(engine) as statements:
+        current = drawing_repository.get_current_drawing(db, unit_id)
+        metadata = drawing_repository.get_drawing_metadata(db, current.id)
+
+    assert current.version == VERSIONS
+    assert metadata.pdf_filename == f'drawing_v{VERSIONS}.pdf'
+    _assert_no_blob_reads(statements, [current, metadata])
+
+
+def test_relationships_read_no_blobs():
+    engine, db, project_id, unit_id = _make_session()
+    with _capture_selects(engine) as statements:
+        unit_drawings = db.get(Unit, unit_id).drawings
+        project_drawings = db.get(Project, project_id).drawings
+
+    assert len(unit_drawings) == len(project_drawings) == VERSIONS
+    _assert_no_blob_reads(statements, unit_drawings)
+
+
+def test_project_delete_cascade_reads_no_blobs():
+    engine, db, project_id, _ = _make_session()
+    with _capture_selects(engine) as statements:
+        db.delete(db.get(Project, project_id))
+        db.commit()
+
+    assert db.query(Drawing).count() == 0
+    _assert_no_blob_reads(statements, [])
+
+
+def test_blob_loaded_on_explicit_access():
+    engine, db, _, unit_id = _make_session()
+    current = drawing_repository.get_current_drawing(db, unit_id)
+
+    pdf = drawing_repository.read_legacy_pdf(db, current.id)
+    assert pdf.startswith(b'%PDF') and len(pdf) == BLOB_BYTES + 9
+    # Deferred attribute still loads lazily when it is actually used
+    assert len(current.thumbnail_blob) == 1024
+
+
+def main():
+    tests = [
+        test_list_versions_reads_no_blobs,
+        test_current_drawing_reads_no_blobs,
+        test_relationships_read_no_blobs,
+        test_project_delete_cascade_reads_no_blobs,
+        test_blob_loaded_on_explicit_access,
+    ]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+            print(f"[OK] {test.__name__}")
+        except AssertionError as e:
+            failed += 1
+            print(f"[FAIL] {test.__name__}: {e}")
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
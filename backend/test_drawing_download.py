@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Drawing Download Test
+Downloads a saved drawing through GET /api/drawings/{id}/download, in
+full and as a byte range, and checks that a drawing whose blob is
+missing from the blob store answers 404 with or without a Range header
+(not 416)
+
+Usage (from backend directory):
+    python test_drawing_download.py
+    python -m pytest test_drawing_download.py
+"""
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+os.environ.setdefault('DATABASE_URL', 'sqlite://')
+os.environ['BLOB_STORE_DIR'] = tempfile.mkdtemp(prefix='blobs-')
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.database import Base, get_db
+from app.models import Drawing, Project, Unit
+from app.services.blob_store import get_blob_store
+from routers import drawings
+
+PDF = b'%PDF-1.4\n' + bytes(range(256)) * 16
+
+
+def _client():
+    """Test client on a fresh in-memory database; returns (client, Session)"""
+    engine = create_engine('sqlite://', connect_args={'check_same_thread': False}, poolclass=StaticPool)
+    Base.metadata.create_all(bind=engine)
+    Session = sessionmaker(bind=engine)
+
+    def override_get_db():
+        db = Session()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app = FastAPI()
+    app.include_router(drawings.router)
+    app.dependency_overrides[get_db] = override_get_db
+    return TestClient(app), Session
+
+
+def _save_drawing(Session, pdf: bytes, store_size: bool = True) -> int:
+    """Store pdf in the blob store and add a drawing row pointing at it"""
+    pdf_sha256, _ = get_blob_store().put(pdf)
+    db = Session()
+    try:
+        project = Project(project_name='Download', po_number='DL-001')
+        db.add(project)
+        db.flush()
+        unit = Unit(project_id=project.id, item_number='W-101', series='65')
+        db.add(unit)
+        db.flush()
+        drawing = Drawing(
+            unit_id=unit.id, project_id=project.id, pdf_filename='drawing_v1.pdf',
+            pdf_sha256=pdf_sha256, pdf_size=len(pdf) if store_size else None,
+            pdf_content_type='application/pdf', version=1, is_current=1
+        )
+        db.add(drawing)
+        db.commit()
+        return drawing.id
+    finally:
+        db.close()
+
+
+def _delete_blob(pdf: bytes):
+    store = get_blob_store()
+    os.unlink(store.path(store.put(pdf)[0]))
+
+
+def test_full_and_range_download():
+    client, Session = _client()
+    drawing_id = _save_drawing(Session, PDF)
+
+    response = client.get(f'/api/drawings/{drawing_id}/download')
+    assert response.status_code == 200
+    assert response.content == PDF
+
+    response = client.get(f'/api/drawings/{drawing_id}/download', headers={'Range': 'bytes=9-18'})
+    assert response.status_code == 206
+    assert response.content == PDF[9:19]
+    assert response.headers['content-range'] == f'bytes 9-18/{len(PDF)}'
+
+
+def test_missing_blob_is_404_with_range():
+    client, Session = _client()
+    for store_size in (False, True):
+        pdf = PDF + f'missing, stored size {store_size}'.encode()
+        drawing_id = _save_drawing(Session, pdf, store_size=store_size)
+        _delete_blob(pdf)
+
+        for headers in ({}, {'Range': 'bytes=0-'}, {'Range': 'bytes=0-1023'}):
+            response = client.get(f'/api/drawings/{drawing_id}/download', headers=headers)
+            assert response.status_code == 404, (store_size, headers, response.status_code)
+            assert 'missing from the blob store' in response.json()['detail']
+            assert 'content-range' not in response.headers
+
+
+def main():
+    tests = [
+        test_full_and_range_download,
+        test_missing_blob_is_404_with_range,
+    ]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+            print(f"[OK] {test.__name__}")
+        except AssertionError as e:
+            failed += 1
+            print(f"[FAIL] {test.__name__}: {e}")
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
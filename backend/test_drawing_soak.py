@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+"""
+Drawing Engine Soak Test
+Renders many shop drawings in a row and from a thread pool, checking that
+figures are released (nothing left in pyplot's registry), concurrent renders
+produce the same sheets as sequential ones, and RSS stays flat
+
+Usage (from backend directory):
+    python test_drawing_soak.py [--renders 2000] [--threads 4]
+    SOAK_RENDERS=2000 python -m pytest test_drawing_soak.py
+"""
+import argparse
+import gc
+import os
+import resource
+import sys
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+import matplotlib
+matplotlib.use('Agg')
+from matplotlib import _pylab_helpers
+
+from services.drawing_engine.main import ProfessionalDrawingGenerator
+
+# Renders per soak run (thousands for a real soak, fewer under pytest by default)
+SOAK_RENDERS = int(os.getenv('SOAK_RENDERS', '300'))
+SOAK_THREADS = int(os.getenv('SOAK_THREADS', '4'))
+
+# Renders before the baseline RSS is taken (fonts, template cache, LRUs filled)
+WARMUP_RENDERS = 30
+
+# Allowed RSS growth over the whole soak after warm-up
+MAX_RSS_GROWTH_MB = 40.0
+
+PROJECT = {
+    'po_number': 'SOAK-001',
+    'project_name': 'Soak Test',
+    'customer_name': 'Raven Custom Glass',
+}
+
+ITEMS = [
+    ({'item_number': 'W-101', 'width_inches': 36, 'height_inches': 48, 'window_type': 'FIXED'}, False),
+    ({'item_number': 'W-102', 'width_inches': 72, 'height_inches': 60, 'window_type': 'CASEMENT'}, False),
+    ({'item_number': 'W-103', 'width_inches': 48, 'height_inches': 36, 'window_type': 'SLIDER'}, False),
+    ({'item_number': 'W-104', 'width_inches': 30, 'height_inches': 24, 'window_type': 'AWNING'}, False),
+    ({'item_number': 'D-201', 'width_inches': 72, 'height_inches': 80, 'window_type': 'PATIO DOOR'}, True),
+    ({'item_number': 'D-202', 'width_inches': 36, 'height_inches': 80, 'window_type': 'SWING DOOR'}, True),
+]
+
+
+def current_rss_mb() -> float:
+    """Resident set size of this process in MB (peak RSS where /proc is unavailable)"""
+    try:
+        with open('/proc/self/statm') as f:
+            pages = int(f.read().split()[1])
+        return pages * os.sysconf('SC_PAGE_SIZE') / (1024 * 1024)
+    except (OSError, ValueError, IndexError):
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def render(generator: ProfessionalDrawingGenerator, index: int) -> str:
+    """Render the index-th item of the rotation to its own file"""
+    item, is_door = ITEMS[index % len(ITEMS)]
+    filename = f"{index:05d}_{item['item_number']}.pdf"
+    if is_door:
+        return generator.generate_door_drawing(item, PROJECT, filename)
+    return generator.generate_window_drawing(item, PROJECT, filename)
+
+
+def open_pyplot_figures() -> int:
+    return _pylab_helpers.Gcf.get_num_fig_managers()
+
+
+def soak(renders: int, output_dir: str, use_template_cache: bool = True):
+    """
+    Render sequentially, deleting outputs as it goes
+
+    Returns:
+        (baseline_mb, final_mb) RSS after warm-up and after the soak
+    """
+    generator = ProfessionalDrawingGenerator(output_dir, use_template_cache=use_template_cache)
+
+    baseline = None
+    for index in range(WARMUP_RENDERS + renders):
+        os.remove(render(generator, index))
+        if index + 1 == WARMUP_RENDERS:
+            gc.collect()
+            baseline = current_rss_mb()
+
+    gc.collect()
+    return baseline, current_rss_mb()
+
+
+def test_sequential_soak_releases_figures():
+    with tempfile.TemporaryDirectory() as output_dir:
+        baseline, final = soak(SOAK_RENDERS, output_dir)
+
+    assert open_pyplot_figures() == 0
+    assert final - baseline < MAX_RSS_GROWTH_MB, (
+        f"RSS grew {final - baseline:.1f} MB over {SOAK_RENDERS} renders "
+        f"({baseline:.1f} -> {final:.1f} MB)"
+    )
+
+
+def test_uncached_layouts_are_closed():
+    renders = max(SOAK_RENDERS // 4, 20)
+    with tempfile.TemporaryDirectory() as output_dir:
+        baseline, final = soak(renders, output_dir, use_template_cache=False)
+
+    assert open_pyplot_figures() == 0
+    assert final - baseline < MAX_RSS_GROWTH_MB, (
+        f"RSS grew {final - baseline:.1f} MB over {renders} uncached renders"
+    )
+
+
+def test_concurrent_renders_match_sequential():
+    renders = max(SOAK_RENDERS // 2, len(ITEMS) * SOAK_THREADS)
+    with tempfile.TemporaryDirectory() as output_dir:
+        sequential_dir = os.path.join(output_dir, 'sequential')
+        concurrent_dir = os.path.join(output_dir, 'concurrent')
+
+        # Reference sheet per item
+        reference = ProfessionalDrawingGenerator(sequential_dir)
+        expected = [os.path.getsize(render(reference, index)) for index in range(len(ITEMS))]
+
+        # One generator shared by every thread
+        generator = ProfessionalDrawingGenerator(concurrent_dir)
+        for index in range(WARMUP_RENDERS):
+            os.remove(render(generator, index))
+        gc.collect()
+        baseline = current_rss_mb()
+
+        def render_and_check(index: int) -> None:
+            path = render(generator, index)
+            with open(path, 'rb') as f:
+                assert f.read(5) == b'%PDF-'
+            # Same sheet as the sequential render: state didn't leak between threads
+            assert os.path.getsize(path) == expected[index % len(ITEMS)], path
+            os.remove(path)
+
+        with ThreadPoolExecutor(max_workers=SOAK_THREADS) as executor:
+            for future in [executor.submit(render_and_check, index) for index in range(renders)]:
+                future.result()
+
+        gc.collect()
+        final = current_rss_mb()
+
+    assert open_pyplot_figures() == 0
+    assert final - baseline < MAX_RSS_GROWTH_MB, (
+        f"RSS grew {final - baseline:.1f} MB over {renders} concurrent renders"
+    )
+
+
+def main():
+    global SOAK_RENDERS, SOAK_THREADS
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--renders', type=int, default=2000)
+    parser.add_argument('--threads', type=int, default=SOAK_THREADS)
+    args = parser.parse_args()
+    SOAK_RENDERS, SOAK_THREADS = args.renders, args.threads
+
+    print("=" * 70)
+    print("DRAWING ENGINE SOAK TEST")
+    print("=" * 70)
+
+    failed = 0
+    for test in (
+        test_sequential_soak_releases_figures,
+        test_uncached_layouts_are_closed,
+        test_concurrent_renders_match_sequential,
+    ):
+        try:
+            test()
+            print(f"✓ {test.__name__} (RSS {current_rss_mb():.1f} MB)")
+        except AssertionError as e:
+            failed += 1
+            print(f"✗ {test.__name__}: {e}")
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+Reference Layout Geometry Test
+Draws each region of the server-side (vector) A4 layout on its own and
+checks every artist stays inside that region: the frame sections, the
+elevation and plan views stay inside their columns and none of them
+reaches the specifications table. Also checks the vector PDF renders
+without missing glyphs and embeds the plan-view icon
+
+Usage (from backend directory):
+    python test_reference_layout_geometry.py
+    python -m pytest test_reference_layout_geometry.py
+"""
+import sys
+import warnings
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+import matplotlib
+matplotlib.use('Agg')
+
+from matplotlib.transforms import Bbox
+
+from services.drawing_engine.layout import new_figure
+from services.reference_shop_drawing_generator import ReferenceShopDrawingGenerator
+
+PARAMS = {
+    'series': '65',
+    'product_type': 'SLIDER',
+    'width': 72,
+    'height': 60,
+    'configuration': 'XO',
+    'glass_type': '5mm Clear',
+    'frame_color': 'Black',
+    'item_number': 'W-101',
+    'date_created': '2026-10-17',
+}
+
+# Line widths and text bbox padding may spill slightly past a box edge (mm)
+TOLERANCE_MM = 0.6
+
+
+def _draw_region(generator, name, region):
+    """Draw one region on a blank page; return its artists' bboxes in mm"""
+    fig = new_figure((generator.page_width_in, generator.page_height_in))
+    try:
+        ax = fig.add_axes([0, 0, 1, 1])
+        ax.set_xlim(0, generator.page_width_mm)
+        ax.set_ylim(0, generator.page_height_mm)
+        ax.axis('off')
+
+        x, y_bottom, width, height = region
+        if name == 'header':
+            generator._draw_header(ax, y_bottom, width)
+        elif name == 'column1':
+            generator._draw_column1_frames(ax, *region)
+        elif name == 'column2':
+            generator._draw_column2_elevation_plan(ax, *region)
+        elif name == 'column3':
+            generator._draw_column3_info(ax, *region)
+        else:
+            generator._draw_specifications_table(ax, *region)
+
+        renderer = fig.canvas.get_renderer()
+        fig.draw(renderer)
+        to_data = ax.transData.inverted()
+        artists = list(ax.patches) + list(ax.lines) + list(ax.images) + list(ax.texts)
+        artists += [text.get_bbox_patch() for text in ax.texts if text.get_bbox_patch() is not None]
+        return [
+            (artist, artist.get_window_extent(renderer).transformed(to_data))
+            for artist in artists
+        ]
+    finally:
+        fig.clear()
+
+
+def _inside(bbox, region):
+    x, y_bottom, width, height = region
+    return (bbox.x0 >= x - TOLERANCE_MM and bbox.x1 <= x + width + TOLERANCE_MM
+            and bbox.y0 >= y_bottom - TOLERANCE_MM and bbox.y1 <= y_bottom + height + TOLERANCE_MM)
+
+
+def _overlaps(bbox, region):
+    x, y_bottom, width, height = region
+    return (bbox.x0 < x + width and bbox.x1 > x
+            and bbox.y0 < y_bottom + height and bbox.y1 > y_bottom)
+
+
+def _describe(artist):
+    text = getattr(artist, 'get_text', None)
+    return f"{type(artist).__name__}({text()!r})" if text else type(artist).__name__
+
+
+def test_regions_do_not_overlap():
+    regions = ReferenceShopDrawingGenerator(parameters=PARAMS)._layout_regions()
+    names = list(regions)
+    for i, first in enumerate(names):
+        for second in names[i + 1:]:
+            bbox = Bbox.from_bounds(*regions[second])
+            assert not _overlaps(bbox, regions[first]), f"{first} overlaps {second}"
+
+
+def test_every_artist_stays_inside_its_region():
+    generator = ReferenceShopDrawingGenerator(parameters=PARAMS)
+    regions = generator._layout_regions()
+    specs = regions['specifications']
+    for name, region in regions.items():
+        for artist, bbox in _draw_region(generator, name, region):
+            assert _inside(bbox, region), f"{name}: {_describe(artist)} at {bbox.bounds} leaves {region}"
+            if name != 'specifications':
+                assert not _overlaps(bbox, specs), f"{name}: {_describe(artist)} overlaps the specifications table"
+
+
+def test_frame_sections_fill_column_top_down():
+    generator = ReferenceShopDrawingGenerator(parameters=PARAMS)
+    column = generator._layout_regions()['column1']
+    labels = {
+        artist.get_text(): bbox.y0
+        for artist, bbox in _draw_region(generator, 'column1', column)
+        if hasattr(artist, 'get_text')
+    }
+    # HEAD at the top, JAMB at the bottom, each label within its third of the column
+    _, y_bottom, _, height = column
+    assert labels['HEAD'] > labels['SILL'] > labels['JAMB']
+    assert labels['HEAD'] > y_bottom + height * 2 / 3
+    assert labels['JAMB'] < y_bottom + height / 3
+
+
+def test_vector_pdf_has_glyphs_and_plan_icon():
+    generator = ReferenceShopDrawingGenerator(parameters=PARAMS)
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter('always')
+        pdf = generator.generate_vector_pdf().getvalue()
+    missing = [str(w.message) for w in caught if 'missing from' in str(w.message)]
+    assert not missing, missing
+    assert pdf.startswith(b'%PDF')
+    assert b'/Image' in pdf, "Plan-view icon was not embedded"
+
+
+def main():
+    tests = [
+        test_regions_do_not_overlap,
+        test_every_artist_stays_inside_its_region,
+        test_frame_sections_fill_column_top_down,
+        test_vector_pdf_has_glyphs_and_plan_icon,
+    ]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+            print(f"[OK] {test.__name__}")
+        except AssertionError as e:
+            failed += 1
+            print(f"[FAIL] {test.__name__}: {e}")
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
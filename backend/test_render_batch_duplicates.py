@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Render Batch Duplicate Items Test
+A project listing the same window twice (same item number, same specs)
+shares one render-cache key and one output file name; the batch must
+render it once and report both items, not fail on copying the file
+onto itself
+
+Usage (from backend directory):
+    python test_render_batch_duplicates.py
+    python -m pytest test_render_batch_duplicates.py
+"""
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+os.environ.setdefault('DATABASE_URL', 'sqlite://')
+
+import matplotlib
+matplotlib.use('Agg')
+
+from app.models import Project, Window
+from app.services.integrated_drawing_service import IntegratedDrawingService
+from app.services.render_cache import RenderCache
+
+
+def _window(**overrides):
+    spec = dict(
+        item_number='W-101', room='Kitchen', width_inches=36, height_inches=48,
+        window_type='FIXED', frame_series='65', swing_direction='', quantity=1,
+        frame_color='Black', glass_type='Clear', grids='', screen=''
+    )
+    spec.update(overrides)
+    return Window(**spec)
+
+
+def _service(tmp_dir: str) -> IntegratedDrawingService:
+    service = IntegratedDrawingService(
+        output_dir=os.path.join(tmp_dir, 'drawings'), render_workers=0, use_render_cache=False
+    )
+    service.render_cache = RenderCache(os.path.join(tmp_dir, 'cache'), max_bytes=50 * 1024 * 1024)
+    return service
+
+
+def test_duplicated_item_renders_once():
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        service = _service(tmp_dir)
+        project = Project(po_number='DUP-001', project_name='Duplicates', customer_name='Raven')
+        windows = [_window(), _window(), _window(item_number='W-102')]
+
+        events = list(service.iter_project_drawings(project, windows=windows, doors=[]))
+        items = [event for event in events if event['event'] == 'item']
+        summary = events[-1]
+
+        assert summary['event'] == 'summary'
+        assert summary['failed'] == 0, summary['errors']
+        assert summary['windows'] == 3
+        assert sorted(event['index'] for event in items) == [0, 1, 2]
+        files = {event['index']: event['file'] for event in items}
+        assert files[0] == files[1] == 'DUP-001_Window-W-101_ELEV.pdf'
+        for event in items:
+            assert event['error'] is None
+            assert os.path.getsize(event['path']) > 0
+        # Only the two distinct items were rendered
+        assert service.render_cache.stats()['stores'] == 2
+
+
+def main():
+    tests = [test_duplicated_item_renders_once]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+            print(f"[OK] {test.__name__}")
+        except AssertionError as e:
+            failed += 1
+            print(f"[FAIL] {test.__name__}: {e}")
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())